@@ -0,0 +1,338 @@
+"""
+Latency benchmark for the repository, distance and formatter hot paths.
+
+For every catalog size, a fresh worker process loads a synthetic catalog
+(see `synthetic.py`) and times:
+
+- `PlaceRepository.get_all` and the cold catalog load;
+- `LocationService.filter_places_by_distance` (spatial index + coordinate columns);
+- `PlaceFormatter.format_with_distances` (uncached, one page and the full raw list);
+- end-to-end MCP tool calls through `create_app()` and an in-memory FastMCP client.
+
+Each benchmark runs until it has `--min-runs` samples and `--budget` seconds have
+elapsed (or `--max-runs` samples), after one warm-up call. Results report p50 / p99
+latency (nearest rank) and the worker's peak RSS, and are saved as JSON. With
+`--compare`, p50 latencies are checked against a previous results file.
+
+Usage:
+    python benchmarks/hot_paths.py [--sizes 100,10000,100000,1000000] [--output results.json]
+    python benchmarks/hot_paths.py --sizes 10000 --compare benchmarks/results/baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+BENCHMARKS_DIR = Path(__file__).parent
+PROJECT_ROOT = BENCHMARKS_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from synthetic import write_catalog  # noqa: E402
+
+DEFAULT_SIZES = (100, 10_000, 100_000, 1_000_000)
+DEFAULT_RESULTS_DIR = BENCHMARKS_DIR / "results"
+DEFAULT_DATA_DIR = Path(tempfile.gettempdir()) / "paraguay-tourism-benchmarks"
+
+# Search center (Asunción) and radii used by the distance benchmarks
+CENTER = (-25.2822, -57.6352)
+RADII_KM = (25.0, 200.0)
+PAGE_SIZE = 50
+
+
+def percentile(samples: List[float], q: float) -> float:
+    """Nearest-rank percentile (q in [0, 100]) of a non-empty list of samples."""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(q / 100.0 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(samples: List[float]) -> Dict:
+    """Latency statistics (milliseconds) of a list of samples in seconds."""
+    return {
+        "runs": len(samples),
+        "p50_ms": round(percentile(samples, 50) * 1000, 4),
+        "p99_ms": round(percentile(samples, 99) * 1000, 4),
+        "mean_ms": round(sum(samples) / len(samples) * 1000, 4),
+        "min_ms": round(min(samples) * 1000, 4),
+    }
+
+
+def peak_rss_mib() -> float:
+    """Peak resident set size of this process so far, in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+class Runner:
+    """Times callables with a warm-up call, a minimum run count and a time budget."""
+
+    def __init__(self, budget_s: float, min_runs: int, max_runs: int):
+        self.budget_s = budget_s
+        self.min_runs = min_runs
+        self.max_runs = max_runs
+
+    def run(self, fn: Callable[[], object]) -> Dict:
+        """Time a synchronous callable."""
+        fn()
+        samples: List[float] = []
+        deadline = time.perf_counter() + self.budget_s
+        while len(samples) < self.max_runs and (
+            len(samples) < self.min_runs or time.perf_counter() < deadline
+        ):
+            start = time.perf_counter()
+            fn()
+            samples.append(time.perf_counter() - start)
+        return summarize(samples)
+
+    async def run_async(self, fn) -> Dict:
+        """Time a coroutine function."""
+        await fn()
+        samples: List[float] = []
+        deadline = time.perf_counter() + self.budget_s
+        while len(samples) < self.max_runs and (
+            len(samples) < self.min_runs or time.perf_counter() < deadline
+        ):
+            start = time.perf_counter()
+            await fn()
+            samples.append(time.perf_counter() - start)
+        return summarize(samples)
+
+
+def bench_components(data_path: Path, runner: Runner) -> Dict:
+    """Benchmark the repository, distance and formatter functions directly."""
+    from paraguay_tourism.repositories import PlaceRepository
+    from paraguay_tourism.services import LocationService, PlaceFormatter
+
+    results: Dict[str, Dict] = {}
+
+    # Cold load: parse and validate the data file, build the columnar store
+    repository = PlaceRepository(data_path)
+    start = time.perf_counter()
+    catalog = repository.get_catalog()
+    results["repository.load"] = summarize([time.perf_counter() - start])
+    results["repository.get_all"] = runner.run(repository.get_all)
+
+    # Indexes are built lazily on first use; report their cost separately
+    start = time.perf_counter()
+    spatial_index, coordinates = catalog.spatial_index, catalog.coordinates
+    results["catalog.build_spatial_indexes"] = summarize([time.perf_counter() - start])
+
+    places = catalog.places
+    formatter = PlaceFormatter()
+    for radius in RADII_KM:
+        results[f"location.filter_places_by_distance[{radius:g}km]"] = runner.run(
+            lambda: LocationService.filter_places_by_distance(
+                places, *CENTER, radius, spatial_index=spatial_index, coordinates=coordinates
+            )
+        )
+        matches = LocationService.filter_places_by_distance(
+            places, *CENTER, radius, spatial_index=spatial_index, coordinates=coordinates
+        )
+        # version=None disables the formatter caches: every run formats from scratch
+        results[f"formatter.format_with_distances[{radius:g}km,page]"] = runner.run(
+            lambda: formatter.format_with_distances(matches, limit=PAGE_SIZE)
+        )
+        results[f"formatter.format_with_distances[{radius:g}km,raw]"] = runner.run(
+            lambda: formatter.format_with_distances(matches, include_table=False)
+        )
+        results[f"location.filter_places_by_distance[{radius:g}km]"]["matches"] = len(matches)
+    return results
+
+
+async def bench_end_to_end(runner: Runner) -> Dict:
+    """Benchmark MCP tool calls through `create_app()` and an in-memory client."""
+    from fastmcp import Client
+
+    from paraguay_tourism.server import create_app
+
+    calls = {
+        "list_all_tourist_places": {"limit": PAGE_SIZE},
+        "get_tourist_place_by_id": {"place_id": "place-0"},
+        "list_tourist_places_by_category": {"category": "naturaleza", "limit": PAGE_SIZE},
+        "search_tourist_places": {"query": "lugar turístico 42", "limit": 10},
+        "find_tourist_places_by_distance": {
+            "latitude": CENTER[0], "longitude": CENTER[1], "max_distance_km": RADII_KM[0], "limit": PAGE_SIZE,
+        },
+        "find_k_nearest_tourist_places": {"latitude": CENTER[0], "longitude": CENTER[1], "k": 10},
+        "find_tourist_places_in_bbox": {
+            "min_lat": -25.5, "max_lat": -25.0, "min_lng": -58.0, "max_lng": -57.5, "limit": PAGE_SIZE,
+        },
+        "plan_tourist_route": {
+            "place_ids": [f"place-{i}" for i in range(0, 100, 4)],
+            "start_lat": CENTER[0], "start_lng": CENTER[1], "return_to_start": True,
+        },
+    }
+
+    results: Dict[str, Dict] = {}
+    async with Client(create_app()) as client:
+        # First call loads the catalog and builds the indexes it needs
+        start = time.perf_counter()
+        await client.call_tool("list_all_tourist_places", {"limit": 1})
+        results["tool.first_call"] = summarize([time.perf_counter() - start])
+
+        for name, arguments in calls.items():
+            results[f"tool.{name}"] = await runner.run_async(
+                lambda: client.call_tool(name, arguments)
+            )
+    return results
+
+
+def run_worker(size: int, args: argparse.Namespace) -> Dict:
+    """Benchmark one catalog size in the current process."""
+    data_path = write_catalog(args.data_dir, size)
+    # Serve the synthetic catalog from the app (read when the container is created)
+    os.environ["PARAGUAY_TOURISM_DATASETS"] = f"py={data_path}"
+    runner = Runner(args.budget, args.min_runs, args.max_runs)
+
+    rss_before = peak_rss_mib()
+    benchmarks = bench_components(data_path, runner)
+    rss_components = peak_rss_mib()
+    benchmarks.update(asyncio.run(bench_end_to_end(runner)))
+    return {
+        "places": size,
+        "data_file_mib": round(data_path.stat().st_size / (1024 * 1024), 1),
+        "peak_rss_mib": {
+            "startup": rss_before,
+            "after_components": rss_components,
+            "total": peak_rss_mib(),
+        },
+        "benchmarks": benchmarks,
+    }
+
+
+def git_commit() -> Optional[str]:
+    """Current git commit of the project, if available."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def numpy_version() -> Optional[str]:
+    """Installed NumPy version (vectorized distance paths), or None."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy.__version__
+
+
+def compare(results: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """Benchmarks whose p50 latency grew by more than `threshold` over a baseline."""
+    regressions = []
+    for size, current in results["sizes"].items():
+        previous = baseline.get("sizes", {}).get(size)
+        if previous is None:
+            continue
+        for name, stats in current["benchmarks"].items():
+            before = previous["benchmarks"].get(name)
+            if before is None or stats["runs"] < 2 or before["p50_ms"] <= 0:
+                continue
+            ratio = stats["p50_ms"] / before["p50_ms"]
+            print(f"{size:>9} {name:<58} {before['p50_ms']:>10.3f} -> {stats['p50_ms']:>10.3f} ms  x{ratio:.2f}")
+            if ratio > threshold:
+                regressions.append(f"{size} places: {name} p50 x{ratio:.2f}")
+    return regressions
+
+
+def print_report(size: int, result: Dict) -> None:
+    """Print one size's results as a table."""
+    rss = result["peak_rss_mib"]
+    print(f"\n{size:,} places (data file {result['data_file_mib']} MiB, peak RSS {rss['total']} MiB)")
+    print(f"{'benchmark':<58}{'runs':>6}{'p50 ms':>12}{'p99 ms':>12}")
+    for name, stats in result["benchmarks"].items():
+        print(f"{name:<58}{stats['runs']:>6}{stats['p50_ms']:>12.3f}{stats['p99_ms']:>12.3f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+        help="comma-separated catalog sizes (default: %(default)s)",
+    )
+    parser.add_argument("--budget", type=float, default=2.0, help="seconds per benchmark (default: 2)")
+    parser.add_argument("--min-runs", type=int, default=5, help="minimum samples per benchmark (default: 5)")
+    parser.add_argument("--max-runs", type=int, default=1000, help="maximum samples per benchmark (default: 1000)")
+    parser.add_argument("--data-dir", type=Path, default=DEFAULT_DATA_DIR, help="where synthetic catalogs are cached")
+    parser.add_argument("--output", type=Path, help="results file (default: benchmarks/results/<timestamp>.json)")
+    parser.add_argument("--compare", type=Path, help="previous results file to compare p50 latencies against")
+    parser.add_argument(
+        "--threshold", type=float, default=1.25,
+        help="p50 ratio over the baseline reported as a regression (default: 1.25)",
+    )
+    parser.add_argument("--worker", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--worker-output", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker is not None:
+        result = run_worker(args.worker, args)
+        args.worker_output.write_text(json.dumps(result), encoding="utf-8")
+        return
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    created_at = datetime.now(timezone.utc)
+    results = {
+        "created_at": created_at.isoformat(timespec="seconds"),
+        "git_commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": numpy_version(),
+        "settings": {"budget_s": args.budget, "min_runs": args.min_runs, "max_runs": args.max_runs},
+        "sizes": {},
+    }
+
+    for size in sizes:
+        # One process per size, so peak RSS is not inflated by larger catalogs
+        with tempfile.TemporaryDirectory() as tmp:
+            worker_output = Path(tmp) / "result.json"
+            subprocess.run(
+                [
+                    sys.executable, __file__,
+                    "--worker", str(size),
+                    "--worker-output", str(worker_output),
+                    "--data-dir", str(args.data_dir),
+                    "--budget", str(args.budget),
+                    "--min-runs", str(args.min_runs),
+                    "--max-runs", str(args.max_runs),
+                ],
+                check=True,
+            )
+            result = json.loads(worker_output.read_text(encoding="utf-8"))
+        results["sizes"][str(size)] = result
+        print_report(size, result)
+
+    output = args.output
+    if output is None:
+        output = DEFAULT_RESULTS_DIR / f"{created_at.strftime('%Y%m%dT%H%M%SZ')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    print(f"\nResults saved to {output}")
+
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        print(f"\nComparison with {args.compare} (p50)")
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print("\nRegressions:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
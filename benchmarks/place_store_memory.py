@@ -0,0 +1,65 @@
+"""
+Memory benchmark: one Pydantic `Place` per place vs the columnar `PlaceStore`.
+
+Generates synthetic places inside Paraguay and measures, with tracemalloc,
+the memory retained by each representation and the time to build it.
+
+Usage:
+    python benchmarks/place_store_memory.py [--count 100000]
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from paraguay_tourism.models import Place  # noqa: E402
+from paraguay_tourism.repositories import PlaceCatalog, PlaceStore  # noqa: E402
+from synthetic import generate_records  # noqa: E402
+
+
+def measure(build) -> tuple:
+    """Run `build()` and return (result, retained bytes, peak bytes, seconds)."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current, peak, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000, help="number of places")
+    args = parser.parse_args()
+
+    records = generate_records(args.count)
+
+    models, models_bytes, models_peak, models_time = measure(
+        lambda: [Place(**record) for record in records]
+    )
+    del models
+
+    # Records are validated with Place one at a time and copied into columns;
+    # the models are discarded immediately, as in PlaceRepository
+    catalog, store_bytes, store_peak, store_time = measure(
+        lambda: PlaceCatalog(PlaceStore(Place(**record) for record in records), version=1, signature=(0, 0))
+    )
+
+    mib = 1024 * 1024
+    print(f"places: {args.count:,}")
+    print(f"{'representation':<32}{'retained MiB':>14}{'peak MiB':>12}{'build s':>10}")
+    print(f"{'list[Place] (before)':<32}{models_bytes / mib:>14.1f}{models_peak / mib:>12.1f}{models_time:>10.2f}")
+    print(f"{'PlaceCatalog + PlaceStore':<32}{store_bytes / mib:>14.1f}{store_peak / mib:>12.1f}{store_time:>10.2f}")
+    print(f"retained memory ratio: {store_bytes / models_bytes:.2f}")
+    assert len(catalog) == args.count
+
+
+if __name__ == "__main__":
+    main()
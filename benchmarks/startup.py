@@ -0,0 +1,228 @@
+"""
+Cold-start benchmark: time from launching the server to its first tool list.
+
+MCP clients start the server as a subprocess per session and talk to it over
+stdio, so start-up time is paid on every session. Each run launches
+`src/paraguay_tourism/server.py` with the current interpreter, sends the MCP
+`initialize` handshake and a `tools/list` request as newline-delimited JSON-RPC,
+and records the time from launch to each response. One warm-up run (which also
+compiles bytecode) is discarded. Results report p50 / p99 and are saved as JSON;
+with `--compare`, p50 times are checked against a previous results file.
+
+With `--importtime N`, the server is also imported once under
+`python -X importtime` and the N slowest modules imported by the package
+itself are printed.
+
+Usage:
+    python benchmarks/startup.py [--runs 10] [--output results.json]
+    python benchmarks/startup.py --compare benchmarks/results/startup-baseline.json
+    python benchmarks/startup.py --runs 3 --importtime 15
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from hot_paths import DEFAULT_RESULTS_DIR, PROJECT_ROOT, git_commit, summarize
+
+SERVER_SCRIPT = PROJECT_ROOT / "src" / "paraguay_tourism" / "server.py"
+
+INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2025-06-18",
+        "capabilities": {},
+        "clientInfo": {"name": "startup-benchmark", "version": "1.0"},
+    },
+}
+INITIALIZED = {"jsonrpc": "2.0", "method": "notifications/initialized"}
+TOOLS_LIST = {"jsonrpc": "2.0", "id": 2, "method": "tools/list"}
+
+
+def _send(process: subprocess.Popen, message: Dict) -> None:
+    process.stdin.write(json.dumps(message) + "\n")
+    process.stdin.flush()
+
+
+def _receive(process: subprocess.Popen, request_id: int) -> Dict:
+    """Read messages until the response to `request_id` (skipping notifications)."""
+    while True:
+        line = process.stdout.readline()
+        if not line:
+            raise RuntimeError(f"server exited (code {process.poll()}) before answering request {request_id}")
+        message = json.loads(line)
+        if message.get("id") == request_id:
+            if "error" in message:
+                raise RuntimeError(f"request {request_id} failed: {message['error']}")
+            return message
+
+
+def launch_once(timeout_s: float) -> Tuple[float, float, int]:
+    """
+    Launch the server, list its tools and stop it.
+
+    Returns:
+        Seconds from launch to the `initialize` response, seconds from launch
+        to the `tools/list` response, and the number of tools listed.
+    """
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, str(SERVER_SCRIPT)],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        encoding="utf-8",
+        cwd=PROJECT_ROOT,
+    )
+    watchdog = threading.Timer(timeout_s, process.kill)
+    watchdog.start()
+    try:
+        _send(process, INITIALIZE)
+        _receive(process, INITIALIZE["id"])
+        initialized = time.perf_counter() - start
+        _send(process, INITIALIZED)
+        _send(process, TOOLS_LIST)
+        tools = _receive(process, TOOLS_LIST["id"])["result"]["tools"]
+        listed = time.perf_counter() - start
+    finally:
+        watchdog.cancel()
+        process.stdin.close()
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+    return initialized, listed, len(tools)
+
+
+def slowest_imports(count: int) -> List[Tuple[str, float]]:
+    """
+    Slowest modules imported directly by the package, from `python -X importtime`.
+
+    Only imports whose importer is a `paraguay_tourism` module are reported
+    (modules FastMCP already loaded cost nothing and do not appear).
+
+    Returns:
+        Up to `count` (module, cumulative ms) pairs, slowest first.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import paraguay_tourism.server"],
+        cwd=PROJECT_ROOT,
+        env={**os.environ, "PYTHONPATH": str(PROJECT_ROOT / "src")},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    entries = []
+    for line in completed.stderr.splitlines():
+        # "import time: <self us> | <cumulative us> | <indented module name>"
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        entries.append((depth, name.strip(), int(cumulative) / 1000))
+
+    # importtime lists a module after its imports; reversed, importers come first
+    imports: Dict[str, float] = {}
+    importers: List[str] = []
+    for depth, name, cumulative_ms in reversed(entries):
+        del importers[depth:]
+        if depth and importers[-1].startswith("paraguay_tourism") and not name.startswith("paraguay_tourism"):
+            imports[name] = imports.get(name, 0.0) + cumulative_ms
+        importers.append(name)
+    return sorted(imports.items(), key=lambda item: item[1], reverse=True)[:count]
+
+
+def compare(results: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """Measurements whose p50 grew by more than `threshold` over a baseline."""
+    regressions = []
+    for name, stats in results["benchmarks"].items():
+        before = baseline.get("benchmarks", {}).get(name)
+        if before is None or before["p50_ms"] <= 0:
+            continue
+        ratio = stats["p50_ms"] / before["p50_ms"]
+        print(f"{name:<24} {before['p50_ms']:>10.1f} -> {stats['p50_ms']:>10.1f} ms  x{ratio:.2f}")
+        if ratio > threshold:
+            regressions.append(f"{name} p50 x{ratio:.2f}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="measured launches (default: 10)")
+    parser.add_argument("--timeout", type=float, default=60.0, help="seconds before a launch is killed (default: 60)")
+    parser.add_argument("--importtime", type=int, default=0, metavar="N", help="also print the N slowest imports")
+    parser.add_argument("--output", type=Path, help="results file (default: benchmarks/results/startup-<timestamp>.json)")
+    parser.add_argument("--compare", type=Path, help="previous results file to compare p50 times against")
+    parser.add_argument(
+        "--threshold", type=float, default=1.25,
+        help="p50 ratio over the baseline reported as a regression (default: 1.25)",
+    )
+    args = parser.parse_args()
+
+    # Warm-up: writes bytecode caches and warms the OS file cache
+    launch_once(args.timeout)
+    initialize_samples: List[float] = []
+    tools_list_samples: List[float] = []
+    tool_count = 0
+    for _ in range(args.runs):
+        initialized, listed, tool_count = launch_once(args.timeout)
+        initialize_samples.append(initialized)
+        tools_list_samples.append(listed)
+
+    created_at = datetime.now(timezone.utc)
+    results = {
+        "created_at": created_at.isoformat(timespec="seconds"),
+        "git_commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "tools": tool_count,
+        "benchmarks": {
+            "launch_to_initialize": summarize(initialize_samples),
+            "launch_to_tools_list": summarize(tools_list_samples),
+        },
+    }
+
+    print(f"{'measurement':<24}{'runs':>6}{'p50 ms':>12}{'p99 ms':>12}{'min ms':>12}")
+    for name, stats in results["benchmarks"].items():
+        print(f"{name:<24}{stats['runs']:>6}{stats['p50_ms']:>12.1f}{stats['p99_ms']:>12.1f}{stats['min_ms']:>12.1f}")
+    print(f"({tool_count} tools listed)")
+
+    if args.importtime:
+        imports = slowest_imports(args.importtime)
+        results["slowest_imports_ms"] = dict(imports)
+        print(f"\n{'imported by the package':<40}{'cumulative ms':>14}")
+        for name, ms in imports:
+            print(f"{name:<40}{ms:>14.1f}")
+
+    output = args.output
+    if output is None:
+        output = DEFAULT_RESULTS_DIR / f"startup-{created_at.strftime('%Y%m%dT%H%M%SZ')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    print(f"\nResults saved to {output}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        print(f"\nComparison with {args.compare}:")
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print("\nRegressions:\n  " + "\n  ".join(regressions))
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Synthetic place catalogs shared by the benchmark scripts.
+
+Places are spread uniformly over Paraguay's bounding box, with a fixed set of
+categories, regions and cities, so every run with the same seed produces the
+same catalog.
+"""
+
+import json
+import os
+import random
+from pathlib import Path
+from typing import Dict, Iterator
+
+CATEGORIES = ["Naturaleza", "Historia", "Arquitectura", "Religión", "Cultura", "Playa"]
+REGIONS = ["Capital", "Central", "Cordillera", "Itapúa", "Alto Paraná", "Guairá", "Misiones"]
+
+# Paraguay's bounding box (decimal degrees)
+MIN_LAT, MAX_LAT = -27.6, -19.3
+MIN_LNG, MAX_LNG = -62.6, -54.3
+
+
+def iter_records(count: int, seed: int = 42) -> Iterator[Dict]:
+    """Yield synthetic place records (dicts) spread over Paraguay's bounding box."""
+    rng = random.Random(seed)
+    cities = [f"Ciudad {i}" for i in range(250)]
+    for i in range(count):
+        yield {
+            "id": f"place-{i}",
+            "name": f"Lugar turístico {i}",
+            "description": f"Descripción del lugar turístico número {i}. " * 3,
+            "category": rng.choice(CATEGORIES),
+            "lat": rng.uniform(MIN_LAT, MAX_LAT),
+            "lng": rng.uniform(MIN_LNG, MAX_LNG),
+            "city": rng.choice(cities),
+            "region": rng.choice(REGIONS),
+        }
+
+
+def generate_records(count: int, seed: int = 42) -> list:
+    """Synthetic place records (dicts) spread over Paraguay's bounding box."""
+    return list(iter_records(count, seed))
+
+
+def write_catalog(directory: str | Path, count: int, seed: int = 42) -> Path:
+    """
+    Write a synthetic catalog as JSON Lines, reusing an existing file.
+
+    Records are streamed to disk, so even 1M places never sit in memory at once.
+
+    Args:
+        directory: Directory to write into (created if missing).
+        count: Number of places.
+        seed: Random seed.
+
+    Returns:
+        Path of the data file (e.g. places-100000-42.jsonl).
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"places-{count}-{seed}.jsonl"
+    if path.exists():
+        return path
+
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        for record in iter_records(count, seed):
+            f.write(json.dumps(record, ensure_ascii=False))
+            f.write("\n")
+    os.replace(tmp_path, path)
+    return path
@@ -0,0 +1,105 @@
+"""Command line tools for Paraguay Tourism MCP Server data."""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+# Handle both relative imports (when used as module) and absolute imports (when run directly)
+try:
+    from .core.settings import Settings
+    from .repositories import CatalogRegistry, PlaceRepository
+except ImportError:
+    # Add src directory to path when running directly
+    src_path = Path(__file__).parent.parent
+    if str(src_path) not in sys.path:
+        sys.path.insert(0, str(src_path))
+    from paraguay_tourism.core.settings import Settings
+    from paraguay_tourism.repositories import CatalogRegistry, PlaceRepository
+
+
+def configured_data_files() -> List[Path]:
+    """Data files of the configured datasets (PARAGUAY_TOURISM_DATASETS or the defaults)."""
+    registry = CatalogRegistry(Settings().datasets)
+    return [registry.repository(dataset).data_path for dataset in registry.datasets]
+
+
+def build_catalog(data_files: List[Path], output: Optional[Path]) -> int:
+    """
+    Compile place data files into binary catalog snapshots.
+
+    Args:
+        data_files: Data files (JSON arrays or JSON Lines) to compile.
+        output: Snapshot path (only with a single data file); defaults to the
+            data file path with a `.catalog` suffix.
+
+    Returns:
+        Process exit code.
+    """
+    if output is not None and len(data_files) != 1:
+        print("error: --output requires exactly one data file", file=sys.stderr)
+        return 2
+
+    status = 0
+    for data_file in data_files:
+        start = time.perf_counter()
+        try:
+            catalog, path, size = PlaceRepository(data_file).build_snapshot(output)
+        except (OSError, ValueError) as e:
+            print(f"error: {data_file}: {e}", file=sys.stderr)
+            status = 1
+            continue
+
+        elapsed = time.perf_counter() - start
+        print(
+            f"{data_file} -> {path}: {len(catalog)} places, "
+            f"{catalog.error_count} skipped, {size / 1024:.1f} KiB, {elapsed:.2f} s"
+        )
+        for error in catalog.errors:
+            print(f"  line {error.line}, offset {error.offset}: {error.message}", file=sys.stderr)
+    return status
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Entry point for `python -m paraguay_tourism.cli`.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:]).
+
+    Returns:
+        Process exit code.
+    """
+    parser = argparse.ArgumentParser(
+        prog="paraguay_tourism.cli",
+        description="Paraguay Tourism MCP Server data tools.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build = subparsers.add_parser(
+        "build-catalog",
+        help="compile place data files into binary catalog snapshots",
+        description=(
+            "Compile place data files into memory-mappable catalog snapshots "
+            "(<data file>.catalog) that the server loads instead of parsing JSON. "
+            "A snapshot is ignored once its data file changes; rebuild it afterwards."
+        ),
+    )
+    build.add_argument(
+        "data_files",
+        nargs="*",
+        type=Path,
+        help="data files to compile (default: the configured datasets)",
+    )
+    build.add_argument("-o", "--output", type=Path, help="snapshot path (single data file only)")
+
+    args = parser.parse_args(argv)
+    if args.command == "build-catalog":
+        data_files = args.data_files or configured_data_files()
+        return build_catalog(data_files, args.output)
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,7 @@
 """Core module for configuration and dependency management."""
 
 from .dependencies import DependencyContainer, get_container
-from .imports import setup_imports
+from .settings import Settings
 
-__all__ = ["DependencyContainer", "get_container", "setup_imports"]
+__all__ = ["DependencyContainer", "Settings", "get_container"]
 
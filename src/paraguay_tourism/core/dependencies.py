@@ -1,25 +1,82 @@
 """Dependency Injection Container for managing application dependencies."""
 
-from ..repositories import PlaceRepository
-from ..services import GeolocationService, LocationService, PlaceFormatter
+from ..repositories import CatalogRegistry
+from ..services import (
+    CircuitBreaker,
+    Gazetteer,
+    GeolocationCache,
+    GeolocationService,
+    LocationService,
+    MetricsRegistry,
+    PlaceFormatter,
+    PlaceQueryPlanner,
+    ProviderGuard,
+    RoutePlanner,
+    TokenBucket,
+    ToolProfiler,
+)
+from .http_clients import create_async_http_client, create_http_client
+from .settings import Settings
 
 
 class DependencyContainer:
     """Container for managing and providing application dependencies."""
 
-    def __init__(self):
-        """Initialize all dependencies."""
-        self._place_repository: PlaceRepository | None = None
+    def __init__(self, settings: Settings | None = None):
+        """
+        Initialize all dependencies.
+
+        Args:
+            settings: Application settings. If None, they are read from the environment.
+        """
+        self._settings = settings
+        self._catalog_registry: CatalogRegistry | None = None
         self._place_formatter: PlaceFormatter | None = None
+        self._place_query_planner: PlaceQueryPlanner | None = None
         self._location_service: LocationService | None = None
+        self._route_planner: RoutePlanner | None = None
         self._geolocation_service: GeolocationService | None = None
+        self._geolocation_cache: GeolocationCache | None = None
+        self._gazetteer: Gazetteer | None = None
+        self._metrics: MetricsRegistry | None = None
+        self._tool_profiler: ToolProfiler | None = None
+        self._http_client = None
+        self._async_http_client = None
+
+    @property
+    def settings(self) -> Settings:
+        """Get or create Settings instance."""
+        if self._settings is None:
+            self._settings = Settings()
+        return self._settings
+
+    @property
+    def catalog_registry(self) -> CatalogRegistry:
+        """Get or create CatalogRegistry instance over the configured datasets."""
+        if self._catalog_registry is None:
+            self._catalog_registry = CatalogRegistry(self.settings.datasets)
+        return self._catalog_registry
+
+    @property
+    def metrics(self) -> MetricsRegistry:
+        """Get or create the MetricsRegistry instance."""
+        if self._metrics is None:
+            self._metrics = MetricsRegistry(
+                prometheus_path=self.settings.metrics_file,
+                write_interval_seconds=self.settings.metrics_file_interval_seconds,
+            )
+        return self._metrics
 
     @property
-    def place_repository(self) -> PlaceRepository:
-        """Get or create PlaceRepository instance."""
-        if self._place_repository is None:
-            self._place_repository = PlaceRepository()
-        return self._place_repository
+    def tool_profiler(self) -> ToolProfiler:
+        """Get or create the ToolProfiler instance."""
+        if self._tool_profiler is None:
+            self._tool_profiler = ToolProfiler(
+                top_n=self.settings.profile_top,
+                output_dir=self.settings.profile_dir,
+                keep=self.settings.profile_keep,
+            )
+        return self._tool_profiler
 
     @property
     def place_formatter(self) -> PlaceFormatter:
@@ -28,6 +85,13 @@ class DependencyContainer:
             self._place_formatter = PlaceFormatter()
         return self._place_formatter
 
+    @property
+    def place_query_planner(self) -> PlaceQueryPlanner:
+        """Get or create PlaceQueryPlanner instance."""
+        if self._place_query_planner is None:
+            self._place_query_planner = PlaceQueryPlanner()
+        return self._place_query_planner
+
     @property
     def location_service(self) -> LocationService:
         """Get or create LocationService instance."""
@@ -35,13 +99,110 @@ class DependencyContainer:
             self._location_service = LocationService()
         return self._location_service
 
+    @property
+    def route_planner(self) -> RoutePlanner:
+        """Get or create RoutePlanner instance."""
+        if self._route_planner is None:
+            self._route_planner = RoutePlanner(
+                location_service=self.location_service,
+                time_budget_seconds=self.settings.route_time_budget_seconds,
+            )
+        return self._route_planner
+
+    @property
+    def geolocation_cache(self) -> GeolocationCache:
+        """Get or create GeolocationCache instance."""
+        if self._geolocation_cache is None:
+            settings = self.settings
+            self._geolocation_cache = GeolocationCache(
+                ttl_seconds=settings.geo_cache_ttl_seconds,
+                negative_ttl_seconds=settings.geo_cache_negative_ttl_seconds,
+                max_entries=settings.geo_cache_max_entries,
+                sqlite_path=settings.geo_cache_path,
+            )
+        return self._geolocation_cache
+
+    @property
+    def gazetteer(self) -> Gazetteer | None:
+        """Get or create Gazetteer instance (None when disabled in settings)."""
+        if self._gazetteer is None and self.settings.gazetteer_enabled:
+            self._gazetteer = Gazetteer(
+                self.catalog_registry,
+                localities_path=Gazetteer.DEFAULT_LOCALITIES_PATH,
+            )
+        return self._gazetteer
+
+    @property
+    def http_client(self):
+        """Get or create the shared, pooled httpx.Client (None if httpx is missing)."""
+        if self._http_client is None:
+            self._http_client = create_http_client(self.settings)
+        return self._http_client
+
+    @property
+    def async_http_client(self):
+        """Get or create the shared, pooled httpx.AsyncClient (None if httpx is missing)."""
+        if self._async_http_client is None:
+            self._async_http_client = create_async_http_client(self.settings)
+        return self._async_http_client
+
     @property
     def geolocation_service(self) -> GeolocationService:
         """Get or create GeolocationService instance."""
         if self._geolocation_service is None:
-            self._geolocation_service = GeolocationService()
+            self._geolocation_service = GeolocationService(
+                cache=self.geolocation_cache,
+                # Pooled clients are built on the first upstream request
+                http_client_factory=lambda: self.http_client,
+                async_http_client_factory=lambda: self.async_http_client,
+                ip_guard=self._create_provider_guard(
+                    "ip-api",
+                    self.settings.ip_api_rate_per_second,
+                    self.settings.ip_api_burst,
+                ),
+                geocoding_guard=self._create_provider_guard(
+                    "nominatim",
+                    self.settings.nominatim_rate_per_second,
+                    self.settings.nominatim_burst,
+                ),
+                gazetteer=self.gazetteer,
+                metrics=self.metrics,
+            )
         return self._geolocation_service
 
+    def _create_provider_guard(self, name: str, rate_per_second: float, burst: int) -> ProviderGuard:
+        """Create the rate limiter and circuit breaker for an upstream provider."""
+        settings = self.settings
+        return ProviderGuard(
+            name,
+            TokenBucket(rate_per_second, capacity=burst),
+            CircuitBreaker(
+                failure_threshold=settings.breaker_failure_threshold,
+                cooldown_seconds=settings.breaker_cooldown_seconds,
+            ),
+            max_wait_seconds=settings.rate_limit_max_wait_seconds,
+        )
+
+    def close(self) -> None:
+        """
+        Close the synchronous HTTP client and the geolocation cache's database.
+
+        Services stay usable: a new client is created, and the database
+        reopened, on the next upstream request or cache lookup.
+        """
+        if self._http_client is not None:
+            client, self._http_client = self._http_client, None
+            client.close()
+        if self._geolocation_cache is not None:
+            self._geolocation_cache.close()
+
+    async def aclose(self) -> None:
+        """Close every resource, including the asynchronous HTTP client."""
+        if self._async_http_client is not None:
+            client, self._async_http_client = self._async_http_client, None
+            await client.aclose()
+        self.close()
+
 
 # Singleton instance
 _container: DependencyContainer | None = None
@@ -0,0 +1,62 @@
+"""Factories for the shared, pooled HTTP clients."""
+
+import importlib.util
+
+from .settings import Settings
+
+# httpx is imported when the first client is created, not at start-up
+HTTPX_AVAILABLE = importlib.util.find_spec("httpx") is not None
+
+# HTTP/2 support in httpx requires the optional `h2` package
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def _client_options(settings: Settings) -> dict:
+    """Connection pool and timeout options shared by both clients."""
+    import httpx
+
+    return {
+        "http2": HTTP2_AVAILABLE,
+        "limits": httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry_seconds,
+        ),
+        "timeout": httpx.Timeout(settings.http_timeout_seconds),
+    }
+
+
+def create_http_client(settings: Settings) -> "httpx.Client | None":
+    """
+    Create a long-lived, pooled synchronous HTTP client.
+
+    Args:
+        settings: Application settings with connection pool limits.
+
+    Returns:
+        httpx.Client with keep-alive (and HTTP/2 when `h2` is installed),
+        or None if httpx is not installed.
+    """
+    if not HTTPX_AVAILABLE:
+        return None
+    import httpx
+
+    return httpx.Client(**_client_options(settings))
+
+
+def create_async_http_client(settings: Settings) -> "httpx.AsyncClient | None":
+    """
+    Create a long-lived, pooled asynchronous HTTP client.
+
+    Args:
+        settings: Application settings with connection pool limits.
+
+    Returns:
+        httpx.AsyncClient with keep-alive (and HTTP/2 when `h2` is installed),
+        or None if httpx is not installed.
+    """
+    if not HTTPX_AVAILABLE:
+        return None
+    import httpx
+
+    return httpx.AsyncClient(**_client_options(settings))
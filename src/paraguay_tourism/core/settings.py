@@ -0,0 +1,121 @@
+"""Runtime settings read from environment variables."""
+
+import os
+from typing import Dict, Optional
+
+
+def _env_float(name: str, default: float) -> float:
+    """Read a float environment variable, falling back to a default."""
+    value = os.environ.get(name)
+    if value is None or value.strip() == "":
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        raise ValueError(f"Invalid value for {name}: {value!r} (expected a number)") from None
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer environment variable, falling back to a default."""
+    value = os.environ.get(name)
+    if value is None or value.strip() == "":
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"Invalid value for {name}: {value!r} (expected an integer)") from None
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """Read a boolean environment variable ("1/true/yes/on" or "0/false/no/off")."""
+    value = os.environ.get(name)
+    if value is None or value.strip() == "":
+        return default
+    normalized = value.strip().lower()
+    if normalized in ("1", "true", "yes", "on"):
+        return True
+    if normalized in ("0", "false", "no", "off"):
+        return False
+    raise ValueError(f"Invalid value for {name}: {value!r} (expected a boolean)")
+
+
+def _env_str(name: str) -> Optional[str]:
+    """Read a string environment variable, treating empty values as unset."""
+    value = os.environ.get(name)
+    if value is None or value.strip() == "":
+        return None
+    return value
+
+
+def _env_datasets(name: str) -> Optional[Dict[str, str]]:
+    """Read a "tag=path,tag=path" environment variable, treating empty values as unset."""
+    value = _env_str(name)
+    if value is None:
+        return None
+    datasets: Dict[str, str] = {}
+    for item in value.split(","):
+        tag, separator, path = item.partition("=")
+        if not item.strip():
+            continue
+        if not separator or not tag.strip() or not path.strip():
+            raise ValueError(f"Invalid value for {name}: {value!r} (expected tag=path pairs)")
+        datasets[tag.strip().lower()] = path.strip()
+    return datasets or None
+
+
+class Settings:
+    """
+    Application settings.
+
+    Every value can be overridden with a `PARAGUAY_TOURISM_*` environment variable.
+    """
+
+    ENV_PREFIX = "PARAGUAY_TOURISM_"
+
+    def __init__(self):
+        """Read settings from the environment."""
+        prefix = self.ENV_PREFIX
+
+        # Place datasets (tag -> data file); None serves the bundled Paraguay and Germany data
+        self.datasets = _env_datasets(f"{prefix}DATASETS")
+
+        # Geolocation cache
+        self.geo_cache_ttl_seconds = _env_float(f"{prefix}GEO_CACHE_TTL", 24 * 3600.0)
+        self.geo_cache_negative_ttl_seconds = _env_float(f"{prefix}GEO_CACHE_NEGATIVE_TTL", 3600.0)
+        self.geo_cache_max_entries = _env_int(f"{prefix}GEO_CACHE_MAX_ENTRIES", 1024)
+        self.geo_cache_path = _env_str(f"{prefix}GEO_CACHE_PATH")
+
+        # Shared HTTP clients
+        self.http_max_connections = _env_int(f"{prefix}HTTP_MAX_CONNECTIONS", 20)
+        self.http_max_keepalive_connections = _env_int(f"{prefix}HTTP_MAX_KEEPALIVE", 10)
+        self.http_keepalive_expiry_seconds = _env_float(f"{prefix}HTTP_KEEPALIVE_EXPIRY", 30.0)
+        self.http_timeout_seconds = _env_float(f"{prefix}HTTP_TIMEOUT", 10.0)
+
+        # Upstream provider rate limits and circuit breakers
+        self.nominatim_rate_per_second = _env_float(f"{prefix}NOMINATIM_RATE", 1.0)
+        self.nominatim_burst = _env_int(f"{prefix}NOMINATIM_BURST", 1)
+        self.ip_api_rate_per_second = _env_float(f"{prefix}IP_API_RATE", 40 / 60)
+        self.ip_api_burst = _env_int(f"{prefix}IP_API_BURST", 5)
+        self.rate_limit_max_wait_seconds = _env_float(f"{prefix}RATE_LIMIT_MAX_WAIT", 1.0)
+        self.breaker_failure_threshold = _env_int(f"{prefix}BREAKER_FAILURES", 5)
+        self.breaker_cooldown_seconds = _env_float(f"{prefix}BREAKER_COOLDOWN", 30.0)
+
+        # Local gazetteer consulted before Nominatim
+        self.gazetteer_enabled = _env_bool(f"{prefix}GAZETTEER", True)
+
+        # Route planning: maximum seconds of 2-opt / Or-opt improvement per route
+        self.route_time_budget_seconds = _env_float(f"{prefix}ROUTE_TIME_BUDGET", 0.2)
+
+        # Metrics: optional Prometheus text file (rewritten at most every interval)
+        # and /metrics route when serving over HTTP
+        self.metrics_file = _env_str(f"{prefix}METRICS_FILE")
+        self.metrics_file_interval_seconds = _env_float(f"{prefix}METRICS_FILE_INTERVAL", 15.0)
+        self.metrics_endpoint_enabled = _env_bool(f"{prefix}METRICS_ENDPOINT", False)
+
+        # Tool call profiling: "off", "request" (calls passing "_profile": true),
+        # "all", or a comma-separated list of tool names; reports are attached to
+        # the result as "_profile" or, with a directory, written there
+        self.profile = (_env_str(f"{prefix}PROFILE") or "off").strip().lower()
+        self.profile_dir = _env_str(f"{prefix}PROFILE_DIR")
+        self.profile_top = _env_int(f"{prefix}PROFILE_TOP", 25)
+        self.profile_keep = _env_int(f"{prefix}PROFILE_KEEP", 50)
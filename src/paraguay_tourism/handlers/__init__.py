@@ -1,6 +1,12 @@
 """Handlers module for MCP tools."""
 
+from .metrics_handlers import register_metrics_handlers
 from .place_handlers import register_place_handlers
+from .profiling_handlers import register_profiling_handlers
 
-__all__ = ["register_place_handlers"]
+__all__ = [
+    "register_metrics_handlers",
+    "register_place_handlers",
+    "register_profiling_handlers",
+]
 
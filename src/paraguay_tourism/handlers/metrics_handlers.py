@@ -0,0 +1,109 @@
+"""Handlers for server metrics: per-tool instrumentation and the metrics tool."""
+
+import time
+
+from fastmcp import FastMCP
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from fastmcp.tools.tool import ToolResult
+from mcp.types import CallToolRequestParams, TextContent
+
+from ..core.dependencies import DependencyContainer
+from ..services import MetricsRegistry
+
+
+class MetricsMiddleware(Middleware):
+    """
+    Records every MCP tool call in a `MetricsRegistry`.
+
+    Latency covers the tool itself and the serialization of its result; the
+    payload size is that of the serialized text content, measured on the
+    result FastMCP already built, so no extra serialization is done.
+    """
+
+    def __init__(self, metrics: MetricsRegistry):
+        """
+        Initialize the middleware.
+
+        Args:
+            metrics: Registry the calls are recorded in.
+        """
+        self._metrics = metrics
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[CallToolRequestParams],
+        call_next: CallNext[CallToolRequestParams, ToolResult],
+    ) -> ToolResult:
+        """Time a tool call and record its outcome and response size."""
+        tool = context.message.name
+        start = time.perf_counter()
+        try:
+            result = await call_next(context)
+        except Exception:
+            self._metrics.observe_tool(tool, time.perf_counter() - start, error=True)
+            raise
+        payload_bytes = sum(
+            len(block.text.encode("utf-8"))
+            for block in result.content
+            if isinstance(block, TextContent)
+        )
+        self._metrics.observe_tool(tool, time.perf_counter() - start, payload_bytes=payload_bytes)
+        return result
+
+
+def register_metrics_handlers(mcp: FastMCP, container: DependencyContainer) -> None:
+    """
+    Instrument every MCP tool and register the metrics tool (and HTTP route, if enabled).
+
+    Args:
+        mcp: FastMCP server instance to register tools on.
+        container: Dependency container with required services.
+    """
+    metrics = container.metrics
+    catalog_registry = container.catalog_registry
+    place_formatter = container.place_formatter
+    route_planner = container.route_planner
+    geolocation_service = container.geolocation_service
+
+    mcp.add_middleware(MetricsMiddleware(metrics))
+
+    @mcp.tool(
+        name="get_server_metrics",
+        description="Obtiene métricas del servidor: llamadas, errores, latencias (p50/p90/p99 en ms) y tamaño de respuesta por herramienta, tiempos por etapa (carga del catálogo, filtrado por distancia, formateo) y solicitudes a servicios externos (errores y timeouts), además de estadísticas de cachés.",
+    )
+    def get_server_metrics() -> dict:
+        """
+        Retrieve server metrics.
+
+        Returns:
+            Dictionary with per-tool, per-stage and upstream metrics (see
+            `MetricsRegistry.snapshot`), formatter, geolocation and route planner cache stats,
+            and the current catalog version and size.
+        """
+        catalog = catalog_registry.get_catalog()
+        return {
+            **metrics.snapshot(),
+            "caches": {
+                "formatter": place_formatter.stats(),
+                "geolocation": geolocation_service.stats(),
+                "route_planner": route_planner.stats(),
+            },
+            "catalog": {
+                "version": catalog.version,
+                "datasets": list(catalog.datasets),
+                "places": len(catalog),
+                "errors": catalog.error_count,
+            },
+        }
+
+    if container.settings.metrics_endpoint_enabled:
+        from starlette.requests import Request
+        from starlette.responses import PlainTextResponse
+
+        @mcp.custom_route("/metrics", methods=["GET"])
+        async def prometheus_metrics(request: Request) -> PlainTextResponse:
+            """Prometheus text exposition (served only with an HTTP transport)."""
+            return PlainTextResponse(
+                metrics.render_prometheus(),
+                media_type="text/plain; version=0.0.4; charset=utf-8",
+            )
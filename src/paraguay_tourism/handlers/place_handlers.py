@@ -1,8 +1,12 @@
 """Handlers for tourist place MCP tools."""
 
+from typing import List
+
 from fastmcp import FastMCP
 
 from ..core.dependencies import DependencyContainer
+from ..models import DistanceOrigin, GeoPoint
+from ..utils import normalize_key
 
 
 def register_place_handlers(mcp: FastMCP, container: DependencyContainer) -> None:
@@ -13,50 +17,312 @@ def register_place_handlers(mcp: FastMCP, container: DependencyContainer) -> Non
         mcp: FastMCP server instance to register tools on.
         container: Dependency container with required services.
     """
-    place_repository = container.place_repository
-    place_formatter = container.place_formatter
-    location_service = container.location_service
+    # Calls through these services are timed as stages in the metrics registry
+    metrics = container.metrics
+    catalog_registry = metrics.timed(container.catalog_registry, "catalog_load")
+    place_formatter = metrics.timed(container.place_formatter, "formatting")
+    place_query_planner = metrics.timed(container.place_query_planner, "query_planning")
+    location_service = metrics.timed(container.location_service, "distance")
+    route_planner = metrics.timed(container.route_planner, "route_planning")
     geolocation_service = container.geolocation_service
 
     @mcp.tool(
         name="list_all_tourist_places",
-        description="Lista todos los lugares turísticos de Paraguay con nombre, ciudad, categoría y coordenadas GPS (lat, lng).",
+        description="Lista todos los lugares turísticos de Paraguay con nombre, ciudad, categoría y coordenadas GPS (lat, lng). Admite paginación (offset, limit), selección de campos (fields) e include_table=false para respuestas más compactas. Admite filtrar por dataset (ej: 'py' para Paraguay, 'de' para Alemania).",
     )
-    def list_all_tourist_places() -> dict:
+    def list_all_tourist_places(
+        dataset: str | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+        fields: List[str] | None = None,
+        include_table: bool = True,
+    ) -> dict:
         """
         Retrieve and format all tourist places in Paraguay.
 
+        Args:
+            dataset: Dataset tag to query (e.g. "py", "de"; default: all datasets).
+            offset: Index of the first place to return (default: 0).
+            limit: Maximum number of places to return (default: all).
+            fields: Place fields to include in `raw` (e.g. ["name", "city"]); `id` is always included.
+            include_table: Whether to include the formatted text table (default: True).
+
         Returns:
-            Dictionary containing total count, formatted table, and raw data.
+            Dictionary containing total count, page bounds, formatted table, and raw data.
         """
-        places = place_repository.get_all()
-        return place_formatter.format_as_dict(places)
+        catalog = catalog_registry.get_catalog()
+        scope = catalog.scope(dataset)
+        return place_formatter.format_as_dict(
+            scope.places,
+            version=catalog.version,
+            cache_key=("all", scope.dataset),
+            offset=offset,
+            limit=limit,
+            fields=fields,
+            include_table=include_table,
+        )
 
     @mcp.tool(
         name="get_tourist_place_by_id",
-        description="Obtiene toda la información de un lugar turístico de Paraguay por su ID.",
+        description="Obtiene toda la información de un lugar turístico de Paraguay por su ID. Admite filtrar por dataset (ej: 'py' para Paraguay, 'de' para Alemania).",
     )
-    def get_tourist_place_by_id(place_id: str) -> dict:
+    def get_tourist_place_by_id(place_id: str, dataset: str | None = None) -> dict:
         """
         Retrieve and format a tourist place by its ID.
 
         Args:
             place_id: The ID of the place to retrieve.
+            dataset: Dataset tag to query (e.g. "py", "de"; default: all datasets).
 
         Returns:
             Dictionary containing place data or error message if not found.
         """
-        place = place_repository.get_by_id(place_id)
-        return place_formatter.format_single(place)
+        catalog = catalog_registry.get_catalog()
+        scope = catalog.scope(dataset)
+        return place_formatter.format_single(scope.get(place_id), version=catalog.version)
+
+    @mcp.tool(
+        name="list_tourist_places_by_category",
+        description="Lista los lugares turísticos de una categoría (ej: 'Naturaleza', 'Historia'). No distingue mayúsculas ni acentos. Admite filtrar por dataset (ej: 'py' para Paraguay, 'de' para Alemania).",
+    )
+    def list_tourist_places_by_category(
+        category: str,
+        dataset: str | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+        fields: List[str] | None = None,
+        include_table: bool = True,
+    ) -> dict:
+        """
+        Retrieve and format all tourist places in a category.
+
+        Args:
+            category: Category name (e.g., "Naturaleza", "historia").
+            dataset: Dataset tag to query (e.g. "py", "de"; default: all datasets).
+            offset: Index of the first place to return (default: 0).
+            limit: Maximum number of places to return (default: all).
+            fields: Place fields to include in `raw` (e.g. ["name", "city"]); `id` is always included.
+            include_table: Whether to include the formatted text table (default: True).
+
+        Returns:
+            Dictionary containing total count, page bounds, formatted table, and raw data.
+        """
+        catalog = catalog_registry.get_catalog()
+        scope = catalog.scope(dataset)
+        return place_formatter.format_as_dict(
+            scope.by_category(category),
+            version=catalog.version,
+            cache_key=("category", normalize_key(category), scope.dataset),
+            offset=offset,
+            limit=limit,
+            fields=fields,
+            include_table=include_table,
+        )
+
+    @mcp.tool(
+        name="list_tourist_places_by_city",
+        description="Lista los lugares turísticos de una ciudad (ej: 'Asunción', 'Encarnacion'). No distingue mayúsculas ni acentos. Admite filtrar por dataset (ej: 'py' para Paraguay, 'de' para Alemania).",
+    )
+    def list_tourist_places_by_city(
+        city: str,
+        dataset: str | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+        fields: List[str] | None = None,
+        include_table: bool = True,
+    ) -> dict:
+        """
+        Retrieve and format all tourist places in a city.
+
+        Args:
+            city: City name (e.g., "Asunción", "asuncion").
+            dataset: Dataset tag to query (e.g. "py", "de"; default: all datasets).
+            offset: Index of the first place to return (default: 0).
+            limit: Maximum number of places to return (default: all).
+            fields: Place fields to include in `raw` (e.g. ["name", "city"]); `id` is always included.
+            include_table: Whether to include the formatted text table (default: True).
+
+        Returns:
+            Dictionary containing total count, page bounds, formatted table, and raw data.
+        """
+        catalog = catalog_registry.get_catalog()
+        scope = catalog.scope(dataset)
+        return place_formatter.format_as_dict(
+            scope.by_city(city),
+            version=catalog.version,
+            cache_key=("city", normalize_key(city), scope.dataset),
+            offset=offset,
+            limit=limit,
+            fields=fields,
+            include_table=include_table,
+        )
+
+    @mcp.tool(
+        name="list_tourist_places_by_region",
+        description="Lista los lugares turísticos de una región o departamento (ej: 'Itapúa', 'Cordillera'). No distingue mayúsculas ni acentos. Admite filtrar por dataset (ej: 'py' para Paraguay, 'de' para Alemania).",
+    )
+    def list_tourist_places_by_region(
+        region: str,
+        dataset: str | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+        fields: List[str] | None = None,
+        include_table: bool = True,
+    ) -> dict:
+        """
+        Retrieve and format all tourist places in a region.
+
+        Args:
+            region: Region name (e.g., "Itapúa", "alto parana").
+            dataset: Dataset tag to query (e.g. "py", "de"; default: all datasets).
+            offset: Index of the first place to return (default: 0).
+            limit: Maximum number of places to return (default: all).
+            fields: Place fields to include in `raw` (e.g. ["name", "city"]); `id` is always included.
+            include_table: Whether to include the formatted text table (default: True).
+
+        Returns:
+            Dictionary containing total count, page bounds, formatted table, and raw data.
+        """
+        catalog = catalog_registry.get_catalog()
+        scope = catalog.scope(dataset)
+        return place_formatter.format_as_dict(
+            scope.by_region(region),
+            version=catalog.version,
+            cache_key=("region", normalize_key(region), scope.dataset),
+            offset=offset,
+            limit=limit,
+            fields=fields,
+            include_table=include_table,
+        )
+
+    @mcp.tool(
+        name="search_tourist_places",
+        description="Busca lugares turísticos por texto libre (ej: 'cascadas', 'ruinas jesuíticas', 'catedral') en nombre, descripción, categoría y ciudad. No distingue mayúsculas ni acentos y reconoce plurales y variantes simples. Retorna los lugares ordenados por relevancia (BM25). Admite filtrar por dataset (ej: 'py' para Paraguay, 'de' para Alemania).",
+    )
+    def search_tourist_places(
+        query: str,
+        limit: int = 10,
+        dataset: str | None = None,
+        fields: List[str] | None = None,
+        include_table: bool = True,
+    ) -> dict:
+        """
+        Full-text search over tourist places.
+
+        Args:
+            query: Texto a buscar (ej: "cascadas", "ruinas jesuíticas").
+            limit: Cantidad máxima de resultados a retornar (por defecto: 10).
+            dataset: Etiqueta del dataset a consultar (ej: "py", "de"; por defecto: todos).
+            fields: Campos de cada lugar a incluir en `raw` (ej: ["name", "city"]); `id` siempre se incluye.
+            include_table: Si se incluye la tabla de texto formateada (por defecto: True).
+
+        Returns:
+            Dictionary containing the query, total matches, formatted table with scores, and raw data.
+            Los lugares están ordenados por relevancia (más relevantes primero).
+        """
+        catalog = catalog_registry.get_catalog()
+        scope = catalog.scope(dataset)
+
+        matches, total = scope.text_index.search(query, limit)
+        places = scope.places
+        return place_formatter.format_with_scores(
+            query,
+            [(places[position], score) for position, score in matches],
+            total,
+            version=catalog.version,
+            fields=fields,
+            include_table=include_table,
+        )
+
+    @mcp.tool(
+        name="query_tourist_places",
+        description="Busca lugares turísticos combinando filtros en una sola consulta: categoría, región, ciudad, texto libre, radio alrededor de un punto (latitude, longitude, max_distance_km) y/o rectángulo (min_lat, max_lat, min_lng, max_lng). Todos los filtros son opcionales y se combinan con Y. Ordena por distancia si hay radio, si no por relevancia si hay texto. Admite paginación (offset, limit), selección de campos (fields), include_table=false y filtro por dataset (ej: 'py', 'de').",
+    )
+    def query_tourist_places(
+        category: str | None = None,
+        region: str | None = None,
+        city: str | None = None,
+        text: str | None = None,
+        latitude: float | None = None,
+        longitude: float | None = None,
+        max_distance_km: float | None = None,
+        min_lat: float | None = None,
+        max_lat: float | None = None,
+        min_lng: float | None = None,
+        max_lng: float | None = None,
+        dataset: str | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+        fields: List[str] | None = None,
+        include_table: bool = True,
+    ) -> dict:
+        """
+        Find tourist places matching several filters at once.
+
+        Args:
+            category: Categoría (ej: "Naturaleza"); no distingue mayúsculas ni acentos.
+            region: Región o departamento (ej: "Itapúa").
+            city: Ciudad (ej: "Asunción").
+            text: Texto libre a buscar en nombre, descripción, categoría y ciudad (ej: "cascadas").
+            latitude: Latitud del centro de búsqueda (junto con longitude y max_distance_km).
+            longitude: Longitud del centro de búsqueda.
+            max_distance_km: Radio de búsqueda en kilómetros.
+            min_lat: Latitud sur del rectángulo (junto con max_lat, min_lng y max_lng).
+            max_lat: Latitud norte del rectángulo.
+            min_lng: Longitud oeste del rectángulo.
+            max_lng: Longitud este del rectángulo (menor que min_lng si cruza el antimeridiano).
+            dataset: Etiqueta del dataset a consultar (ej: "py", "de"; por defecto: todos).
+            offset: Índice del primer resultado a retornar (por defecto: 0).
+            limit: Cantidad máxima de resultados a retornar (por defecto: todos).
+            fields: Campos de cada lugar a incluir en `raw` (ej: ["name", "city"]); `id` siempre se incluye.
+            include_table: Si se incluye la tabla de texto formateada (por defecto: True).
+
+        Returns:
+            Dictionary containing total count, page bounds, the query plan, formatted table,
+            and raw data (with distance_km and/or score when applicable).
+        """
+        bbox_values = (min_lat, max_lat, min_lng, max_lng)
+        if any(value is None for value in bbox_values) and not all(value is None for value in bbox_values):
+            raise ValueError("min_lat, max_lat, min_lng y max_lng deben indicarse juntos")
+        bbox = None if min_lat is None else bbox_values
+
+        catalog = catalog_registry.get_catalog()
+        scope = catalog.scope(dataset)
+
+        matches, plan = place_query_planner.query(
+            scope,
+            category=category,
+            region=region,
+            city=city,
+            text=text,
+            latitude=latitude,
+            longitude=longitude,
+            max_distance_km=max_distance_km,
+            bbox=bbox,
+        )
+        return place_formatter.format_query_results(
+            matches,
+            plan,
+            version=catalog.version,
+            offset=offset,
+            limit=limit,
+            fields=fields,
+            include_table=include_table,
+        )
 
     @mcp.tool(
         name="find_tourist_places_by_distance",
-        description="Busca lugares turísticos de Paraguay dentro de un rango de distancia desde una ubicación específica. Retorna lugares ordenados por distancia (más cercanos primero).",
+        description="Busca lugares turísticos de Paraguay dentro de un rango de distancia desde una ubicación específica. Retorna lugares ordenados por distancia (más cercanos primero). Admite paginación (offset, limit), selección de campos (fields) e include_table=false para respuestas más compactas. Admite filtrar por dataset (ej: 'py' para Paraguay, 'de' para Alemania).",
     )
     def find_tourist_places_by_distance(
         latitude: float,
         longitude: float,
         max_distance_km: float,
+        dataset: str | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+        fields: List[str] | None = None,
+        include_table: bool = True,
     ) -> dict:
         """
         Find tourist places within a specified distance from a location.
@@ -65,27 +331,292 @@ def register_place_handlers(mcp: FastMCP, container: DependencyContainer) -> Non
             latitude: Latitud del punto de referencia en grados decimales (ej: -25.2822 para Asunción).
             longitude: Longitud del punto de referencia en grados decimales (ej: -57.6352 para Asunción).
             max_distance_km: Distancia máxima en kilómetros desde el punto de referencia (ej: 50.0 para 50 km).
+            dataset: Etiqueta del dataset a consultar (ej: "py", "de"; por defecto: todos).
+            offset: Índice del primer resultado a retornar (por defecto: 0).
+            limit: Cantidad máxima de resultados a retornar (por defecto: todos).
+            fields: Campos de cada lugar a incluir en `raw` (ej: ["name", "city"]); `id` siempre se incluye.
+            include_table: Si se incluye la tabla de texto formateada (por defecto: True).
 
         Returns:
             Dictionary containing total count, formatted table with distances, and raw data.
             Los lugares están ordenados por distancia (más cercanos primero).
         """
-        # Get all places
-        all_places = place_repository.get_all()
+        catalog = catalog_registry.get_catalog()
+        scope = catalog.scope(dataset)
 
         # Filter places by distance
         places_with_distances = location_service.filter_places_by_distance(
-            all_places, latitude, longitude, max_distance_km
+            scope.places,
+            latitude,
+            longitude,
+            max_distance_km,
+            spatial_index=scope.spatial_index,
+            coordinates=scope.coordinates,
         )
 
         # Format results
-        return place_formatter.format_with_distances(places_with_distances)
+        return place_formatter.format_with_distances(
+            places_with_distances,
+            version=catalog.version,
+            offset=offset,
+            limit=limit,
+            fields=fields,
+            include_table=include_table,
+        )
+
+    @mcp.tool(
+        name="find_tourist_places_by_distance_batch",
+        description="Busca lugares turísticos de Paraguay alrededor de varias ubicaciones en una sola llamada (ej: cada parada de un itinerario). Cada origen tiene su propia distancia máxima; los datos de cada lugar se incluyen una sola vez. Admite filtrar por dataset (ej: 'py' para Paraguay, 'de' para Alemania).",
+    )
+    def find_tourist_places_by_distance_batch(
+        origins: List[DistanceOrigin],
+        dataset: str | None = None,
+        fields: List[str] | None = None,
+    ) -> dict:
+        """
+        Find tourist places around several locations at once.
+
+        Args:
+            origins: Lista de orígenes, cada uno con latitude, longitude y max_distance_km
+                (ej: [{"latitude": -25.2822, "longitude": -57.6352, "max_distance_km": 20.0}]).
+            dataset: Etiqueta del dataset a consultar (ej: "py", "de"; por defecto: todos).
+            fields: Campos de cada lugar a incluir en `places` (ej: ["name", "city"]); `id` siempre se incluye.
+
+        Returns:
+            Dictionary with one result per origin (place IDs and distances, closest first)
+            and a shared `places` mapping of place ID to place data.
+        """
+        catalog = catalog_registry.get_catalog()
+        scope = catalog.scope(dataset)
+        origin_tuples = [
+            (origin.latitude, origin.longitude, origin.max_distance_km)
+            for origin in origins
+        ]
+
+        results = location_service.filter_places_by_distance_batch(
+            scope.places,
+            origin_tuples,
+            spatial_index=scope.spatial_index,
+            coordinates=scope.coordinates,
+        )
+
+        return place_formatter.format_batch_with_distances(
+            origin_tuples, results, version=catalog.version, fields=fields
+        )
+
+    @mcp.tool(
+        name="find_k_nearest_tourist_places",
+        description="Busca los k lugares turísticos de Paraguay más cercanos a una ubicación específica, opcionalmente limitados a una distancia máxima. Retorna lugares ordenados por distancia (más cercanos primero). Admite filtrar por dataset (ej: 'py' para Paraguay, 'de' para Alemania).",
+    )
+    def find_k_nearest_tourist_places(
+        latitude: float,
+        longitude: float,
+        k: int = 5,
+        max_distance_km: float | None = None,
+        dataset: str | None = None,
+        fields: List[str] | None = None,
+        include_table: bool = True,
+    ) -> dict:
+        """
+        Find the k tourist places closest to a location.
+
+        Args:
+            latitude: Latitud del punto de referencia en grados decimales (ej: -25.2822 para Asunción).
+            longitude: Longitud del punto de referencia en grados decimales (ej: -57.6352 para Asunción).
+            k: Cantidad máxima de lugares a retornar (ej: 5).
+            max_distance_km: Distancia máxima opcional en kilómetros desde el punto de referencia.
+            dataset: Etiqueta del dataset a consultar (ej: "py", "de"; por defecto: todos).
+            fields: Campos de cada lugar a incluir en `raw` (ej: ["name", "city"]); `id` siempre se incluye.
+            include_table: Si se incluye la tabla de texto formateada (por defecto: True).
+
+        Returns:
+            Dictionary containing total count, formatted table with distances, and raw data.
+            Los lugares están ordenados por distancia (más cercanos primero).
+        """
+        catalog = catalog_registry.get_catalog()
+        scope = catalog.scope(dataset)
+
+        places_with_distances = location_service.find_k_nearest(
+            scope.places,
+            latitude,
+            longitude,
+            k,
+            max_distance_km=max_distance_km,
+            spatial_index=scope.spatial_index,
+            coordinates=scope.coordinates,
+        )
+
+        return place_formatter.format_with_distances(
+            places_with_distances,
+            version=catalog.version,
+            fields=fields,
+            include_table=include_table,
+        )
+
+    @mcp.tool(
+        name="find_tourist_places_in_bbox",
+        description="Busca los lugares turísticos dentro de un rectángulo de coordenadas (ej: la vista actual de un mapa), dado por min_lat, max_lat, min_lng y max_lng. Si min_lng es mayor que max_lng el rectángulo cruza el antimeridiano. Admite paginación (offset, limit), selección de campos (fields) e include_table=false para respuestas más compactas. Admite filtrar por dataset (ej: 'py' para Paraguay, 'de' para Alemania).",
+    )
+    def find_tourist_places_in_bbox(
+        min_lat: float,
+        max_lat: float,
+        min_lng: float,
+        max_lng: float,
+        dataset: str | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+        fields: List[str] | None = None,
+        include_table: bool = True,
+    ) -> dict:
+        """
+        Find tourist places inside a bounding box.
+
+        Args:
+            min_lat: Latitud sur del rectángulo en grados decimales (ej: -27.6).
+            max_lat: Latitud norte del rectángulo en grados decimales (ej: -25.0).
+            min_lng: Longitud oeste del rectángulo en grados decimales (ej: -57.9).
+            max_lng: Longitud este del rectángulo en grados decimales (ej: -54.6).
+            dataset: Etiqueta del dataset a consultar (ej: "py", "de"; por defecto: todos).
+            offset: Índice del primer resultado a retornar (por defecto: 0).
+            limit: Cantidad máxima de resultados a retornar (por defecto: todos).
+            fields: Campos de cada lugar a incluir en `raw` (ej: ["name", "city"]); `id` siempre se incluye.
+            include_table: Si se incluye la tabla de texto formateada (por defecto: True).
+
+        Returns:
+            Dictionary containing total count, page bounds, formatted table, and raw data.
+        """
+        catalog = catalog_registry.get_catalog()
+        scope = catalog.scope(dataset)
+
+        places = location_service.places_in_bbox(
+            scope.places,
+            min_lat,
+            max_lat,
+            min_lng,
+            max_lng,
+            spatial_index=scope.spatial_index,
+        )
+
+        return place_formatter.format_as_dict(
+            places,
+            version=catalog.version,
+            offset=offset,
+            limit=limit,
+            fields=fields,
+            include_table=include_table,
+        )
+
+    @mcp.tool(
+        name="find_tourist_places_in_polygon",
+        description="Busca los lugares turísticos dentro de un polígono (ej: el límite de un departamento), dado como lista ordenada de vértices con latitude y longitude (mínimo 3). Admite paginación (offset, limit), selección de campos (fields) e include_table=false para respuestas más compactas. Admite filtrar por dataset (ej: 'py' para Paraguay, 'de' para Alemania).",
+    )
+    def find_tourist_places_in_polygon(
+        polygon: List[GeoPoint],
+        dataset: str | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+        fields: List[str] | None = None,
+        include_table: bool = True,
+    ) -> dict:
+        """
+        Find tourist places inside a polygon.
+
+        Args:
+            polygon: Vértices del polígono en orden, cada uno con latitude y longitude
+                (ej: [{"latitude": -25.2, "longitude": -57.7}, {"latitude": -25.2, "longitude": -57.4},
+                {"latitude": -25.5, "longitude": -57.5}]). No hace falta repetir el primer vértice.
+            dataset: Etiqueta del dataset a consultar (ej: "py", "de"; por defecto: todos).
+            offset: Índice del primer resultado a retornar (por defecto: 0).
+            limit: Cantidad máxima de resultados a retornar (por defecto: todos).
+            fields: Campos de cada lugar a incluir en `raw` (ej: ["name", "city"]); `id` siempre se incluye.
+            include_table: Si se incluye la tabla de texto formateada (por defecto: True).
+
+        Returns:
+            Dictionary containing total count, page bounds, formatted table, and raw data.
+        """
+        catalog = catalog_registry.get_catalog()
+        scope = catalog.scope(dataset)
+
+        places = location_service.places_in_polygon(
+            scope.places,
+            [(point.latitude, point.longitude) for point in polygon],
+            spatial_index=scope.spatial_index,
+            coordinates=scope.coordinates,
+        )
+
+        return place_formatter.format_as_dict(
+            places,
+            version=catalog.version,
+            offset=offset,
+            limit=limit,
+            fields=fields,
+            include_table=include_table,
+        )
+
+    @mcp.tool(
+        name="plan_tourist_route",
+        description="Ordena una lista de lugares turísticos (por ID) en una ruta corta para recorrerlos, por ejemplo en una excursión de un día. Puede partir de una ubicación (start_lat, start_lng) y regresar a ella (return_to_start). Retorna las paradas en orden, los tramos y la distancia total en km (en línea recta). Usar en lugar de calcular distancias entre lugares una por una.",
+    )
+    def plan_tourist_route(
+        place_ids: List[str],
+        start_lat: float | None = None,
+        start_lng: float | None = None,
+        return_to_start: bool = False,
+        dataset: str | None = None,
+        fields: List[str] | None = None,
+        include_table: bool = True,
+    ) -> dict:
+        """
+        Order tourist places into a short route.
+
+        Args:
+            place_ids: IDs de los lugares a visitar (ej: ["palacio-lopez", "catedral-asuncion"]).
+            start_lat: Latitud opcional del punto de partida en grados decimales (ej: -25.2822).
+            start_lng: Longitud opcional del punto de partida en grados decimales (ej: -57.6352).
+            return_to_start: Si la ruta termina donde empezó (en el punto de partida o, sin él,
+                en la primera parada).
+            dataset: Etiqueta del dataset a consultar (ej: "py", "de"; por defecto: todos).
+            fields: Campos de cada lugar a incluir en `stops` (ej: ["name", "city"]); `id` siempre se incluye.
+            include_table: Si se incluye la tabla de texto formateada (por defecto: True).
+
+        Returns:
+            Dictionary with the total distance, ordered stops (with leg and cumulative
+            distances), legs and optimization stats.
+
+        Raises:
+            ValueError: If a place ID is unknown, or only one of start_lat / start_lng is given.
+        """
+        if (start_lat is None) != (start_lng is None):
+            raise ValueError("start_lat y start_lng deben indicarse juntos")
+
+        catalog = catalog_registry.get_catalog()
+        scope = catalog.scope(dataset)
+        places = []
+        missing = []
+        for place_id in dict.fromkeys(place_ids):
+            place = scope.get(place_id)
+            if place is None:
+                missing.append(place_id)
+            else:
+                places.append(place)
+        if missing:
+            raise ValueError(f"Lugares turísticos no encontrados: {', '.join(missing)}")
+
+        route = route_planner.plan(
+            places,
+            start=(start_lat, start_lng) if start_lat is not None else None,
+            return_to_start=return_to_start,
+            version=catalog.version,
+        )
+        return place_formatter.format_route(
+            route, version=catalog.version, fields=fields, include_table=include_table
+        )
 
     @mcp.tool(
         name="get_current_location",
         description="Obtiene la ubicación actual aproximada basada en la dirección IP. Útil para saber dónde estás ubicado antes de buscar lugares cercanos.",
     )
-    def get_current_location() -> dict:
+    async def get_current_location() -> dict:
         """
         Get current approximate location based on IP address.
 
@@ -93,13 +624,13 @@ def register_place_handlers(mcp: FastMCP, container: DependencyContainer) -> Non
             Dictionary with location data including latitude, longitude, city, country, etc.
             Use this to get your current location before searching for nearby places.
         """
-        return geolocation_service.get_current_location()
+        return await geolocation_service.aget_current_location()
 
     @mcp.tool(
         name="geocode_location",
         description="Convierte un nombre de ciudad, dirección o lugar a coordenadas (latitud y longitud). Útil para obtener coordenadas de una ubicación antes de buscar lugares cercanos.",
     )
-    def geocode_location(
+    async def geocode_location(
         query: str, country_code: str = "py"
     ) -> dict:
         """
@@ -112,13 +643,20 @@ def register_place_handlers(mcp: FastMCP, container: DependencyContainer) -> Non
         Returns:
             Dictionary with location data including latitude, longitude, display_name, etc.
         """
-        return geolocation_service.geocode_location(query, country_code)
+        return await geolocation_service.ageocode_location(query, country_code)
 
     @mcp.tool(
         name="find_nearby_tourist_places",
-        description="Busca lugares turísticos cercanos automáticamente. Obtiene tu ubicación actual por IP y busca lugares dentro de un rango de distancia. Todo en una sola llamada.",
+        description="Busca lugares turísticos cercanos automáticamente. Obtiene tu ubicación actual por IP y busca lugares dentro de un rango de distancia. Todo en una sola llamada. Admite filtrar por dataset (ej: 'py' para Paraguay, 'de' para Alemania).",
     )
-    def find_nearby_tourist_places(max_distance_km: float = 100.0) -> dict:
+    async def find_nearby_tourist_places(
+        max_distance_km: float = 100.0,
+        dataset: str | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+        fields: List[str] | None = None,
+        include_table: bool = True,
+    ) -> dict:
         """
         Find nearby tourist places automatically using current IP location.
 
@@ -129,6 +667,11 @@ def register_place_handlers(mcp: FastMCP, container: DependencyContainer) -> Non
 
         Args:
             max_distance_km: Maximum distance in kilometers to search (default: 100.0 km).
+            dataset: Dataset tag to query (e.g. "py", "de"; default: all datasets).
+            offset: Index of the first place to return (default: 0).
+            limit: Maximum number of places to return (default: all).
+            fields: Place fields to include in `raw` (e.g. ["name", "city"]); `id` is always included.
+            include_table: Whether to include the formatted text table (default: True).
 
         Returns:
             Dictionary with:
@@ -137,7 +680,7 @@ def register_place_handlers(mcp: FastMCP, container: DependencyContainer) -> Non
             - error: If location could not be determined
         """
         # Get current location
-        location_data = geolocation_service.get_current_location()
+        location_data = await geolocation_service.aget_current_location()
 
         if not location_data.get("success"):
             return {
@@ -156,16 +699,28 @@ def register_place_handlers(mcp: FastMCP, container: DependencyContainer) -> Non
                 "location_data": location_data,
             }
 
-        # Get all places
-        all_places = place_repository.get_all()
+        catalog = catalog_registry.get_catalog()
+        scope = catalog.scope(dataset)
 
         # Filter places by distance
         places_with_distances = location_service.filter_places_by_distance(
-            all_places, latitude, longitude, max_distance_km
+            scope.places,
+            latitude,
+            longitude,
+            max_distance_km,
+            spatial_index=scope.spatial_index,
+            coordinates=scope.coordinates,
         )
 
         # Format results
-        places_result = place_formatter.format_with_distances(places_with_distances)
+        places_result = place_formatter.format_with_distances(
+            places_with_distances,
+            version=catalog.version,
+            offset=offset,
+            limit=limit,
+            fields=fields,
+            include_table=include_table,
+        )
 
         return {
             "success": True,
@@ -0,0 +1,121 @@
+"""Handlers for opt-in profiling of individual tool calls."""
+
+import logging
+
+import pydantic_core
+from fastmcp import FastMCP
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from fastmcp.tools.tool import ToolResult
+from mcp.types import CallToolRequestParams, TextContent
+
+from ..core.dependencies import DependencyContainer
+from ..services import MetricsRegistry, ToolProfiler
+
+logger = logging.getLogger(__name__)
+
+
+class ProfilingMiddleware(Middleware):
+    """
+    Profiles selected MCP tool calls with a `ToolProfiler`.
+
+    A call is profiled when its tool is selected by the configured mode
+    ("all" or a list of tool names) or when the caller passes the reserved
+    `_profile: true` argument, which is removed before the tool sees its
+    arguments. The report is returned in the result's `_profile` field when
+    the caller asked for it or no output directory is configured; otherwise it
+    is only written to the directory.
+    """
+
+    # Reserved argument requesting a profile of one call
+    ARGUMENT = "_profile"
+
+    def __init__(self, profiler: ToolProfiler, metrics: MetricsRegistry, mode: str):
+        """
+        Initialize the middleware.
+
+        Args:
+            profiler: Profiler the calls are run under.
+            metrics: Registry whose stage timings are included in the reports.
+            mode: "request", "all", or a comma-separated list of tool names.
+        """
+        self._profiler = profiler
+        self._metrics = metrics
+        self._profile_all = mode == "all"
+        self._tools = (
+            frozenset()
+            if mode in ("all", "request")
+            else frozenset(name.strip() for name in mode.split(",") if name.strip())
+        )
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[CallToolRequestParams],
+        call_next: CallNext[CallToolRequestParams, ToolResult],
+    ) -> ToolResult:
+        """Run a tool call under the profiler if it is selected."""
+        requested = False
+        arguments = context.message.arguments
+        if arguments and self.ARGUMENT in arguments:
+            arguments = dict(arguments)
+            requested = arguments.pop(self.ARGUMENT) is True
+            context = context.copy(
+                message=context.message.model_copy(update={"arguments": arguments})
+            )
+
+        tool = context.message.name
+        if not (requested or self._profile_all or tool in self._tools):
+            return await call_next(context)
+
+        session = self._profiler.start(tool)
+        if session is None:
+            logger.info("Not profiling %s: another tool call is being profiled", tool)
+            return await call_next(context)
+
+        with self._metrics.trace_stages() as stages:
+            try:
+                result = await call_next(context)
+            except Exception as e:
+                report = session.stop(stages, error=type(e).__name__)
+                logger.info("Profiled failed call of %s in %.1f ms", tool, report["wall_ms"])
+                raise
+        report = session.stop(stages)
+        logger.info(
+            "Profiled %s in %.1f ms%s",
+            tool,
+            report["wall_ms"],
+            f" (report: {report['file']})" if "file" in report else "",
+        )
+
+        if requested or self._profiler.output_dir is None:
+            return self._attach(result, report)
+        return result
+
+    @staticmethod
+    def _attach(result: ToolResult, report: dict) -> ToolResult:
+        """Return a copy of a tool result with the report in its `_profile` field."""
+        if not isinstance(result.structured_content, dict):
+            logger.warning("Cannot attach profile to %s: result has no structured content", report["tool"])
+            return result
+        structured = {**result.structured_content, "_profile": report}
+        text = pydantic_core.to_json(structured, fallback=str).decode()
+        return ToolResult(content=[TextContent(type="text", text=text)], structured_content=structured)
+
+
+def register_profiling_handlers(mcp: FastMCP, container: DependencyContainer) -> None:
+    """
+    Install the profiling middleware when profiling is enabled.
+
+    With profiling off (the default) nothing is installed, so tool calls pay
+    no profiling overhead at all. Register before the other handlers so
+    their middleware (e.g. metrics) runs inside the profiled call and
+    does not see the attached report.
+
+    Args:
+        mcp: FastMCP server instance.
+        container: Dependency container with required services.
+    """
+    mode = container.settings.profile
+    if mode in ("", "off", "0", "false", "no"):
+        return
+    mcp.add_middleware(ProfilingMiddleware(container.tool_profiler, container.metrics, mode))
+    logger.info("Tool call profiling enabled (mode: %s)", mode)
@@ -1,7 +1,11 @@
 """Models package - exports all models."""
 
+from .distance_origin import DistanceOrigin
+from .geo_point import GeoPoint
 from .place import Place
 
 __all__ = [
+    "DistanceOrigin",
+    "GeoPoint",
     "Place",
 ]
\ No newline at end of file
@@ -0,0 +1,6 @@
+from pydantic import BaseModel
+
+class DistanceOrigin(BaseModel):
+    latitude: float
+    longitude: float
+    max_distance_km: float
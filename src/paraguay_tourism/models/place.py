@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import BaseModel
 
 class Place(BaseModel):
@@ -8,4 +10,5 @@ class Place(BaseModel):
     lat: float
     lng: float
     city: str
-    region: str
\ No newline at end of file
+    region: str
+    dataset: Optional[str] = None
@@ -1,8 +1,27 @@
 """Repositories package - data access layer."""
 
+from .catalog_registry import CatalogRegistry, CatalogSet
+from .catalog_snapshot import CatalogSnapshot
+from .coordinate_arrays import CoordinateArrays
+from .place_catalog import PlaceCatalog
+from .place_reader import PlaceStreamReader, RecordError
 from .place_repository import PlaceRepository
+from .place_store import PlaceLike, PlaceRow, PlaceStore
+from .spatial_index import SpatialIndex
+from .text_index import TextIndex
 
 __all__ = [
+    "CatalogRegistry",
+    "CatalogSet",
+    "CatalogSnapshot",
+    "CoordinateArrays",
+    "PlaceCatalog",
+    "PlaceLike",
     "PlaceRepository",
+    "PlaceRow",
+    "PlaceStore",
+    "PlaceStreamReader",
+    "RecordError",
+    "SpatialIndex",
+    "TextIndex",
 ]
-
@@ -0,0 +1,297 @@
+"""Registry of place datasets (e.g. one per country) served as one catalog."""
+
+import itertools
+import threading
+import time
+from array import array
+from functools import cached_property
+from pathlib import Path
+from typing import Dict, Mapping, Optional, Tuple
+
+from .coordinate_arrays import CoordinateArrays
+from .place_catalog import PlaceCatalog
+from .place_reader import RecordError
+from .place_repository import PlaceRepository
+from .place_store import PlaceRow
+from .spatial_index import SpatialIndex
+from .text_index import TextIndex
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+DATA_DIR = PROJECT_ROOT / "data"
+
+
+class CatalogSet:
+    """
+    Immutable union of the current catalog of every dataset.
+
+    Exposes the same read API as `PlaceCatalog` over all datasets, and
+    `scope()` to restrict a query to one of them. Each dataset keeps its own
+    indexes (by id, city, region and category, coordinates and spatial grid),
+    so a scoped query never touches another dataset's places; the combined
+    indexes are only built when an unscoped query needs them.
+    """
+
+    def __init__(self, catalogs: Mapping[str, PlaceCatalog], version: int):
+        """
+        Initialize the catalog set.
+
+        Args:
+            catalogs: Catalog of every dataset, keyed by dataset tag, in priority order.
+            version: Monotonically increasing version (changes whenever any dataset reloads).
+        """
+        self._catalogs = dict(catalogs)
+        self._version = version
+        self._loaded_at = time.time()
+
+    @property
+    def version(self) -> int:
+        """Catalog set version, incremented whenever a dataset is reloaded."""
+        return self._version
+
+    @property
+    def signature(self) -> Tuple[Tuple[str, Tuple[int, int]], ...]:
+        """(dataset tag, data file signature) of every dataset."""
+        return tuple((tag, catalog.signature) for tag, catalog in self._catalogs.items())
+
+    @property
+    def loaded_at(self) -> float:
+        """Unix timestamp of when the set was assembled."""
+        return self._loaded_at
+
+    @property
+    def datasets(self) -> Tuple[str, ...]:
+        """Dataset tags, in priority order."""
+        return tuple(self._catalogs)
+
+    @property
+    def dataset(self) -> None:
+        """Dataset tag of a single-dataset catalog; None, as the set spans every dataset."""
+        return None
+
+    @property
+    def errors(self) -> Tuple[RecordError, ...]:
+        """Malformed records skipped while loading any dataset (see `PlaceCatalog.errors`)."""
+        return tuple(itertools.chain.from_iterable(
+            catalog.errors for catalog in self._catalogs.values()
+        ))
+
+    @property
+    def error_count(self) -> int:
+        """Total number of malformed records skipped while loading."""
+        return sum(catalog.error_count for catalog in self._catalogs.values())
+
+    def partition(self, dataset: str) -> PlaceCatalog:
+        """
+        Catalog of a single dataset.
+
+        Args:
+            dataset: Dataset tag (case-insensitive, e.g. "py").
+
+        Returns:
+            The dataset's PlaceCatalog.
+
+        Raises:
+            ValueError: If the dataset is unknown.
+        """
+        catalog = self._catalogs.get(dataset.strip().lower())
+        if catalog is None:
+            raise ValueError(
+                f"Dataset desconocido: {dataset}. Disponibles: {', '.join(self._catalogs)}"
+            )
+        return catalog
+
+    def partitions(self) -> Tuple[PlaceCatalog, ...]:
+        """Catalog of every dataset, in priority order."""
+        return tuple(self._catalogs.values())
+
+    def scope(self, dataset: Optional[str]) -> "CatalogSet | PlaceCatalog":
+        """
+        Restrict queries to one dataset.
+
+        Args:
+            dataset: Dataset tag, or None for every dataset.
+
+        Returns:
+            The dataset's PlaceCatalog, or this set when `dataset` is None.
+
+        Raises:
+            ValueError: If the dataset is unknown.
+        """
+        if dataset is None:
+            return self
+        return self.partition(dataset)
+
+    @cached_property
+    def places(self) -> Tuple[PlaceRow, ...]:
+        """All places, dataset by dataset in priority order."""
+        return tuple(itertools.chain.from_iterable(
+            catalog.places for catalog in self._catalogs.values()
+        ))
+
+    @cached_property
+    def coordinates(self) -> CoordinateArrays:
+        """Coordinate columns of every dataset, aligned with `places`."""
+        lat = array("d")
+        lng = array("d")
+        for catalog in self._catalogs.values():
+            # Raw float64 copies (columns may be arrays or memory-mapped views)
+            lat.frombytes(memoryview(catalog.store.lat).cast("B"))
+            lng.frombytes(memoryview(catalog.store.lng).cast("B"))
+        return CoordinateArrays.from_columns(lat, lng)
+
+    @cached_property
+    def spatial_index(self) -> SpatialIndex:
+        """Grid index over the coordinates of every dataset, aligned with `places`."""
+        return SpatialIndex(itertools.chain.from_iterable(
+            catalog.store.coordinates() for catalog in self._catalogs.values()
+        ))
+
+    @cached_property
+    def text_index(self) -> TextIndex:
+        """Full-text index over the places of every dataset, aligned with `places`."""
+        return TextIndex(self.places)
+
+    def get(self, place_id: str) -> Optional[PlaceRow]:
+        """Look up a place by its exact ID (the first dataset holding it wins)."""
+        for catalog in self._catalogs.values():
+            place = catalog.get(place_id)
+            if place is not None:
+                return place
+        return None
+
+    def by_city(self, city: str) -> Tuple[PlaceRow, ...]:
+        """Places in a city (accent- and case-insensitive), dataset by dataset."""
+        return self._merge(PlaceCatalog.by_city, city)
+
+    def by_region(self, region: str) -> Tuple[PlaceRow, ...]:
+        """Places in a region (accent- and case-insensitive), dataset by dataset."""
+        return self._merge(PlaceCatalog.by_region, region)
+
+    def by_category(self, category: str) -> Tuple[PlaceRow, ...]:
+        """Places in a category (accent- and case-insensitive), dataset by dataset."""
+        return self._merge(PlaceCatalog.by_category, category)
+
+    def _merge(self, lookup, value: str) -> Tuple[PlaceRow, ...]:
+        """Concatenate a per-dataset index lookup over every dataset."""
+        return tuple(itertools.chain.from_iterable(
+            lookup(catalog, value) for catalog in self._catalogs.values()
+        ))
+
+    def __len__(self) -> int:
+        return sum(len(catalog) for catalog in self._catalogs.values())
+
+
+class CatalogRegistry:
+    """
+    Loads several place datasets and serves them as one `CatalogSet`.
+
+    Each dataset is a data file with its own `PlaceRepository` (and so its
+    own hot reload and compiled snapshot), tagged with a short name, by
+    convention its ISO country code ("py", "de"). Places report their tag in
+    the `dataset` field. A new `CatalogSet` version is assembled whenever any
+    dataset reloads.
+    """
+
+    # Datasets served when none are configured (first = highest priority)
+    DEFAULT_DATASETS = {
+        "py": DATA_DIR / "places.json",
+        "de": DATA_DIR / "places_germany.json",
+    }
+
+    def __init__(self, datasets: Mapping[str, str | Path] | None = None):
+        """
+        Initialize the registry.
+
+        Args:
+            datasets: Data file of every dataset, keyed by tag, in priority order
+                (an ID present in several datasets resolves to the first one).
+                Relative paths are resolved against the project root. If None,
+                uses `DEFAULT_DATASETS`.
+
+        Raises:
+            ValueError: If there are no datasets, or a tag is empty or repeated.
+        """
+        if datasets is None:
+            datasets = self.DEFAULT_DATASETS
+        if not datasets:
+            raise ValueError("At least one dataset is required")
+
+        self._repositories: Dict[str, PlaceRepository] = {}
+        for tag, path in datasets.items():
+            key = tag.strip().lower()
+            if not key:
+                raise ValueError("Dataset tags must not be empty")
+            if key in self._repositories:
+                raise ValueError(f"Duplicate dataset tag: {key}")
+            path = Path(path)
+            if not path.is_absolute():
+                path = PROJECT_ROOT / path
+            self._repositories[key] = PlaceRepository(path, dataset=key)
+
+        self._catalog: Optional[CatalogSet] = None
+        self._lock = threading.Lock()
+        self._versions = itertools.count(1)
+
+    @property
+    def datasets(self) -> Tuple[str, ...]:
+        """Dataset tags, in priority order."""
+        return tuple(self._repositories)
+
+    def repository(self, dataset: str) -> PlaceRepository:
+        """
+        Repository of a single dataset.
+
+        Args:
+            dataset: Dataset tag.
+
+        Returns:
+            The dataset's PlaceRepository.
+
+        Raises:
+            KeyError: If the dataset is unknown.
+        """
+        return self._repositories[dataset.strip().lower()]
+
+    def get_catalog(self) -> CatalogSet:
+        """
+        Retrieve the current catalog set, reassembling it if any dataset reloaded.
+
+        Returns:
+            CatalogSet over the current catalog of every dataset.
+
+        Raises:
+            FileNotFoundError: If a data file doesn't exist.
+            ValueError: If the data is invalid.
+        """
+        catalogs = {tag: repository.get_catalog() for tag, repository in self._repositories.items()}
+        current = self._catalog
+        if current is not None and self._is_current(current, catalogs):
+            return current
+
+        with self._lock:
+            # Another thread may have reassembled the set while we were waiting
+            current = self._catalog
+            if current is None or not self._is_current(current, catalogs):
+                current = CatalogSet(catalogs, version=next(self._versions))
+                self._catalog = current
+            return current
+
+    def reload(self) -> CatalogSet:
+        """
+        Force a reload of every dataset.
+
+        Returns:
+            The freshly assembled CatalogSet.
+
+        Raises:
+            FileNotFoundError: If a data file doesn't exist.
+            ValueError: If the data is invalid.
+        """
+        for repository in self._repositories.values():
+            repository.reload()
+        return self.get_catalog()
+
+    @staticmethod
+    def _is_current(catalog_set: CatalogSet, catalogs: Mapping[str, PlaceCatalog]) -> bool:
+        """Whether a set was assembled from exactly these dataset catalogs."""
+        return all(catalog_set.partition(tag) is catalog for tag, catalog in catalogs.items())
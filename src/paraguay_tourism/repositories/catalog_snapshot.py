@@ -0,0 +1,276 @@
+"""Compiled, memory-mappable catalog snapshots."""
+
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import time
+from array import array
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .place_catalog import PlaceCatalog
+from .place_reader import RecordError
+from .place_store import PlaceStore
+
+
+class TextColumn:
+    """Read-only sequence of strings stored as one UTF-8 blob plus end offsets."""
+
+    __slots__ = ("_blob", "_offsets")
+
+    def __init__(self, blob: memoryview, offsets: Sequence[int]):
+        """
+        Wrap an encoded column.
+
+        Args:
+            blob: Concatenated UTF-8 encoded strings.
+            offsets: `len + 1` byte offsets into `blob`; string i spans
+                `offsets[i]:offsets[i + 1]`.
+        """
+        self._blob = blob
+        self._offsets = offsets
+
+    def __getitem__(self, position: int) -> str:
+        if position < 0:
+            position += len(self)
+        return str(self._blob[self._offsets[position]:self._offsets[position + 1]], "utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        blob = self._blob
+        for start, end in zip(self._offsets, self._offsets[1:]):
+            yield str(blob[start:end], "utf-8")
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+
+class CatalogSnapshot:
+    """
+    Binary, versioned snapshot of a compiled place catalog.
+
+    Layout (little- or big-endian as recorded in the metadata, always the
+    native order of the machine that built it):
+
+    - a fixed header: magic, format version, the source data file's
+      (mtime_ns, size) signature and the metadata length;
+    - JSON metadata: place count, interned string table, column directory,
+      prebuilt group indexes and load errors;
+    - 8-byte aligned columns: UTF-8 text blobs with uint64 offsets, uint32
+      string-table codes, float64 coordinates and uint32 group positions.
+
+    Loading maps the file read-only and wraps the columns in memoryviews, so
+    it costs milliseconds regardless of catalog size. A snapshot is only used
+    when its recorded signature matches the current data file.
+    """
+
+    MAGIC = b"PTCATLOG"
+    FORMAT_VERSION = 1
+    SUFFIX = ".catalog"
+
+    # magic, format version, reserved, source mtime_ns, source size, metadata length
+    _HEADER = struct.Struct("<8sIIqqQ")
+    _ALIGNMENT = 8
+
+    def __init__(
+        self,
+        store: PlaceStore,
+        groups: Dict[str, Dict[str, Sequence[int]]],
+        errors: Tuple[RecordError, ...],
+        error_count: int,
+    ):
+        """Loaded snapshot contents (see `load`)."""
+        self.store = store
+        self.groups = groups
+        self.errors = errors
+        self.error_count = error_count
+
+    @classmethod
+    def path_for(cls, data_path: str | Path) -> Path:
+        """Default snapshot path next to a data file (e.g. places.json -> places.catalog)."""
+        return Path(data_path).with_suffix(cls.SUFFIX)
+
+    @classmethod
+    def write(
+        cls,
+        path: str | Path,
+        store: PlaceStore,
+        signature: Tuple[int, int],
+        errors: Sequence[RecordError] = (),
+        error_count: int = 0,
+    ) -> int:
+        """
+        Compile a store into a snapshot file (written atomically).
+
+        Args:
+            path: Output path.
+            store: Places to write.
+            signature: (mtime_ns, size) of the data file the store was read from.
+            errors: Malformed records skipped while reading the data file.
+            error_count: Total number of skipped records.
+
+        Returns:
+            Size of the written file in bytes.
+        """
+        chunks: List[bytes] = []
+        columns: Dict[str, Dict] = {}
+        size = 0
+
+        def add(name: str, typecode: str, data: bytes) -> None:
+            nonlocal size
+            padding = -size % cls._ALIGNMENT
+            chunks.append(b"\0" * padding)
+            size += padding
+            columns[name] = {
+                "offset": size,
+                "length": len(data),
+                "typecode": typecode,
+                "itemsize": array(typecode).itemsize,
+            }
+            chunks.append(data)
+            size += len(data)
+
+        for column in PlaceStore.TEXT_COLUMNS:
+            encoded = [value.encode("utf-8") for value in store.text(column)]
+            offsets = array("Q", [0])
+            for value in encoded:
+                offsets.append(offsets[-1] + len(value))
+            add(f"{column}_offsets", "Q", offsets.tobytes())
+            add(f"{column}_text", "B", b"".join(encoded))
+        for column in PlaceStore.CODE_COLUMNS:
+            add(f"{column}_codes", "I", array("I", store.codes(column)).tobytes())
+        add("lat", "d", array("d", store.lat).tobytes())
+        add("lng", "d", array("d", store.lng).tobytes())
+
+        # Group indexes: positions for every normalized value, stored back to back
+        positions = array("I")
+        groups: Dict[str, Dict[str, List[int]]] = {}
+        for column in PlaceStore.CODE_COLUMNS:
+            groups[column] = {}
+            for key, members in PlaceCatalog.group_positions(store, column).items():
+                groups[column][key] = [len(positions), len(members)]
+                positions.extend(members)
+        add("group_positions", "I", positions.tobytes())
+
+        metadata = json.dumps({
+            "count": len(store),
+            "byteorder": sys.byteorder,
+            "built_at": time.time(),
+            "strings": store.strings,
+            "columns": columns,
+            "groups": groups,
+            "errors": [error.to_dict() for error in errors],
+            "error_count": error_count,
+        }, ensure_ascii=False).encode("utf-8")
+
+        header = cls._HEADER.pack(
+            cls.MAGIC, cls.FORMAT_VERSION, 0, signature[0], signature[1], len(metadata)
+        )
+        prefix = header + metadata
+        prefix += b"\0" * (-len(prefix) % cls._ALIGNMENT)
+
+        path = Path(path)
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(prefix)
+                for chunk in chunks:
+                    f.write(chunk)
+            # mkstemp creates owner-only files; snapshots are as readable as the data
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return len(prefix) + size
+
+    @classmethod
+    def load(
+        cls,
+        path: str | Path,
+        signature: Tuple[int, int],
+        dataset: Optional[str] = None,
+    ) -> Optional["CatalogSnapshot"]:
+        """
+        Memory-map a snapshot if it is current.
+
+        Args:
+            path: Snapshot path.
+            signature: Current (mtime_ns, size) of the data file.
+            dataset: Tag of the dataset the places belong to.
+
+        Returns:
+            Loaded snapshot, or None if the file is missing, stale (built from a
+            different version of the data file) or from an incompatible build.
+
+        Raises:
+            ValueError: If the snapshot is corrupt.
+        """
+        try:
+            f = open(path, "rb")
+        except FileNotFoundError:
+            return None
+
+        with f:
+            header = f.read(cls._HEADER.size)
+            if len(header) < cls._HEADER.size:
+                raise ValueError("Invalid catalog snapshot: truncated header")
+            magic, version, _, mtime_ns, size, metadata_length = cls._HEADER.unpack(header)
+            if magic != cls.MAGIC:
+                raise ValueError("Invalid catalog snapshot: bad magic")
+            if version != cls.FORMAT_VERSION or (mtime_ns, size) != tuple(signature):
+                return None
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            metadata = json.loads(mapped[cls._HEADER.size:cls._HEADER.size + metadata_length])
+        except ValueError as e:
+            raise ValueError(f"Invalid catalog snapshot metadata: {e}") from None
+        if metadata.get("byteorder") != sys.byteorder:
+            return None
+
+        data_start = cls._HEADER.size + metadata_length
+        data_start += -data_start % cls._ALIGNMENT
+        view = memoryview(mapped)
+
+        def column(name: str) -> memoryview:
+            spec = metadata["columns"][name]
+            if array(spec["typecode"]).itemsize != spec["itemsize"]:
+                raise ValueError(f"Invalid catalog snapshot: unsupported {name} item size")
+            start = data_start + spec["offset"]
+            end = start + spec["length"]
+            if end > len(view):
+                raise ValueError(f"Invalid catalog snapshot: {name} column truncated")
+            return view[start:end].cast(spec["typecode"])
+
+        try:
+            count = metadata["count"]
+            text = {
+                name: TextColumn(column(f"{name}_text"), column(f"{name}_offsets"))
+                for name in PlaceStore.TEXT_COLUMNS
+            }
+            codes = {name: column(f"{name}_codes") for name in PlaceStore.CODE_COLUMNS}
+            lat, lng = column("lat"), column("lng")
+            if any(len(values) != count for values in (*text.values(), *codes.values(), lat, lng)):
+                raise ValueError("Invalid catalog snapshot: column lengths differ")
+
+            positions = column("group_positions")
+            groups = {
+                name: {
+                    key: positions[start:start + length]
+                    for key, (start, length) in metadata["groups"][name].items()
+                }
+                for name in PlaceStore.CODE_COLUMNS
+            }
+            errors = tuple(
+                RecordError(error["line"], error["offset"], error["error"])
+                for error in metadata["errors"]
+            )
+            store = PlaceStore.from_columns(
+                text, codes, metadata["strings"], lat, lng, dataset=dataset
+            )
+            return cls(store, groups, errors, metadata["error_count"])
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Invalid catalog snapshot metadata: {e!r}") from None
@@ -0,0 +1,74 @@
+"""Contiguous coordinate arrays for vectorized distance calculations."""
+
+import importlib.util
+import math
+from array import array
+from typing import Sequence, Tuple
+
+# NumPy is imported when the first columns are built, not at start-up
+NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
+
+
+class CoordinateArrays:
+    """
+    Place coordinates stored column-wise, in radians, with cos(lat) precomputed.
+
+    With NumPy installed the columns are contiguous float64 ndarrays so distances
+    to every place can be computed in one batched pass. Without NumPy they are
+    `array('d')` columns used by the pure-Python fallback.
+    """
+
+    def __init__(self, coordinates: Sequence[Tuple[float, float]], use_numpy: bool = True):
+        """
+        Build the coordinate columns.
+
+        Args:
+            coordinates: (lat, lng) pairs in decimal degrees, in catalog order.
+            use_numpy: Use NumPy arrays when available (set False to force the fallback).
+        """
+        self._build(
+            [lat for lat, _ in coordinates],
+            [lng for _, lng in coordinates],
+            use_numpy,
+        )
+
+    @classmethod
+    def from_columns(
+        cls, lats: Sequence[float], lngs: Sequence[float], use_numpy: bool = True
+    ) -> "CoordinateArrays":
+        """
+        Build the coordinate columns from separate latitude and longitude columns.
+
+        Args:
+            lats: Latitudes in decimal degrees, in catalog order (e.g. an `array('d')`).
+            lngs: Longitudes in decimal degrees, in catalog order.
+            use_numpy: Use NumPy arrays when available (set False to force the fallback).
+
+        Returns:
+            New CoordinateArrays.
+        """
+        arrays = cls.__new__(cls)
+        arrays._build(lats, lngs, use_numpy)
+        return arrays
+
+    def _build(self, lats: Sequence[float], lngs: Sequence[float], use_numpy: bool) -> None:
+        """Convert degree columns to radians and precompute cos(lat)."""
+        self._vectorized = use_numpy and NUMPY_AVAILABLE
+        if self._vectorized:
+            import numpy as np
+
+            self.lat_rad = np.ascontiguousarray(np.radians(np.asarray(lats, dtype=np.float64)))
+            self.lng_rad = np.ascontiguousarray(np.radians(np.asarray(lngs, dtype=np.float64)))
+            self.cos_lat = np.cos(self.lat_rad)
+        else:
+            self.lat_rad = array("d", (math.radians(lat) for lat in lats))
+            self.lng_rad = array("d", (math.radians(lng) for lng in lngs))
+            self.cos_lat = array("d", (math.cos(lat) for lat in self.lat_rad))
+
+    @property
+    def vectorized(self) -> bool:
+        """True when the columns are NumPy arrays."""
+        return self._vectorized
+
+    def __len__(self) -> int:
+        return len(self.lat_rad)
@@ -0,0 +1,205 @@
+"""In-memory snapshot of the place catalog."""
+
+import time
+from functools import cached_property
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..models import Place
+from ..utils import normalize_key
+from .coordinate_arrays import CoordinateArrays
+from .place_reader import RecordError
+from .place_store import PlaceRow, PlaceStore
+from .spatial_index import SpatialIndex
+from .text_index import TextIndex
+
+
+class PlaceCatalog:
+    """
+    Immutable snapshot of all places loaded from the data source.
+
+    Places are kept in a columnar `PlaceStore` and exposed as `PlaceRow`
+    views; no Pydantic model is kept per place. Row views, hash indexes
+    (by id, normalized city, region and category), coordinate arrays, the
+    spatial index and the full-text index are built on first use and then reused, so creating a
+    snapshot is cheap and lookups cost the same regardless of catalog size.
+    """
+
+    def __init__(
+        self,
+        places: PlaceStore | Iterable[Place],
+        version: int,
+        signature: Tuple[int, int],
+        errors: Sequence[RecordError] = (),
+        error_count: Optional[int] = None,
+        groups: Optional[Dict[str, Dict[str, Sequence[int]]]] = None,
+    ):
+        """
+        Initialize the catalog snapshot.
+
+        Args:
+            places: Columnar store, or validated Place models (consumed one at a
+                time), in data file order.
+            version: Monotonically increasing catalog version (changes on every reload).
+            signature: (mtime_ns, size) of the data file the snapshot was loaded from.
+            errors: Malformed records skipped while loading (possibly truncated).
+            error_count: Total number of skipped records (defaults to `len(errors)`).
+            groups: Precomputed `group_positions()` per column (e.g. from a
+                compiled snapshot); computed on first use otherwise.
+        """
+        self._store = places if isinstance(places, PlaceStore) else PlaceStore(places)
+        self._groups = dict(groups or {})
+        self._errors = tuple(errors)
+        self._error_count = len(self._errors) if error_count is None else error_count
+        self._version = version
+        self._signature = signature
+        self._loaded_at = time.time()
+
+    @staticmethod
+    def group_positions(store: PlaceStore, column: str) -> Dict[str, List[int]]:
+        """
+        Group store positions by the normalized value of an interned column.
+
+        Args:
+            store: Place store.
+            column: "category", "city" or "region".
+
+        Returns:
+            Mapping of normalized value (see `normalize_key`) to positions, in order.
+        """
+        # Each distinct value is normalized once, not once per place
+        keys: Dict[int, str] = {}
+        groups: Dict[str, List[int]] = {}
+        for position, code in enumerate(store.codes(column)):
+            key = keys.get(code)
+            if key is None:
+                key = keys[code] = normalize_key(store.string(code))
+            groups.setdefault(key, []).append(position)
+        return groups
+
+    @cached_property
+    def places(self) -> Tuple[PlaceRow, ...]:
+        """All places in the catalog, in data file order."""
+        return self._store.rows()
+
+    @property
+    def version(self) -> int:
+        """Catalog version, incremented on every reload."""
+        return self._version
+
+    @property
+    def signature(self) -> Tuple[int, int]:
+        """(mtime_ns, size) of the source data file."""
+        return self._signature
+
+    @property
+    def loaded_at(self) -> float:
+        """Unix timestamp of when the snapshot was loaded."""
+        return self._loaded_at
+
+    @property
+    def errors(self) -> Tuple[RecordError, ...]:
+        """Malformed records skipped while loading (the first ones; see `error_count`)."""
+        return self._errors
+
+    @property
+    def error_count(self) -> int:
+        """Total number of malformed records skipped while loading."""
+        return self._error_count
+
+    @property
+    def dataset(self) -> Optional[str]:
+        """Tag of the dataset the places belong to."""
+        return self._store.dataset
+
+    @property
+    def store(self) -> PlaceStore:
+        """Columnar storage backing the catalog rows."""
+        return self._store
+
+    @cached_property
+    def coordinates(self) -> CoordinateArrays:
+        """Coordinate columns for vectorized distance calculations, built on first use."""
+        return CoordinateArrays.from_columns(self._store.lat, self._store.lng)
+
+    @cached_property
+    def spatial_index(self) -> SpatialIndex:
+        """Grid index over place coordinates, built on first use."""
+        return SpatialIndex(self._store.coordinates())
+
+    @cached_property
+    def text_index(self) -> TextIndex:
+        """Full-text index over place names, descriptions, categories and cities, built on first use."""
+        return TextIndex(self.places)
+
+    def partitions(self) -> Tuple["PlaceCatalog", ...]:
+        """Single-dataset catalogs making up this catalog (just itself)."""
+        return (self,)
+
+    def positions(self, column: str, value: str) -> Sequence[int]:
+        """
+        Store positions of the places whose interned column matches a value.
+
+        Args:
+            column: "category", "city" or "region".
+            value: Value to match (accent- and case-insensitive).
+
+        Returns:
+            Positions in ascending order (empty if nothing matches).
+        """
+        return self._group_positions(column).get(normalize_key(value), ())
+
+    def get(self, place_id: str) -> Optional[PlaceRow]:
+        """Look up a place by its exact ID."""
+        return self._by_id.get(place_id)
+
+    @cached_property
+    def _by_id(self) -> Dict[str, PlaceRow]:
+        """Index by place ID, built on first use."""
+        by_id: Dict[str, PlaceRow] = {}
+        for place_id, place in zip(self._store.text("id"), self.places):
+            # First occurrence wins, matching a linear scan over the data file
+            by_id.setdefault(place_id, place)
+        return by_id
+
+    @cached_property
+    def _by_city(self) -> Dict[str, Tuple[PlaceRow, ...]]:
+        """Index by normalized city, built on first use."""
+        return self._group_by("city")
+
+    @cached_property
+    def _by_region(self) -> Dict[str, Tuple[PlaceRow, ...]]:
+        """Index by normalized region, built on first use."""
+        return self._group_by("region")
+
+    @cached_property
+    def _by_category(self) -> Dict[str, Tuple[PlaceRow, ...]]:
+        """Index by normalized category, built on first use."""
+        return self._group_by("category")
+
+    def by_city(self, city: str) -> Tuple[PlaceRow, ...]:
+        """Places in a city (accent- and case-insensitive), in data file order."""
+        return self._by_city.get(normalize_key(city), ())
+
+    def by_region(self, region: str) -> Tuple[PlaceRow, ...]:
+        """Places in a region (accent- and case-insensitive), in data file order."""
+        return self._by_region.get(normalize_key(region), ())
+
+    def by_category(self, category: str) -> Tuple[PlaceRow, ...]:
+        """Places in a category (accent- and case-insensitive), in data file order."""
+        return self._by_category.get(normalize_key(category), ())
+
+    def _group_by(self, column: str) -> Dict[str, Tuple[PlaceRow, ...]]:
+        """Build a normalized-key index over an interned column of the store."""
+        groups = self._group_positions(column)
+        places = self.places
+        return {key: tuple(places[position] for position in positions) for key, positions in groups.items()}
+
+    def _group_positions(self, column: str) -> Dict[str, Sequence[int]]:
+        """Precomputed or lazily computed `group_positions()` of a column."""
+        groups = self._groups.get(column)
+        if groups is None:
+            groups = self._groups[column] = self.group_positions(self._store, column)
+        return groups
+
+    def __len__(self) -> int:
+        return len(self._store)
@@ -0,0 +1,282 @@
+"""Streaming reader for place data files (JSON arrays and JSON Lines)."""
+
+import json
+import re
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, TextIO, Tuple
+
+from pydantic import ValidationError
+
+from ..models import Place
+
+# Start of the next top-level object in a pretty-printed or one-per-line array,
+# used to resynchronize after a syntax error
+_RESYNC = re.compile(r"\n[ \t\r]*\{")
+_WHITESPACE = " \t\r\n"
+_NON_WHITESPACE = re.compile(r"[^ \t\r\n]")
+
+
+class RecordError:
+    """A malformed record skipped while loading, with its position in the file."""
+
+    __slots__ = ("line", "offset", "message")
+
+    def __init__(self, line: int, offset: int, message: str):
+        self.line = line
+        self.offset = offset
+        self.message = message
+
+    def to_dict(self) -> Dict:
+        """Dictionary representation (line, offset, error)."""
+        return {"line": self.line, "offset": self.offset, "error": self.message}
+
+    def __repr__(self) -> str:
+        return f"RecordError(line={self.line}, offset={self.offset}, message={self.message!r})"
+
+
+class PlaceStreamReader:
+    """
+    Read and validate places one record at a time.
+
+    Supports JSON Lines (one object per line; `.jsonl` / `.ndjson`, or any file
+    whose first character is `{`) and JSON arrays, which are parsed
+    incrementally in fixed-size chunks. Memory use is bounded by the chunk size
+    plus the largest single record, not by the file size.
+
+    Malformed records (invalid JSON, non-objects, failed validation) are
+    skipped and reported in `errors` with their 1-based line and character
+    offset. After a syntax error inside an array, reading resumes at the next
+    line that starts an object.
+    """
+
+    JSON_LINES_SUFFIXES = (".jsonl", ".ndjson")
+
+    # Characters read per chunk when parsing arrays
+    CHUNK_SIZE = 64 * 1024
+
+    # Records longer than this (in characters) are reported and skipped
+    MAX_RECORD_CHARS = 1024 * 1024
+
+    # Errors kept in `errors`; further errors are only counted
+    MAX_REPORTED_ERRORS = 100
+
+    # Characters that must follow a decode error for it to be treated as a syntax
+    # error rather than a value cut off by the chunk boundary (longest literal: -Infinity)
+    _SYNTAX_LOOKAHEAD = 16
+
+    def __init__(self, path: str | Path):
+        """
+        Initialize the reader.
+
+        Args:
+            path: Path to the data file.
+        """
+        self._path = Path(path)
+        self._decoder = json.JSONDecoder()
+        self.errors: List[RecordError] = []
+        self.error_count = 0
+
+    def __iter__(self) -> Iterator[Place]:
+        """
+        Yield validated places in file order.
+
+        Raises:
+            ValueError: If the file is neither a JSON array nor JSON Lines.
+        """
+        with open(self._path, "r", encoding="utf-8-sig") as f:
+            if self._path.suffix.lower() in self.JSON_LINES_SUFFIXES:
+                records = self._iter_json_lines(f)
+            else:
+                first = self._peek(f)
+                if first == "[":
+                    records = self._iter_json_array(f)
+                elif first == "{":
+                    records = self._iter_json_lines(f)
+                else:
+                    raise ValueError("Invalid data format: expected a list")
+
+            for line, offset, record in records:
+                place = self._validate(line, offset, record)
+                if place is not None:
+                    yield place
+
+    def _validate(self, line: int, offset: int, record: object) -> Optional[Place]:
+        """Build a Place from a decoded record, reporting invalid ones."""
+        if not isinstance(record, dict):
+            self._report(line, offset, f"expected an object, got {type(record).__name__}")
+            return None
+        try:
+            return Place(**record)
+        except ValidationError as e:
+            details = "; ".join(
+                f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+                for error in e.errors()
+            )
+            self._report(line, offset, f"invalid place: {details}")
+            return None
+
+    def _report(self, line: int, offset: int, message: str) -> None:
+        self.error_count += 1
+        if len(self.errors) < self.MAX_REPORTED_ERRORS:
+            self.errors.append(RecordError(line, offset, message))
+
+    @staticmethod
+    def _peek(f: TextIO) -> str:
+        """First non-whitespace character of the file ("" if empty); rewinds the file."""
+        while True:
+            chunk = f.read(4096)
+            if not chunk:
+                f.seek(0)
+                return ""
+            stripped = chunk.lstrip(_WHITESPACE)
+            if stripped:
+                f.seek(0)
+                return stripped[0]
+
+    def _iter_json_lines(self, f: TextIO) -> Iterator[Tuple[int, int, object]]:
+        """Decode one record per non-blank line."""
+        offset = 0
+        for line_number, line in enumerate(f, start=1):
+            line_offset = offset
+            offset += len(line)
+            text = line.strip(_WHITESPACE)
+            if not text:
+                continue
+            if len(text) > self.MAX_RECORD_CHARS:
+                self._report(line_number, line_offset, "record too large")
+                continue
+            try:
+                record = json.loads(text)
+            except json.JSONDecodeError as e:
+                self._report(line_number, line_offset, f"invalid JSON: {e.msg}")
+                continue
+            yield line_number, line_offset, record
+
+    def _iter_json_array(self, f: TextIO) -> Iterator[Tuple[int, int, object]]:
+        """Decode the elements of a top-level JSON array incrementally."""
+        stream = _ChunkedText(f, self.CHUNK_SIZE)
+        if not stream.skip_whitespace() or stream.current() != "[":
+            raise ValueError("Invalid data format: expected a list")
+        stream.pos += 1
+
+        while stream.skip_whitespace():
+            char = stream.current()
+            if char == "]":
+                return
+            if char == ",":
+                stream.pos += 1
+                continue
+
+            line, offset = stream.location()
+            try:
+                record = self._decode_next(stream)
+            except (json.JSONDecodeError, _RecordTooLarge) as e:
+                message = "record too large" if isinstance(e, _RecordTooLarge) else f"invalid JSON: {e.msg}"
+                self._report(line, offset, message)
+                if not stream.resync():
+                    return
+                continue
+            yield line, offset, record
+
+        line, offset = stream.location()
+        self._report(line, offset, "invalid JSON: unterminated array")
+
+    def _decode_next(self, stream: "_ChunkedText") -> object:
+        """Decode the value at the stream position, reading more data as needed."""
+        while True:
+            try:
+                record, end = self._decoder.raw_decode(stream.buffer, stream.pos)
+            except json.JSONDecodeError as e:
+                # The value may just be cut off at the end of the buffer. An error
+                # well before the end is a genuine syntax error, except for an
+                # unterminated string, which may span several chunks.
+                lookahead = len(stream.buffer) - e.pos
+                if stream.eof or (
+                    lookahead > self._SYNTAX_LOOKAHEAD and not e.msg.startswith("Unterminated string")
+                ):
+                    raise
+                if stream.pending() > self.MAX_RECORD_CHARS:
+                    raise _RecordTooLarge() from None
+                stream.fill()
+                continue
+            # A number or literal touching the end of the buffer may continue
+            if end == len(stream.buffer) and not stream.eof:
+                stream.fill()
+                continue
+            stream.pos = end
+            return record
+
+
+class _RecordTooLarge(Exception):
+    """Raised when a record grows past `MAX_RECORD_CHARS` without completing."""
+
+
+class _ChunkedText:
+    """Sliding window over a text file with line/offset tracking."""
+
+    def __init__(self, f: TextIO, chunk_size: int):
+        self._file = f
+        self._chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        # Character offset of buffer[0]
+        self._base_offset = 0
+        # Line number at buffer[self._line_pos]
+        self._line = 1
+        self._line_pos = 0
+
+    def current(self) -> str:
+        return self.buffer[self.pos]
+
+    def pending(self) -> int:
+        """Characters buffered from the current position."""
+        return len(self.buffer) - self.pos
+
+    def fill(self) -> bool:
+        """Drop consumed text and append the next chunk; False at end of file."""
+        if self.pos:
+            self.location()
+            self._base_offset += self.pos
+            self._line_pos -= self.pos
+            self.buffer = self.buffer[self.pos:]
+            self.pos = 0
+
+        chunk = self._file.read(self._chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer += chunk
+        return True
+
+    def skip_whitespace(self) -> bool:
+        """Advance past whitespace; False if the end of file is reached."""
+        while True:
+            match = _NON_WHITESPACE.search(self.buffer, self.pos)
+            if match is not None:
+                self.pos = match.start()
+                return True
+            self.pos = len(self.buffer)
+            if not self.fill():
+                return False
+
+    def location(self) -> Tuple[int, int]:
+        """(line, character offset) of the current position."""
+        self._line += self.buffer.count("\n", self._line_pos, self.pos)
+        self._line_pos = self.pos
+        return self._line, self._base_offset + self.pos
+
+    def resync(self) -> bool:
+        """Skip to the next line starting an object; False if there is none."""
+        start = self.pos + 1
+        while True:
+            match = _RESYNC.search(self.buffer, start)
+            if match is not None:
+                self.pos = match.end() - 1
+                return True
+            # Keep the last newline so a match spanning chunks is still found
+            last_newline = self.buffer.rfind("\n", start)
+            self.pos = last_newline if last_newline >= 0 else len(self.buffer)
+            if not self.fill():
+                return False
+            start = self.pos
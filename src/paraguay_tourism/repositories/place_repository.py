@@ -1,50 +1,148 @@
 """Repository for accessing place data."""
 
-import json
+import itertools
+import logging
+import threading
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from ..models import Place
+from .catalog_snapshot import CatalogSnapshot
+from .place_catalog import PlaceCatalog
+from .place_reader import PlaceStreamReader
+from .place_store import PlaceStore
+
+logger = logging.getLogger(__name__)
 
 
 class PlaceRepository:
-    """Repository for managing place data access."""
+    """
+    Repository for managing place data access.
+
+    The catalog is loaded once into memory and served from that snapshot.
+    It is reloaded only when the data file's mtime or size changes, or when
+    `reload()` is called explicitly. A reload builds a complete new snapshot
+    before swapping it in, so readers never observe a partially loaded catalog.
+
+    Data files may be JSON arrays or JSON Lines and are streamed record by
+    record (see `PlaceStreamReader`). Malformed records are skipped and
+    reported in `PlaceCatalog.errors` instead of failing the whole load.
+
+    The catalog keeps places column-wise; the `get_*` methods build `Place`
+    models only for the places they return.
 
-    def __init__(self, data_path: str | Path | None = None):
+    When a compiled snapshot (see `build_snapshot`) matching the data file's
+    current signature exists, it is memory-mapped instead of parsing the data
+    file. Stale, missing or unreadable snapshots fall back to the data file.
+    """
+
+    def __init__(
+        self,
+        data_path: str | Path,
+        snapshot_path: str | Path | None = None,
+        dataset: Optional[str] = None,
+    ):
         """
         Initialize the repository.
 
         Args:
-            data_path: Path to the places.json file. If None, uses default path.
+            data_path: Path to the data file (JSON array or JSON Lines).
+            snapshot_path: Path of the compiled catalog snapshot. If None, uses the data
+                file path with a `.catalog` suffix.
+            dataset: Tag of the dataset (e.g. "py"), reported as the places' `dataset` field.
         """
-        if data_path is None:
-            # Default to data/places.json relative to project root
-            project_root = Path(__file__).parent.parent.parent.parent
-            self._data_path = project_root / "data" / "places_germany.json"
+        self._data_path = Path(data_path)
+        self._dataset = dataset
+        if snapshot_path is None:
+            self._snapshot_path = CatalogSnapshot.path_for(self._data_path)
         else:
-            self._data_path = Path(data_path)
+            self._snapshot_path = Path(snapshot_path)
 
-    def get_all(self) -> List[Place]:
+        self._catalog: Optional[PlaceCatalog] = None
+        self._lock = threading.Lock()
+        self._versions = itertools.count(1)
+
+    def get_catalog(self) -> PlaceCatalog:
         """
-        Retrieve all places from the data source.
+        Retrieve the current catalog snapshot, reloading it if the data file changed.
 
         Returns:
-            List of Place models.
+            PlaceCatalog snapshot.
 
         Raises:
             FileNotFoundError: If the data file doesn't exist.
             ValueError: If the data is invalid.
         """
-        if not self._data_path.exists():
-            raise FileNotFoundError(f"Data file not found: {self._data_path}")
+        signature = self._file_signature()
+        catalog = self._catalog
+        if catalog is not None and catalog.signature == signature:
+            return catalog
 
-        with open(self._data_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with self._lock:
+            # Another thread may have reloaded while we were waiting
+            catalog = self._catalog
+            if catalog is None or catalog.signature != signature:
+                catalog = self._load(signature)
+                self._catalog = catalog
+            return catalog
 
-        if not isinstance(data, list):
-            raise ValueError("Invalid data format: expected a list")
+    def reload(self) -> PlaceCatalog:
+        """
+        Force a reload of the catalog from the data source.
 
-        return [Place(**place) for place in data]
+        Returns:
+            The freshly loaded PlaceCatalog snapshot.
+
+        Raises:
+            FileNotFoundError: If the data file doesn't exist.
+            ValueError: If the data is invalid.
+        """
+        with self._lock:
+            catalog = self._load(self._file_signature())
+            self._catalog = catalog
+            return catalog
+
+    @property
+    def data_path(self) -> Path:
+        """Path to the data file."""
+        return self._data_path
+
+    def build_snapshot(self, output_path: str | Path | None = None) -> Tuple[PlaceCatalog, Path, int]:
+        """
+        Compile the data file into a binary catalog snapshot.
+
+        Args:
+            output_path: Where to write the snapshot. If None, uses the repository's
+                snapshot path.
+
+        Returns:
+            (catalog read from the data file, snapshot path, snapshot size in bytes).
+
+        Raises:
+            FileNotFoundError: If the data file doesn't exist.
+            ValueError: If the data is invalid.
+        """
+        path = self._snapshot_path if output_path is None else Path(output_path)
+        with self._lock:
+            signature = self._file_signature()
+            catalog = self._load_data_file(signature)
+        size = CatalogSnapshot.write(
+            path, catalog.store, signature, catalog.errors, catalog.error_count
+        )
+        return catalog, path, size
+
+    def get_all(self) -> List[Place]:
+        """
+        Retrieve all places from the data source.
+
+        Returns:
+            List of Place models.
+
+        Raises:
+            FileNotFoundError: If the data file doesn't exist.
+            ValueError: If the data is invalid.
+        """
+        return [place.to_model() for place in self.get_catalog().places]
 
     def get_by_id(self, place_id: str) -> Optional[Place]:
         """
@@ -60,9 +158,128 @@ class PlaceRepository:
             FileNotFoundError: If the data file doesn't exist.
             ValueError: If the data is invalid.
         """
-        places = self.get_all()
-        for place in places:
-            if place.id == place_id:
-                return place
-        return None
+        place = self.get_catalog().get(place_id)
+        return place.to_model() if place is not None else None
+
+    def get_by_city(self, city: str) -> List[Place]:
+        """
+        Retrieve all places in a city.
+
+        Args:
+            city: City name (accent- and case-insensitive, e.g. "asuncion").
+
+        Returns:
+            List of Place models in the city, empty if none match.
 
+        Raises:
+            FileNotFoundError: If the data file doesn't exist.
+            ValueError: If the data is invalid.
+        """
+        return [place.to_model() for place in self.get_catalog().by_city(city)]
+
+    def get_by_region(self, region: str) -> List[Place]:
+        """
+        Retrieve all places in a region.
+
+        Args:
+            region: Region name (accent- and case-insensitive, e.g. "itapua").
+
+        Returns:
+            List of Place models in the region, empty if none match.
+
+        Raises:
+            FileNotFoundError: If the data file doesn't exist.
+            ValueError: If the data is invalid.
+        """
+        return [place.to_model() for place in self.get_catalog().by_region(region)]
+
+    def get_by_category(self, category: str) -> List[Place]:
+        """
+        Retrieve all places in a category.
+
+        Args:
+            category: Category name (accent- and case-insensitive, e.g. "naturaleza").
+
+        Returns:
+            List of Place models in the category, empty if none match.
+
+        Raises:
+            FileNotFoundError: If the data file doesn't exist.
+            ValueError: If the data is invalid.
+        """
+        return [place.to_model() for place in self.get_catalog().by_category(category)]
+
+    def _file_signature(self) -> Tuple[int, int]:
+        """
+        Get the (mtime_ns, size) signature of the data file.
+
+        Raises:
+            FileNotFoundError: If the data file doesn't exist.
+        """
+        try:
+            stat = self._data_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Data file not found: {self._data_path}") from None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _load(self, signature: Tuple[int, int]) -> PlaceCatalog:
+        """
+        Load a new catalog snapshot, from the compiled snapshot when it is current.
+
+        Args:
+            signature: File signature observed before reading.
+
+        Returns:
+            New PlaceCatalog snapshot.
+
+        Raises:
+            ValueError: If the file is neither a JSON array nor JSON Lines.
+        """
+        try:
+            snapshot = CatalogSnapshot.load(self._snapshot_path, signature, dataset=self._dataset)
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable catalog snapshot %s: %s", self._snapshot_path, e)
+            snapshot = None
+
+        if snapshot is None:
+            return self._load_data_file(signature)
+        return PlaceCatalog(
+            snapshot.store,
+            version=next(self._versions),
+            signature=signature,
+            errors=snapshot.errors,
+            error_count=snapshot.error_count,
+            groups=snapshot.groups,
+        )
+
+    def _load_data_file(self, signature: Tuple[int, int]) -> PlaceCatalog:
+        """
+        Parse and validate the data file into a new catalog snapshot.
+
+        Args:
+            signature: File signature observed before reading.
+
+        Returns:
+            New PlaceCatalog snapshot.
+
+        Raises:
+            ValueError: If the file is neither a JSON array nor JSON Lines.
+        """
+        reader = PlaceStreamReader(self._data_path)
+        # Records are validated and stored column-wise one at a time; neither the
+        # parsed document nor the validated models are kept
+        store = PlaceStore(reader, dataset=self._dataset)
+        catalog = PlaceCatalog(
+            store,
+            version=next(self._versions),
+            signature=signature,
+            errors=reader.errors,
+            error_count=reader.error_count,
+        )
+        if catalog.error_count:
+            first = catalog.errors[0]
+            logger.warning(
+                "Skipped %d malformed record(s) in %s (first at line %d, offset %d: %s)",
+                catalog.error_count, self._data_path, first.line, first.offset, first.message,
+            )
+        return catalog
@@ -0,0 +1,232 @@
+"""Columnar in-memory storage for catalog places."""
+
+import itertools
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from ..models import Place
+
+
+class PlaceStore:
+    """
+    Places stored column-wise instead of one Pydantic model per place.
+
+    Coordinates live in `array('d')` columns. Category, city and region values
+    are interned in a shared string table and stored as integer codes, so each
+    distinct value is held once however many places use it. Places are read
+    through lightweight `PlaceRow` views; `Place` models are only created on
+    demand (`PlaceRow.to_model()`).
+
+    A store built from places can be appended to; a store built with
+    `from_columns` (e.g. over a memory-mapped snapshot) is read-only.
+
+    Every place in a store belongs to the same dataset (e.g. a country), whose
+    tag is reported as the places' `dataset` field.
+    """
+
+    # Columns holding one string per place, and columns holding interned codes
+    TEXT_COLUMNS = ("id", "name", "description")
+    CODE_COLUMNS = ("category", "city", "region")
+
+    def __init__(self, places: Iterable[Place] = (), dataset: Optional[str] = None):
+        """
+        Build the store.
+
+        Args:
+            places: Validated Place models, consumed one at a time (not retained).
+            dataset: Tag of the dataset the places belong to.
+        """
+        self.dataset = dataset
+        self._ids: List[str] = []
+        self._names: List[str] = []
+        self._descriptions: List[str] = []
+        self._category_codes = array("I")
+        self._city_codes = array("I")
+        self._region_codes = array("I")
+        self.lat = array("d")
+        self.lng = array("d")
+
+        self._strings: List[str] = []
+        self._string_codes: Dict[str, int] = {}
+
+        for place in places:
+            self.append(place)
+
+    @classmethod
+    def from_columns(
+        cls,
+        text: Dict[str, Sequence[str]],
+        codes: Dict[str, Sequence[int]],
+        strings: Sequence[str],
+        lat: Sequence[float],
+        lng: Sequence[float],
+        dataset: Optional[str] = None,
+    ) -> "PlaceStore":
+        """
+        Wrap existing columns without copying them.
+
+        Args:
+            text: One sequence per `TEXT_COLUMNS` entry.
+            codes: One sequence of string-table codes per `CODE_COLUMNS` entry.
+            strings: Interned string table.
+            lat: Latitudes (e.g. an `array('d')` or a memoryview cast to "d").
+            lng: Longitudes.
+            dataset: Tag of the dataset the places belong to.
+
+        Returns:
+            Read-only PlaceStore.
+        """
+        store = cls.__new__(cls)
+        store.dataset = dataset
+        store._ids = text["id"]
+        store._names = text["name"]
+        store._descriptions = text["description"]
+        store._category_codes = codes["category"]
+        store._city_codes = codes["city"]
+        store._region_codes = codes["region"]
+        store.lat = lat
+        store.lng = lng
+        store._strings = list(strings)
+        store._string_codes = {value: code for code, value in enumerate(store._strings)}
+        return store
+
+    def append(self, place: Place) -> None:
+        """Add a place to the end of the store."""
+        self._ids.append(place.id)
+        self._names.append(place.name)
+        self._descriptions.append(place.description)
+        self._category_codes.append(self._intern(place.category))
+        self._city_codes.append(self._intern(place.city))
+        self._region_codes.append(self._intern(place.region))
+        self.lat.append(place.lat)
+        self.lng.append(place.lng)
+
+    def rows(self) -> Tuple["PlaceRow", ...]:
+        """One row view per place, in insertion order."""
+        return tuple(map(PlaceRow, itertools.repeat(self), range(len(self._ids))))
+
+    def text(self, column: str) -> Sequence[str]:
+        """
+        A text column.
+
+        Args:
+            column: "id", "name" or "description".
+
+        Returns:
+            One string per place.
+        """
+        return {"id": self._ids, "name": self._names, "description": self._descriptions}[column]
+
+    def codes(self, column: str) -> Sequence[int]:
+        """
+        Interned string codes of a column.
+
+        Args:
+            column: "category", "city" or "region".
+
+        Returns:
+            One code per place; decode with `string()`.
+        """
+        return getattr(self, f"_{column}_codes")
+
+    def string(self, code: int) -> str:
+        """Interned string for a code."""
+        return self._strings[code]
+
+    @property
+    def strings(self) -> List[str]:
+        """Interned string table (index = code)."""
+        return self._strings
+
+    def coordinates(self) -> Iterable[Tuple[float, float]]:
+        """(lat, lng) pairs in insertion order."""
+        return zip(self.lat, self.lng)
+
+    def _intern(self, value: str) -> int:
+        """Code of a string, adding it to the table on first use."""
+        code = self._string_codes.get(value)
+        if code is None:
+            code = len(self._strings)
+            self._strings.append(value)
+            self._string_codes[value] = code
+        return code
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+class PlaceRow:
+    """
+    Read-only view of one place in a `PlaceStore`.
+
+    Exposes the same attributes as `Place` (id, name, description, category,
+    lat, lng, city, region, dataset) plus `model_dump()`, so it can be used wherever a
+    place is only read.
+    """
+
+    __slots__ = ("_store", "position")
+
+    def __init__(self, store: PlaceStore, position: int):
+        self._store = store
+        self.position = position
+
+    @property
+    def id(self) -> str:
+        return self._store._ids[self.position]
+
+    @property
+    def name(self) -> str:
+        return self._store._names[self.position]
+
+    @property
+    def description(self) -> str:
+        return self._store._descriptions[self.position]
+
+    @property
+    def category(self) -> str:
+        return self._store._strings[self._store._category_codes[self.position]]
+
+    @property
+    def lat(self) -> float:
+        return self._store.lat[self.position]
+
+    @property
+    def lng(self) -> float:
+        return self._store.lng[self.position]
+
+    @property
+    def city(self) -> str:
+        return self._store._strings[self._store._city_codes[self.position]]
+
+    @property
+    def region(self) -> str:
+        return self._store._strings[self._store._region_codes[self.position]]
+
+    @property
+    def dataset(self) -> Optional[str]:
+        return self._store.dataset
+
+    def model_dump(self) -> Dict:
+        """Place fields as a dictionary, like `Place.model_dump()`."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "description": self.description,
+            "category": self.category,
+            "lat": self.lat,
+            "lng": self.lng,
+            "city": self.city,
+            "region": self.region,
+            "dataset": self._store.dataset,
+        }
+
+    def to_model(self) -> Place:
+        """Build a `Place` model (the data was validated when it was loaded)."""
+        return Place.model_construct(**self.model_dump())
+
+    def __repr__(self) -> str:
+        return f"PlaceRow(id={self.id!r}, name={self.name!r})"
+
+
+# Anything that reads like a place: a validated model or a catalog row view
+PlaceLike = Union[Place, PlaceRow]
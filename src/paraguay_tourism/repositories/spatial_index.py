@@ -0,0 +1,168 @@
+"""Uniform latitude/longitude grid index over place coordinates."""
+
+import math
+from array import array
+from typing import Dict, Iterable, List, Tuple
+
+
+class SpatialIndex:
+    """
+    Grid index bucketing catalog positions into fixed-size lat/lng cells.
+
+    The index only answers bounding-box queries; callers refine the candidates
+    with exact distance calculations. Positions refer to the order of the
+    coordinates the index was built from (i.e. the catalog's place order).
+    """
+
+    # Default cell size in degrees (~11 km of latitude)
+    DEFAULT_CELL_SIZE_DEG = 0.1
+
+    def __init__(
+        self,
+        coordinates: Iterable[Tuple[float, float]],
+        cell_size_deg: float = DEFAULT_CELL_SIZE_DEG,
+    ):
+        """
+        Build the grid index.
+
+        Args:
+            coordinates: (lat, lng) pairs in decimal degrees, in catalog order.
+            cell_size_deg: Edge length of each grid cell in degrees.
+        """
+        self._cell_size = cell_size_deg
+        self._lats = array("d")
+        self._lngs = array("d")
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+
+        for position, (lat, lng) in enumerate(coordinates):
+            self._lats.append(lat)
+            self._lngs.append(lng)
+            if not (math.isfinite(lat) and math.isfinite(lng)):
+                # Never inside any box nor within any distance
+                continue
+            self._cells.setdefault(self._cell_of(lat, lng), []).append(position)
+
+    @property
+    def cell_size_deg(self) -> float:
+        """Edge length of each grid cell in degrees."""
+        return self._cell_size
+
+    def query_bbox(
+        self,
+        min_lat: float,
+        max_lat: float,
+        min_lng: float,
+        max_lng: float,
+    ) -> List[int]:
+        """
+        Find all positions inside a bounding box.
+
+        Args:
+            min_lat: Southern edge in decimal degrees.
+            max_lat: Northern edge in decimal degrees.
+            min_lng: Western edge in decimal degrees.
+            max_lng: Eastern edge in decimal degrees. If smaller than `min_lng`,
+                the box crosses the antimeridian.
+
+        Returns:
+            Positions of the points inside the box (edges included), in ascending order.
+        """
+        if min_lat > max_lat:
+            return []
+
+        if min_lng <= max_lng:
+            lng_ranges = [(min_lng, max_lng)]
+        else:
+            lng_ranges = [(min_lng, 180.0), (-180.0, max_lng)]
+
+        positions: List[int] = []
+        for range_min_lng, range_max_lng in lng_ranges:
+            for position in self._candidates(min_lat, max_lat, range_min_lng, range_max_lng):
+                lat = self._lats[position]
+                lng = self._lngs[position]
+                if min_lat <= lat <= max_lat and range_min_lng <= lng <= range_max_lng:
+                    positions.append(position)
+
+        if len(lng_ranges) > 1:
+            # A point exactly on ±180 can fall in both ranges
+            positions = list(set(positions))
+        positions.sort()
+        return positions
+
+    def estimate_bbox(
+        self,
+        min_lat: float,
+        max_lat: float,
+        min_lng: float,
+        max_lng: float,
+    ) -> int:
+        """
+        Upper bound of the number of points inside a bounding box, from cell sizes alone.
+
+        Args:
+            min_lat: Southern edge in decimal degrees.
+            max_lat: Northern edge in decimal degrees.
+            min_lng: Western edge in decimal degrees.
+            max_lng: Eastern edge in decimal degrees (smaller than `min_lng` when the
+                box crosses the antimeridian).
+
+        Returns:
+            Number of points in the grid cells overlapping the box.
+        """
+        if min_lat > max_lat:
+            return 0
+        if min_lng <= max_lng:
+            lng_ranges = [(min_lng, max_lng)]
+        else:
+            lng_ranges = [(min_lng, 180.0), (-180.0, max_lng)]
+        return sum(
+            len(members)
+            for range_min_lng, range_max_lng in lng_ranges
+            for members in self._overlapping_cells(min_lat, max_lat, range_min_lng, range_max_lng)
+        )
+
+    def _candidates(
+        self,
+        min_lat: float,
+        max_lat: float,
+        min_lng: float,
+        max_lng: float,
+    ):
+        """Yield positions from every cell overlapping the box."""
+        for members in self._overlapping_cells(min_lat, max_lat, min_lng, max_lng):
+            yield from members
+
+    def _overlapping_cells(
+        self,
+        min_lat: float,
+        max_lat: float,
+        min_lng: float,
+        max_lng: float,
+    ):
+        """Yield the member lists of every occupied cell overlapping the box."""
+        row_min, col_min = self._cell_of(min_lat, min_lng)
+        row_max, col_max = self._cell_of(max_lat, max_lng)
+        cell_count = (row_max - row_min + 1) * (col_max - col_min + 1)
+
+        if cell_count > len(self._cells):
+            # Box spans more cells than are occupied: walk the occupied ones instead
+            for (row, col), members in self._cells.items():
+                if row_min <= row <= row_max and col_min <= col <= col_max:
+                    yield members
+            return
+
+        for row in range(row_min, row_max + 1):
+            for col in range(col_min, col_max + 1):
+                members = self._cells.get((row, col))
+                if members:
+                    yield members
+
+    def _cell_of(self, lat: float, lng: float) -> Tuple[int, int]:
+        """Grid cell (row, col) containing a coordinate."""
+        return (
+            math.floor(lat / self._cell_size),
+            math.floor(lng / self._cell_size),
+        )
+
+    def __len__(self) -> int:
+        return len(self._lats)
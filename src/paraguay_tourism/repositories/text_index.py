@@ -0,0 +1,191 @@
+"""Inverted index with BM25 ranking over place text fields."""
+
+import heapq
+import math
+from array import array
+from operator import itemgetter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ..utils import STOPWORDS, stem, tokenize, transliterate_umlauts
+from .place_store import PlaceLike
+
+
+class TextIndex:
+    """
+    Full-text index over place name, description, category and city.
+
+    Text is split into accent- and case-folded words, stopwords are dropped
+    and the rest reduced to crude stems (see `stem`), so "Ruinas jesuíticas"
+    matches "ruina jesuitica"; words with German umlauts are also indexed
+    spelled out (see `transliterate_umlauts`), so "Römer" matches both "romer"
+    and "roemer". Each term maps to a posting list of catalog positions with
+    precomputed Okapi BM25 weights of the field-weighted term frequencies, so
+    a query only sums `idf * weight` over its terms' postings.
+    Positions refer to the order of the places the index was built from
+    (i.e. the catalog's place order).
+    """
+
+    # Weight of one occurrence of a word in each field
+    FIELD_WEIGHTS = {"name": 3.0, "category": 2.0, "city": 2.0, "description": 1.0}
+
+    # BM25 term frequency saturation and length normalization
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self, places: Iterable[PlaceLike]):
+        """
+        Build the index.
+
+        Args:
+            places: Places (models or catalog rows), in catalog order.
+        """
+        postings: Dict[str, Tuple[array, array]] = {}
+        lengths = array("d")
+        # Field values repeat (categories, cities) and so do words: analyze each once
+        analyzed: Dict[str, Tuple[List[str], List[str]]] = {}
+        stems: Dict[str, str] = {}
+
+        for position, place in enumerate(places):
+            frequencies: Dict[str, float] = {}
+            variant_frequencies: Dict[str, float] = {}
+            for field, weight in self.FIELD_WEIGHTS.items():
+                text = getattr(place, field)
+                entry = analyzed.get(text)
+                if entry is None:
+                    terms = self.analyze(text, stems)
+                    entry = analyzed[text] = (terms, self._variants(text, terms, stems))
+                terms, variants = entry
+                for term in terms:
+                    frequencies[term] = frequencies.get(term, 0.0) + weight
+                for term in variants:
+                    variant_frequencies[term] = variant_frequencies.get(term, 0.0) + weight
+            # Alternative spellings are extra postings, not extra words: they do not lengthen the document
+            lengths.append(sum(frequencies.values()))
+            for term, frequency in variant_frequencies.items():
+                if term not in frequencies:
+                    frequencies[term] = frequency
+            for term, frequency in frequencies.items():
+                posting = postings.get(term)
+                if posting is None:
+                    posting = postings[term] = (array("I"), array("d"))
+                posting[0].append(position)
+                posting[1].append(frequency)
+
+        # Replace term frequencies with their BM25 weight (everything but the IDF),
+        # which only depends on the document, so queries just sum idf * weight
+        count = len(lengths)
+        average_length = (sum(lengths) / count) if count else 0.0
+        k1, b = self.K1, self.B
+        for positions, weights in postings.values():
+            for i, (position, frequency) in enumerate(zip(positions, weights)):
+                norm = k1 * (1.0 - b + b * lengths[position] / average_length)
+                weights[i] = frequency * (k1 + 1.0) / (frequency + norm)
+
+        self._postings = postings
+        self._count = count
+
+    @staticmethod
+    def analyze(text: str, stems: Optional[Dict[str, str]] = None) -> List[str]:
+        """
+        Terms of a text as stored in the index.
+
+        Args:
+            text: Text to analyze (e.g., "Cascadas del Monday").
+            stems: Optional word -> stem memo shared between calls.
+
+        Returns:
+            Stemmed words without stopwords (e.g., ["cascad", "monday"]).
+        """
+        if stems is None:
+            return [stem(word) for word in tokenize(text) if word not in STOPWORDS]
+        terms = []
+        for word in tokenize(text):
+            if word in STOPWORDS:
+                continue
+            term = stems.get(word)
+            if term is None:
+                term = stems[word] = stem(word)
+            terms.append(term)
+        return terms
+
+    @classmethod
+    def _variants(cls, text: str, terms: List[str], stems: Dict[str, str]) -> List[str]:
+        """Terms of the umlaut-transliterated text that are not among its regular `terms`."""
+        transliterated = transliterate_umlauts(text)
+        if transliterated == text:
+            return []
+        regular = set(terms)
+        return [term for term in cls.analyze(transliterated, stems) if term not in regular]
+
+    def search(self, query: str, limit: int) -> Tuple[List[Tuple[int, float]], int]:
+        """
+        Rank places against a free-text query.
+
+        Args:
+            query: Search text (e.g., "ruinas jesuíticas").
+            limit: Maximum number of results to return.
+
+        Returns:
+            ((position, score) pairs, best first; number of places matching
+            at least one query term).
+
+        Raises:
+            ValueError: If limit is less than 1.
+        """
+        if limit < 1:
+            raise ValueError("limit debe ser mayor o igual a 1")
+
+        scores = self.scores(query)
+        best = heapq.nlargest(limit, scores.items(), key=itemgetter(1))
+        return best, len(scores)
+
+    def scores(self, query: str) -> Dict[int, float]:
+        """
+        BM25 score of every place matching at least one query term.
+
+        Args:
+            query: Search text.
+
+        Returns:
+            Mapping of position to score (unordered).
+        """
+        postings = [
+            self._postings[term]
+            for term in dict.fromkeys(self.analyze(query))
+            if term in self._postings
+        ]
+        if not postings:
+            return {}
+
+        # Rarest term first: its posting list seeds the score table in one pass
+        postings.sort(key=lambda posting: len(posting[0]))
+        scores: Dict[int, float] = {}
+        for positions, weights in postings:
+            idf = math.log(1.0 + (self._count - len(positions) + 0.5) / (len(positions) + 0.5))
+            if not scores:
+                scores = dict(zip(positions, map(idf.__mul__, weights)))
+                continue
+            get = scores.get
+            for position, weight in zip(positions, weights):
+                scores[position] = get(position, 0.0) + idf * weight
+        return scores
+
+    def estimate(self, query: str) -> int:
+        """
+        Upper bound of the number of places matching a query, without scoring them.
+
+        Args:
+            query: Search text.
+
+        Returns:
+            Sum of the posting list lengths of the query terms.
+        """
+        return sum(
+            len(self._postings[term][0])
+            for term in dict.fromkeys(self.analyze(query))
+            if term in self._postings
+        )
+
+    def __len__(self) -> int:
+        """Number of distinct indexed terms."""
+        return len(self._postings)
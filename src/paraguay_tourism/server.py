@@ -1,21 +1,44 @@
 """MCP Server for Paraguay Tourism data."""
 
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import AsyncIterator
 
 from fastmcp import FastMCP
 
 # Handle both relative imports (when used as module) and absolute imports (when run directly)
 try:
-    from .core import get_container, setup_imports
-    from .handlers import register_place_handlers
+    from .core import DependencyContainer, get_container
+    from .handlers import (
+        register_metrics_handlers,
+        register_place_handlers,
+        register_profiling_handlers,
+    )
 except ImportError:
     # Add src directory to path when running directly
     src_path = Path(__file__).parent.parent
     if str(src_path) not in sys.path:
         sys.path.insert(0, str(src_path))
-    from paraguay_tourism.core import get_container, setup_imports
-    from paraguay_tourism.handlers import register_place_handlers
+    from paraguay_tourism.core import DependencyContainer, get_container
+    from paraguay_tourism.handlers import (
+        register_metrics_handlers,
+        register_place_handlers,
+        register_profiling_handlers,
+    )
+
+
+def _lifespan(container: DependencyContainer):
+    """Server lifespan that closes the container's pooled resources on shutdown."""
+
+    @asynccontextmanager
+    async def lifespan(server: FastMCP) -> AsyncIterator[dict]:
+        try:
+            yield {}
+        finally:
+            await container.aclose()
+
+    return lifespan
 
 
 def create_app() -> FastMCP:
@@ -25,17 +48,16 @@ def create_app() -> FastMCP:
     Returns:
         Configured FastMCP server instance.
     """
-    # Setup imports configuration
-    setup_imports()
-    
-    # Initialize MCP server
-    mcp = FastMCP("Paraguay Tourism MCP Server 🚀")
-    
     # Get dependency container
     container = get_container()
     
-    # Register all handlers
+    # Initialize MCP server; HTTP clients and the cache database close on shutdown
+    mcp = FastMCP("Paraguay Tourism MCP Server 🚀", lifespan=_lifespan(container))
+    
+    # Register all handlers (profiling first: its middleware wraps the others)
+    register_profiling_handlers(mcp, container)
     register_place_handlers(mcp, container)
+    register_metrics_handlers(mcp, container)
     
     return mcp
 
@@ -1,12 +1,30 @@
 """Services package - business logic layer."""
 
+from .gazetteer import Gazetteer
+from .geolocation_cache import GeolocationCache
 from .geolocation_service import GeolocationService
 from .location_service import LocationService
+from .metrics import MetricsRegistry
 from .place_formatter import PlaceFormatter
+from .place_query_planner import PlaceQueryPlanner
+from .profiler import ToolProfiler
+from .resilience import CircuitBreaker, ProviderGuard, TokenBucket, UpstreamUnavailableError
+from .route_planner import RoutePlan, RoutePlanner
 
 __all__ = [
+    "CircuitBreaker",
+    "Gazetteer",
+    "GeolocationCache",
     "GeolocationService",
     "LocationService",
+    "MetricsRegistry",
     "PlaceFormatter",
+    "PlaceQueryPlanner",
+    "ProviderGuard",
+    "RoutePlan",
+    "RoutePlanner",
+    "TokenBucket",
+    "ToolProfiler",
+    "UpstreamUnavailableError",
 ]
 
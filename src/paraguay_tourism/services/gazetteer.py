@@ -0,0 +1,342 @@
+"""Offline gazetteer: local, accent-insensitive fuzzy geocoding."""
+
+import json
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from ..repositories import CatalogRegistry, CatalogSet
+from ..utils import normalize_key
+
+
+class GazetteerEntry:
+    """A named location that can be geocoded locally."""
+
+    __slots__ = ("name", "kind", "lat", "lng", "display_name", "country_code", "key", "qualifiers")
+
+    # Names a country may be written as after a comma, besides its code
+    COUNTRY_NAMES = {
+        "py": ("paraguay",),
+        "de": ("germany", "deutschland", "alemania"),
+    }
+
+    def __init__(
+        self,
+        name: str,
+        kind: str,
+        lat: float,
+        lng: float,
+        display_name: str,
+        country_code: Optional[str],
+        context: Tuple[str, ...] = (),
+    ):
+        """
+        Initialize the entry.
+
+        Args:
+            name: Location name.
+            kind: Entry kind (locality, city, place or region).
+            lat: Latitude.
+            lng: Longitude.
+            display_name: Name shown in results.
+            country_code: Normalized country code, or None if unknown.
+            context: Enclosing names (city, region) that may follow the name
+                after a comma in a query, e.g. "Trinidad, Itapúa".
+        """
+        self.name = name
+        self.kind = kind
+        self.lat = lat
+        self.lng = lng
+        self.display_name = display_name
+        self.country_code = country_code
+        self.key = normalize_key(name)
+        qualifiers = {normalize_key(value) for value in context if value}
+        if country_code:
+            qualifiers.add(country_code)
+            qualifiers.update(self.COUNTRY_NAMES.get(country_code, ()))
+        self.qualifiers = frozenset(qualifiers)
+
+    def qualified_by(self, qualifiers: Tuple[str, ...]) -> bool:
+        """Whether every normalized qualifier names this entry's city, region or country."""
+        return all(qualifier in self.qualifiers for qualifier in qualifiers)
+
+
+class GazetteerIndex:
+    """Exact-name and trigram indexes over a fixed set of gazetteer entries."""
+
+    # Preferred entry kinds when several entries share the same name
+    KIND_PRIORITY = {"locality": 0, "city": 1, "place": 2, "region": 3}
+
+    def __init__(self, entries: List[GazetteerEntry]):
+        """
+        Build the indexes.
+
+        Args:
+            entries: Entries to index.
+        """
+        self._entries = sorted(entries, key=lambda entry: self.KIND_PRIORITY[entry.kind])
+        self._by_key: Dict[str, List[int]] = {}
+        self._by_trigram: Dict[str, List[int]] = {}
+        self._trigram_counts: List[int] = []
+
+        for position, entry in enumerate(self._entries):
+            self._by_key.setdefault(entry.key, []).append(position)
+            trigrams = self.trigrams(entry.key)
+            self._trigram_counts.append(len(trigrams))
+            for trigram in trigrams:
+                self._by_trigram.setdefault(trigram, []).append(position)
+
+    def search(
+        self,
+        key: str,
+        country_code: Optional[str],
+        min_similarity: float,
+        qualifiers: Tuple[str, ...] = (),
+    ) -> Optional[Tuple[GazetteerEntry, float]]:
+        """
+        Find the best entry for a normalized name.
+
+        Args:
+            key: Normalized query (see `normalize_key`).
+            country_code: Only consider entries from this country (None for any).
+            min_similarity: Minimum trigram similarity (0-1) for fuzzy matches.
+            qualifiers: Normalized names (city, region or country) the entry
+                must be qualified by (see `GazetteerEntry.qualified_by`).
+
+        Returns:
+            (entry, similarity) for the best match, or None. Exact matches have
+            similarity 1.0.
+        """
+        for position in self._by_key.get(key, ()):
+            entry = self._entries[position]
+            if self._country_matches(entry, country_code) and entry.qualified_by(qualifiers):
+                return entry, 1.0
+
+        trigrams = self.trigrams(key)
+        if not trigrams:
+            return None
+
+        shared: Counter = Counter()
+        for trigram in trigrams:
+            shared.update(self._by_trigram.get(trigram, ()))
+
+        best_position = -1
+        best_similarity = 0.0
+        for position, count in shared.items():
+            # Dice coefficient over trigram sets
+            similarity = 2 * count / (len(trigrams) + self._trigram_counts[position])
+            if similarity < min_similarity or similarity < best_similarity:
+                continue
+            # Ties keep the entry with the preferred kind (lower position)
+            if similarity == best_similarity and position > best_position:
+                continue
+            entry = self._entries[position]
+            if not self._country_matches(entry, country_code) or not entry.qualified_by(qualifiers):
+                continue
+            best_position, best_similarity = position, similarity
+
+        if best_position < 0:
+            return None
+        return self._entries[best_position], best_similarity
+
+    @staticmethod
+    def trigrams(key: str) -> set:
+        """Character trigrams of a normalized string, padded at word boundaries."""
+        padded = f"  {key} "
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+    @staticmethod
+    def _country_matches(entry: GazetteerEntry, country_code: Optional[str]) -> bool:
+        """Entries of unknown country only match unrestricted queries."""
+        if not country_code:
+            return True
+        return entry.country_code == country_code
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class Gazetteer:
+    """
+    Local geocoder over the place catalog and bundled Paraguayan localities.
+
+    Indexes catalog place names, cities and regions (rebuilt when the catalog
+    version changes) plus an optional list of localities. Lookups are
+    accent-insensitive and tolerate typos through trigram similarity, so most
+    geocoding queries are answered without calling Nominatim.
+    """
+
+    # Minimum trigram similarity accepted for a fuzzy match
+    MIN_SIMILARITY = 0.75
+
+    # Rough bounding box of Paraguay (min_lat, max_lat, min_lng, max_lng), used to
+    # tag catalog entries with a country when their dataset has no tag
+    PARAGUAY_BBOX = (-27.61, -19.29, -62.65, -54.25)
+
+    # Bundled list of Paraguayan localities
+    DEFAULT_LOCALITIES_PATH = Path(__file__).parent.parent.parent.parent / "data" / "localities_py.json"
+
+    def __init__(
+        self,
+        catalog_registry: CatalogRegistry,
+        localities_path: str | Path | None = None,
+        localities_country_code: str = "py",
+    ):
+        """
+        Initialize the gazetteer.
+
+        Args:
+            catalog_registry: Registry providing the place catalog; dataset tags
+                are used as the country code of catalog entries.
+            localities_path: Optional JSON file with localities
+                (objects with name, region, lat, lng).
+            localities_country_code: Country code of the localities file.
+        """
+        self._catalog_registry = catalog_registry
+        self._localities = self._load_localities(localities_path, localities_country_code)
+        self._index: Optional[GazetteerIndex] = None
+        self._index_version: Optional[int] = None
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0}
+
+    def lookup(self, query: str, country_code: Optional[str] = "py") -> Optional[Dict]:
+        """
+        Geocode a location name locally.
+
+        Tries the whole query first and then its first comma-separated part,
+        provided every later part names the entry's city, region or country
+        (so "Asunción, Paraguay" matches "Asunción" but "Trinidad, Cuba" is
+        left to Nominatim).
+
+        Args:
+            query: Location name (e.g., "Asunción", "encarnacion", "Palacio de los Lopez").
+            country_code: Optional country code to limit the search (default: "py").
+
+        Returns:
+            Geocoding result dictionary (same shape as `GeolocationService.geocode_location`,
+            with `"source": "gazetteer"`), or None if there is no good local match.
+        """
+        country = normalize_key(country_code) if country_code else None
+        index = self._current_index()
+
+        candidates: List[Tuple[str, Tuple[str, ...]]] = [(normalize_key(query), ())]
+        head, *tail = query.split(",")
+        head = normalize_key(head)
+        qualifiers = tuple(key for key in map(normalize_key, tail) if key)
+        if head and head != candidates[0][0]:
+            candidates.append((head, qualifiers))
+
+        for key, required in candidates:
+            if not key:
+                continue
+            match = index.search(key, country, self.MIN_SIMILARITY, required)
+            if match is not None:
+                entry, similarity = match
+                self._stats["hits"] += 1
+                return {
+                    "success": True,
+                    "latitude": entry.lat,
+                    "longitude": entry.lng,
+                    "display_name": entry.display_name,
+                    "query": query,
+                    "source": "gazetteer",
+                    "raw": {
+                        "name": entry.name,
+                        "type": entry.kind,
+                        "country_code": entry.country_code,
+                        "similarity": round(similarity, 3),
+                    },
+                }
+        self._stats["misses"] += 1
+        return None
+
+    def stats(self) -> Dict[str, int]:
+        """Local hit/miss counters and index size."""
+        index = self._index
+        return {**self._stats, "entries": len(index) if index is not None else 0}
+
+    def _current_index(self) -> GazetteerIndex:
+        """Index for the current catalog version, rebuilt after a reload."""
+        try:
+            catalog = self._catalog_registry.get_catalog()
+        except (FileNotFoundError, ValueError):
+            catalog = None
+        version = catalog.version if catalog is not None else None
+
+        index = self._index
+        if index is not None and self._index_version == version:
+            return index
+        with self._lock:
+            if self._index is None or self._index_version != version:
+                self._index = GazetteerIndex(self._localities + self._catalog_entries(catalog))
+                self._index_version = version
+            return self._index
+
+    def _catalog_entries(self, catalog: Optional[CatalogSet]) -> List[GazetteerEntry]:
+        """Entries for catalog places, cities and regions (centroids of their places)."""
+        if catalog is None:
+            return []
+
+        entries = []
+        groups: Dict[Tuple[str, str, Optional[str]], List[Tuple[float, float, str]]] = {}
+        for place in catalog.places:
+            country = place.dataset or self._guess_country(place.lat, place.lng)
+            entries.append(GazetteerEntry(
+                place.name,
+                "place",
+                place.lat,
+                place.lng,
+                f"{place.name}, {place.city}, {place.region}",
+                country,
+                (place.city, place.region),
+            ))
+            groups.setdefault(("city", place.city, place.dataset), []).append((place.lat, place.lng, place.region))
+            groups.setdefault(("region", place.region, place.dataset), []).append((place.lat, place.lng, ""))
+
+        for (kind, name, dataset), members in groups.items():
+            lat = sum(member[0] for member in members) / len(members)
+            lng = sum(member[1] for member in members) / len(members)
+            region = members[0][2]
+            display_name = f"{name}, {region}" if region else name
+            entries.append(GazetteerEntry(
+                name, kind, lat, lng, display_name, dataset or self._guess_country(lat, lng), (region,)
+            ))
+        return entries
+
+    def _guess_country(self, lat: float, lng: float) -> Optional[str]:
+        """Country code for coordinates inside Paraguay's bounding box, else None."""
+        min_lat, max_lat, min_lng, max_lng = self.PARAGUAY_BBOX
+        if min_lat <= lat <= max_lat and min_lng <= lng <= max_lng:
+            return "py"
+        return None
+
+    @staticmethod
+    def _load_localities(
+        path: str | Path | None, country_code: str
+    ) -> List[GazetteerEntry]:
+        """Load the bundled localities file (missing file means no localities)."""
+        if path is None:
+            return []
+        path = Path(path)
+        if not path.exists():
+            return []
+
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, list):
+            raise ValueError(f"Invalid localities file {path}: expected a list")
+
+        country = normalize_key(country_code)
+        return [
+            GazetteerEntry(
+                item["name"],
+                "locality",
+                float(item["lat"]),
+                float(item["lng"]),
+                f"{item['name']}, {item['region']}",
+                country,
+                (item["region"],),
+            )
+            for item in data
+        ]
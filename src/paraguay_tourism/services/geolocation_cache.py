@@ -0,0 +1,192 @@
+"""TTL/LRU cache for geolocation and geocoding results."""
+
+import copy
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+
+class GeolocationCache:
+    """
+    In-memory LRU cache with per-entry expiry and an optional SQLite backend.
+
+    Successful lookups are kept for `ttl_seconds`; "not found" answers are
+    cached separately for `negative_ttl_seconds`. When `sqlite_path` is set,
+    entries are also written to disk so a restarted server starts warm.
+    `close()` releases the database connection; it is reopened if the cache
+    is used again.
+    """
+
+    # Prune the SQLite table back to `max_entries` every this many writes
+    _PRUNE_EVERY_WRITES = 64
+
+    def __init__(
+        self,
+        ttl_seconds: float = 24 * 3600.0,
+        negative_ttl_seconds: float = 3600.0,
+        max_entries: int = 1024,
+        sqlite_path: str | Path | None = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl_seconds: Lifetime of successful results. 0 disables caching them.
+            negative_ttl_seconds: Lifetime of "not found" results. 0 disables negative caching.
+            max_entries: Maximum number of entries kept in memory (and on disk).
+            sqlite_path: Optional SQLite database file for a persistent cache.
+        """
+        self._ttl = ttl_seconds
+        self._negative_ttl = negative_ttl_seconds
+        self._max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "negative_hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_path = Path(sqlite_path) if sqlite_path is not None else None
+        self._writes = 0
+        if self._db_path is not None:
+            self._db = self._open_db(self._db_path)
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Look up a cached result.
+
+        Args:
+            key: Cache key (see `make_key`).
+
+        Returns:
+            A copy of the cached result, or None if missing or expired.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None and self._connect():
+                entry = self._load_from_db(key)
+                if entry is not None:
+                    self._remember(key, entry)
+
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    self._entries.pop(key, None)
+                self._stats["misses"] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            value = entry[1]
+            self._stats["hits" if value.get("success") else "negative_hits"] += 1
+            return copy.deepcopy(value)
+
+    def set(self, key: str, value: Dict, negative: bool = False) -> None:
+        """
+        Store a result.
+
+        Args:
+            key: Cache key (see `make_key`).
+            value: Result dictionary (must be JSON-serializable for the SQLite backend).
+            negative: True for "not found" answers, which use the negative TTL.
+        """
+        ttl = self._negative_ttl if negative else self._ttl
+        if ttl <= 0:
+            return
+
+        entry = (time.time() + ttl, copy.deepcopy(value))
+        with self._lock:
+            self._remember(key, entry)
+            self._stats["stores"] += 1
+            if self._connect():
+                self._store_in_db(key, entry)
+
+    def clear(self) -> None:
+        """Remove every cached entry (memory and disk)."""
+        with self._lock:
+            self._entries.clear()
+            if self._connect():
+                with self._db:
+                    self._db.execute("DELETE FROM geolocation_cache")
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and current size."""
+        with self._lock:
+            return {**self._stats, "size": len(self._entries)}
+
+    def close(self) -> None:
+        """Close the SQLite backend, if any."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    @staticmethod
+    def make_key(kind: str, *parts: Optional[str]) -> str:
+        """
+        Build a cache key from a lookup kind and its (already normalized) parts.
+
+        Args:
+            kind: Lookup kind (e.g. "geocode", "ip").
+            parts: Normalized lookup parameters; None is stored as an empty string.
+
+        Returns:
+            Cache key string.
+        """
+        return "|".join([kind, *(part or "" for part in parts)])
+
+    def _remember(self, key: str, entry: Tuple[float, Dict]) -> None:
+        """Insert an entry in the in-memory LRU, evicting the oldest ones."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def _connect(self) -> bool:
+        """Whether the SQLite backend is in use, reopening it after `close()` (lock held)."""
+        if self._db is None and self._db_path is not None:
+            self._db = self._open_db(self._db_path)
+        return self._db is not None
+
+    def _open_db(self, path: Path) -> sqlite3.Connection:
+        """Open (and create if needed) the SQLite cache, dropping expired rows."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        db = sqlite3.connect(str(path), check_same_thread=False)
+        with db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS geolocation_cache ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " expires_at REAL NOT NULL,"
+                " stored_at REAL NOT NULL)"
+            )
+            db.execute("DELETE FROM geolocation_cache WHERE expires_at <= ?", (time.time(),))
+        return db
+
+    def _load_from_db(self, key: str) -> Optional[Tuple[float, Dict]]:
+        """Read an entry from SQLite."""
+        row = self._db.execute(
+            "SELECT expires_at, value FROM geolocation_cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        return (row[0], json.loads(row[1]))
+
+    def _store_in_db(self, key: str, entry: Tuple[float, Dict]) -> None:
+        """Write an entry to SQLite, pruning old rows periodically."""
+        expires_at, value = entry
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO geolocation_cache (key, value, expires_at, stored_at)"
+                " VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False), expires_at, time.time()),
+            )
+            self._writes += 1
+            if self._writes % self._PRUNE_EVERY_WRITES == 0:
+                self._db.execute(
+                    "DELETE FROM geolocation_cache WHERE expires_at <= ? OR key NOT IN"
+                    " (SELECT key FROM geolocation_cache ORDER BY stored_at DESC LIMIT ?)",
+                    (time.time(), self._max_entries),
+                )
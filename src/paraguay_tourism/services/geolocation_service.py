@@ -1,26 +1,116 @@
 """Service for geolocation operations (IP-based and geocoding)."""
 
-import json
-from typing import Dict, Optional, Tuple
+import importlib.util
+import time
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlsplit
 
-try:
-    import httpx
-    HTTPX_AVAILABLE = True
-except ImportError:
-    HTTPX_AVAILABLE = False
+from ..utils import normalize_key
+from .gazetteer import Gazetteer
+from .geolocation_cache import GeolocationCache
+from .metrics import MetricsRegistry
+from .resilience import ProviderGuard
+from .single_flight import SingleFlight
+
+# httpx is imported on the first request, not at start-up
+HTTPX_AVAILABLE = importlib.util.find_spec("httpx") is not None
 
 
 class GeolocationService:
-    """Service for obtaining user location via IP or geocoding."""
+    """
+    Service for obtaining user location via IP or geocoding.
+
+    Requests go through long-lived pooled HTTP clients (owned by the
+    `DependencyContainer`) so connections are kept alive between calls.
+    Every lookup has a synchronous and an `a`-prefixed asynchronous variant.
+    Concurrent identical lookups that miss the cache share one upstream request,
+    and each provider can be protected by a `ProviderGuard` (rate limit plus
+    circuit breaker) so overload fails fast instead of waiting out timeouts.
+    Geocoding consults the local `Gazetteer` first and only calls Nominatim
+    when it has no match. Upstream requests are timed and their failures
+    classified in an optional `MetricsRegistry`.
+    """
 
     # Free IP geolocation service (no API key required)
     IP_API_URL = "http://ip-api.com/json/"
-    
+
     # Free geocoding service (OpenStreetMap Nominatim)
     GEOCODING_URL = "https://nominatim.openstreetmap.org/search"
 
-    @staticmethod
-    def get_location_by_ip(ip: Optional[str] = None) -> Dict:
+    # Per-request timeouts in seconds
+    IP_TIMEOUT = 5.0
+    GEOCODING_TIMEOUT = 10.0
+
+    # Nominatim's usage policy requires an identifying User-Agent
+    GEOCODING_HEADERS = {
+        "User-Agent": "Paraguay-Tourism-MCP-Server/1.0 (contact: tourism@example.com)",
+    }
+
+    HTTPX_MISSING_ERROR = "httpx library not available. Install it with: pip install httpx"
+
+    def __init__(
+        self,
+        cache: Optional[GeolocationCache] = None,
+        http_client: "httpx.Client | None" = None,
+        async_http_client: "httpx.AsyncClient | None" = None,
+        http_client_factory: "Callable[[], httpx.Client] | None" = None,
+        async_http_client_factory: "Callable[[], httpx.AsyncClient] | None" = None,
+        ip_guard: Optional[ProviderGuard] = None,
+        geocoding_guard: Optional[ProviderGuard] = None,
+        gazetteer: Optional[Gazetteer] = None,
+        metrics: Optional[MetricsRegistry] = None,
+    ):
+        """
+        Initialize the service.
+
+        Args:
+            cache: Optional cache for IP geolocation and geocoding results. Successful
+                and "not found" answers are cached; transport errors are not.
+            http_client: Shared synchronous client. If None, one is created on first use.
+            async_http_client: Shared asynchronous client. If None, one is created on first use.
+            http_client_factory: Returns the shared synchronous client; called for each
+                request when no `http_client` is given, so building the server stays
+                cheap and the factory's owner can close and replace the client.
+            async_http_client_factory: Same for the asynchronous client.
+            ip_guard: Optional rate limiter / circuit breaker for ip-api.
+            geocoding_guard: Optional rate limiter / circuit breaker for Nominatim.
+            gazetteer: Optional local gazetteer tried before Nominatim.
+            metrics: Optional registry recording upstream request latency and errors.
+        """
+        self._cache = cache
+        self._http_client = http_client
+        self._async_http_client = async_http_client
+        self._http_client_factory = http_client_factory
+        self._async_http_client_factory = async_http_client_factory
+        self._single_flight = SingleFlight()
+        self._ip_guard = ip_guard
+        self._geocoding_guard = geocoding_guard
+        self._gazetteer = gazetteer
+        self._metrics = metrics
+
+    @property
+    def cache(self) -> Optional[GeolocationCache]:
+        """Result cache, if configured."""
+        return self._cache
+
+    def stats(self) -> Dict[str, Dict]:
+        """
+        Cache, request coalescing and provider guard counters.
+
+        Returns:
+            Dictionary with `cache` stats (empty if no cache), `single_flight`
+            stats (`calls`, `executions`, `coalesced`) and per-provider guard
+            stats under `providers`, and local `gazetteer` hit/miss counts.
+        """
+        guards = (self._ip_guard, self._geocoding_guard)
+        return {
+            "cache": self._cache.stats() if self._cache is not None else {},
+            "single_flight": self._single_flight.stats(),
+            "providers": {guard.name: guard.stats() for guard in guards if guard is not None},
+            "gazetteer": self._gazetteer.stats() if self._gazetteer is not None else {},
+        }
+
+    def get_location_by_ip(self, ip: Optional[str] = None) -> Dict:
         """
         Get approximate location based on IP address.
 
@@ -32,48 +122,55 @@ class GeolocationService:
             Returns error dict if geolocation fails.
         """
         if not HTTPX_AVAILABLE:
-            return {
-                "success": False,
-                "error": "httpx library not available. Install it with: pip install httpx",
-            }
+            return {"success": False, "error": self.HTTPX_MISSING_ERROR}
+
+        cache_key = self._ip_cache_key(ip)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
 
         try:
-            url = GeolocationService.IP_API_URL
-            if ip:
-                url += ip
-            else:
-                url += "?fields=status,message,lat,lon,city,country,countryCode,query"
-
-            with httpx.Client(timeout=5.0) as client:
-                response = client.get(url)
-                response.raise_for_status()
-                data = response.json()
-
-            if data.get("status") == "fail":
-                return {
-                    "success": False,
-                    "error": data.get("message", "Geolocation failed"),
-                }
-
-            return {
-                "success": True,
-                "latitude": data.get("lat"),
-                "longitude": data.get("lon"),
-                "city": data.get("city", ""),
-                "country": data.get("country", ""),
-                "country_code": data.get("countryCode", ""),
-                "ip": data.get("query", ip),
-                "raw": data,
-            }
+            data = self._single_flight.do(
+                cache_key,
+                lambda: self._fetch_json(
+                    self._ip_url(ip), self._ip_guard, timeout=self.IP_TIMEOUT
+                ),
+            )
+            return self._ip_result(data, ip, cache_key)
         except Exception as e:
-            return {
-                "success": False,
-                "error": f"Error getting location by IP: {str(e)}",
-            }
+            return self._ip_error(e)
+
+    async def aget_location_by_ip(self, ip: Optional[str] = None) -> Dict:
+        """
+        Get approximate location based on IP address without blocking the event loop.
+
+        Args:
+            ip: IP address to geolocate. If None, uses the current public IP.
+
+        Returns:
+            Same as `get_location_by_ip`.
+        """
+        if not HTTPX_AVAILABLE:
+            return {"success": False, "error": self.HTTPX_MISSING_ERROR}
+
+        cache_key = self._ip_cache_key(ip)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            data = await self._single_flight.ado(
+                cache_key,
+                lambda: self._afetch_json(
+                    self._ip_url(ip), self._ip_guard, timeout=self.IP_TIMEOUT
+                ),
+            )
+            return self._ip_result(data, ip, cache_key)
+        except Exception as e:
+            return self._ip_error(e)
 
-    @staticmethod
     def geocode_location(
-        query: str, country_code: Optional[str] = "py"
+        self, query: str, country_code: Optional[str] = "py"
     ) -> Dict:
         """
         Convert a location name (city, address, etc.) to coordinates using geocoding.
@@ -86,60 +183,310 @@ class GeolocationService:
             Dictionary with location data including latitude, longitude, display_name, etc.
             Returns error dict if geocoding fails.
         """
+        local = self._gazetteer_lookup(query, country_code)
+        if local is not None:
+            return local
+
         if not HTTPX_AVAILABLE:
-            return {
-                "success": False,
-                "error": "httpx library not available. Install it with: pip install httpx",
-            }
+            return {"success": False, "error": self.HTTPX_MISSING_ERROR}
+
+        cache_key = self._geocode_cache_key(query, country_code)
+        cached = self._geocode_cached(cache_key, query)
+        if cached is not None:
+            return cached
 
         try:
-            params = {
-                "q": query,
-                "format": "json",
-                "limit": 1,
-                "addressdetails": 1,
-            }
-            
-            if country_code:
-                params["countrycodes"] = country_code
+            results = self._single_flight.do(
+                cache_key,
+                lambda: self._fetch_json(
+                    self.GEOCODING_URL,
+                    self._geocoding_guard,
+                    params=self._geocode_params(query, country_code),
+                    headers=self.GEOCODING_HEADERS,
+                    timeout=self.GEOCODING_TIMEOUT,
+                ),
+            )
+            return self._geocode_result(results, query, cache_key)
+        except Exception as e:
+            return self._geocode_error(e)
 
-            headers = {
-                "User-Agent": "Paraguay-Tourism-MCP-Server/1.0 (contact: tourism@example.com)",
-            }
+    async def ageocode_location(
+        self, query: str, country_code: Optional[str] = "py"
+    ) -> Dict:
+        """
+        Convert a location name to coordinates without blocking the event loop.
 
-            with httpx.Client(timeout=10.0, headers=headers) as client:
-                response = client.get(GeolocationService.GEOCODING_URL, params=params)
-                response.raise_for_status()
-                results = response.json()
-
-            if not results:
-                return {
-                    "success": False,
-                    "error": f"No se encontró la ubicación: {query}",
-                }
-
-            result = results[0]
-            return {
-                "success": True,
-                "latitude": float(result.get("lat", 0)),
-                "longitude": float(result.get("lon", 0)),
-                "display_name": result.get("display_name", ""),
-                "query": query,
-                "raw": result,
-            }
+        Args:
+            query: Location name (e.g., "Asunción", "Asunción, Paraguay", "Palacio de los López").
+            country_code: Optional country code to limit search (default: "py" for Paraguay).
+
+        Returns:
+            Same as `geocode_location`.
+        """
+        local = self._gazetteer_lookup(query, country_code)
+        if local is not None:
+            return local
+
+        if not HTTPX_AVAILABLE:
+            return {"success": False, "error": self.HTTPX_MISSING_ERROR}
+
+        cache_key = self._geocode_cache_key(query, country_code)
+        cached = self._geocode_cached(cache_key, query)
+        if cached is not None:
+            return cached
+
+        try:
+            results = await self._single_flight.ado(
+                cache_key,
+                lambda: self._afetch_json(
+                    self.GEOCODING_URL,
+                    self._geocoding_guard,
+                    params=self._geocode_params(query, country_code),
+                    headers=self.GEOCODING_HEADERS,
+                    timeout=self.GEOCODING_TIMEOUT,
+                ),
+            )
+            return self._geocode_result(results, query, cache_key)
         except Exception as e:
-            return {
-                "success": False,
-                "error": f"Error en geocoding: {str(e)}",
-            }
+            return self._geocode_error(e)
 
-    @staticmethod
-    def get_current_location() -> Dict:
+    def get_current_location(self) -> Dict:
         """
         Get current location using IP geolocation (convenience method).
 
         Returns:
             Dictionary with location data or error.
         """
-        return GeolocationService.get_location_by_ip()
+        return self.get_location_by_ip()
+
+    async def aget_current_location(self) -> Dict:
+        """
+        Get current location using IP geolocation without blocking the event loop.
+
+        Returns:
+            Dictionary with location data or error.
+        """
+        return await self.aget_location_by_ip()
+
+    def _fetch_json(self, url: str, guard: Optional[ProviderGuard], **kwargs):
+        """GET a URL with the shared synchronous client and decode its JSON body."""
+        if guard is not None:
+            guard.acquire()
+        start = time.perf_counter()
+        try:
+            response = self._client().get(url, **kwargs)
+            response.raise_for_status()
+            data = response.json()
+        except Exception as e:
+            self._observe(url, guard, start, e)
+            self._record_outcome(guard, e)
+            raise
+        except BaseException:
+            # Cancelled (or interrupted) mid-request: no outcome, but free a half-open trial slot
+            if guard is not None:
+                guard.release()
+            raise
+        self._observe(url, guard, start, None)
+        self._record_outcome(guard, None)
+        return data
+
+    async def _afetch_json(self, url: str, guard: Optional[ProviderGuard], **kwargs):
+        """GET a URL with the shared asynchronous client and decode its JSON body."""
+        if guard is not None:
+            await guard.aacquire()
+        start = time.perf_counter()
+        try:
+            response = await self._async_client().get(url, **kwargs)
+            response.raise_for_status()
+            data = response.json()
+        except Exception as e:
+            self._observe(url, guard, start, e)
+            self._record_outcome(guard, e)
+            raise
+        except BaseException:
+            # Cancelled (or interrupted) mid-request: no outcome, but free a half-open trial slot
+            if guard is not None:
+                guard.release()
+            raise
+        self._observe(url, guard, start, None)
+        self._record_outcome(guard, None)
+        return data
+
+    def _observe(
+        self, url: str, guard: Optional[ProviderGuard], start: float, error: Optional[Exception]
+    ) -> None:
+        """Record an upstream request's latency and error kind in the metrics registry."""
+        if self._metrics is None:
+            return
+        import httpx
+
+        provider = guard.name if guard is not None else (urlsplit(url).hostname or url)
+        kind = None
+        if isinstance(error, httpx.TimeoutException):
+            kind = "timeout"
+        elif isinstance(error, httpx.HTTPStatusError):
+            kind = "http_status"
+        elif error is not None:
+            kind = "error"
+        self._metrics.observe_upstream(provider, time.perf_counter() - start, kind)
+
+    @staticmethod
+    def _record_outcome(guard: Optional[ProviderGuard], error: Optional[Exception]) -> None:
+        """Report a request outcome to the provider's circuit breaker."""
+        if guard is None:
+            return
+        if error is None:
+            guard.record_success()
+            return
+        # Client errors (other than throttling) mean the provider itself is healthy
+        import httpx
+
+        if isinstance(error, httpx.HTTPStatusError):
+            status = error.response.status_code
+            if status < 500 and status != 429:
+                guard.record_success()
+                return
+        guard.record_failure()
+
+    def _client(self) -> "httpx.Client":
+        """Shared synchronous client, created on first use if none was injected."""
+        if self._http_client is None:
+            if self._http_client_factory is not None:
+                # Not kept: the factory's owner manages the client's lifetime
+                return self._http_client_factory()
+            import httpx
+
+            self._http_client = httpx.Client()
+        return self._http_client
+
+    def _async_client(self) -> "httpx.AsyncClient":
+        """Shared asynchronous client, created on first use if none was injected."""
+        if self._async_http_client is None:
+            if self._async_http_client_factory is not None:
+                return self._async_http_client_factory()
+            import httpx
+
+            self._async_http_client = httpx.AsyncClient()
+        return self._async_http_client
+
+    def _ip_url(self, ip: Optional[str]) -> str:
+        """Build the ip-api URL for an IP (or the caller's public IP)."""
+        url = self.IP_API_URL
+        if ip:
+            return url + ip
+        return url + "?fields=status,message,lat,lon,city,country,countryCode,query"
+
+    @staticmethod
+    def _ip_cache_key(ip: Optional[str]) -> str:
+        """Cache key for an IP lookup."""
+        return GeolocationCache.make_key("ip", ip.strip() if ip else None)
+
+    def _ip_result(self, data: Dict, ip: Optional[str], cache_key: str) -> Dict:
+        """Convert an ip-api response into a result dict and cache it."""
+        if data.get("status") == "fail":
+            result = {
+                "success": False,
+                "error": data.get("message", "Geolocation failed"),
+            }
+            self._cache_set(cache_key, result, negative=True)
+            return result
+
+        result = {
+            "success": True,
+            "latitude": data.get("lat"),
+            "longitude": data.get("lon"),
+            "city": data.get("city", ""),
+            "country": data.get("country", ""),
+            "country_code": data.get("countryCode", ""),
+            "ip": data.get("query", ip),
+            "raw": data,
+        }
+        self._cache_set(cache_key, result)
+        return result
+
+    @staticmethod
+    def _ip_error(error: Exception) -> Dict:
+        """Error dict for a failed IP lookup."""
+        return {
+            "success": False,
+            "error": f"Error getting location by IP: {str(error)}",
+        }
+
+    def _gazetteer_lookup(self, query: str, country_code: Optional[str]) -> Optional[Dict]:
+        """Local gazetteer match, if a gazetteer is configured."""
+        if self._gazetteer is None:
+            return None
+        return self._gazetteer.lookup(query, country_code)
+
+    @staticmethod
+    def _geocode_cache_key(query: str, country_code: Optional[str]) -> str:
+        """Cache key for a geocoding lookup."""
+        return GeolocationCache.make_key(
+            "geocode", normalize_key(query), normalize_key(country_code or "")
+        )
+
+    def _geocode_cached(self, cache_key: str, query: str) -> Optional[Dict]:
+        """Cached geocoding result, adapted to the caller's query spelling."""
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            # Equivalent queries share an entry; echo the caller's spelling
+            if cached.get("success"):
+                cached["query"] = query
+            else:
+                cached["error"] = f"No se encontró la ubicación: {query}"
+        return cached
+
+    @staticmethod
+    def _geocode_params(query: str, country_code: Optional[str]) -> Dict:
+        """Nominatim query parameters."""
+        params = {
+            "q": query,
+            "format": "json",
+            "limit": 1,
+            "addressdetails": 1,
+        }
+
+        if country_code:
+            params["countrycodes"] = country_code
+        return params
+
+    def _geocode_result(self, results: List[Dict], query: str, cache_key: str) -> Dict:
+        """Convert a Nominatim response into a result dict and cache it."""
+        if not results:
+            not_found = {
+                "success": False,
+                "error": f"No se encontró la ubicación: {query}",
+            }
+            self._cache_set(cache_key, not_found, negative=True)
+            return not_found
+
+        result = results[0]
+        location = {
+            "success": True,
+            "latitude": float(result.get("lat", 0)),
+            "longitude": float(result.get("lon", 0)),
+            "display_name": result.get("display_name", ""),
+            "query": query,
+            "raw": result,
+        }
+        self._cache_set(cache_key, location)
+        return location
+
+    @staticmethod
+    def _geocode_error(error: Exception) -> Dict:
+        """Error dict for a failed geocoding lookup."""
+        return {
+            "success": False,
+            "error": f"Error en geocoding: {str(error)}",
+        }
+
+    def _cache_get(self, key: str) -> Optional[Dict]:
+        """Look up a cached result, if a cache is configured."""
+        if self._cache is None:
+            return None
+        return self._cache.get(key)
 
+    def _cache_set(self, key: str, value: Dict, negative: bool = False) -> None:
+        """Store a result, if a cache is configured."""
+        if self._cache is not None:
+            self._cache.set(key, value, negative=negative)
@@ -1,9 +1,11 @@
 """Service for location-based calculations and distance operations."""
 
+import heapq
 import math
-from typing import List, Tuple
+from typing import List, Optional, Sequence, Tuple
 
-from ..models import Place
+from ..repositories import PlaceLike
+from ..repositories import CoordinateArrays, SpatialIndex
 
 
 class LocationService:
@@ -12,6 +14,12 @@ class LocationService:
     # Earth's radius in kilometers
     EARTH_RADIUS_KM = 6371.0
 
+    # Safety margin (degrees, ~1 cm) added to bounding boxes to absorb rounding
+    _BBOX_MARGIN_DEG = 1e-7
+
+    # Largest origins x places distance matrix computed at once (8 MB of float64)
+    MAX_MATRIX_CELLS = 1_000_000
+
     @staticmethod
     def calculate_distance_km(
         lat1: float, lng1: float, lat2: float, lng2: float
@@ -51,34 +59,592 @@ class LocationService:
         distance = LocationService.EARTH_RADIUS_KM * c
         return distance
 
+    @staticmethod
+    def bounding_box(
+        center_lat: float, center_lng: float, max_distance_km: float
+    ) -> Optional[Tuple[float, float, float, float]]:
+        """
+        Compute a bounding box containing every point within a distance of a center point.
+
+        Uses the spherical bounding-circle method, so the box is exact on the
+        sphere used by `calculate_distance_km` (plus a tiny safety margin).
+
+        Args:
+            center_lat: Latitude of the center point in decimal degrees.
+            center_lng: Longitude of the center point in decimal degrees.
+            max_distance_km: Radius in kilometers.
+
+        Returns:
+            Tuple (min_lat, max_lat, min_lng, max_lng) in decimal degrees, where
+            min_lng > max_lng means the box crosses the antimeridian. None if no
+            useful box exists (invalid input or a radius covering the whole globe).
+        """
+        values = (center_lat, center_lng, max_distance_km)
+        if not all(math.isfinite(value) for value in values):
+            return None
+        if not -90.0 <= center_lat <= 90.0 or max_distance_km < 0:
+            return None
+
+        angular_radius = max_distance_km / LocationService.EARTH_RADIUS_KM
+        if angular_radius >= math.pi:
+            return None
+
+        margin = LocationService._BBOX_MARGIN_DEG
+        radius_deg = math.degrees(angular_radius) + margin
+        min_lat = center_lat - radius_deg
+        max_lat = center_lat + radius_deg
+
+        if min_lat <= -90.0 or max_lat >= 90.0:
+            # Box touches a pole: every longitude is reachable
+            return (max(min_lat, -90.0), min(max_lat, 90.0), -180.0, 180.0)
+
+        ratio = math.sin(angular_radius) / math.cos(math.radians(center_lat))
+        if ratio >= 1.0:
+            return (min_lat, max_lat, -180.0, 180.0)
+        delta_lng = math.degrees(math.asin(ratio)) + margin
+        if delta_lng >= 180.0:
+            return (min_lat, max_lat, -180.0, 180.0)
+
+        # Normalize the center longitude to [-180, 180) before wrapping the edges
+        lng = (center_lng + 180.0) % 360.0 - 180.0
+        min_lng = lng - delta_lng
+        max_lng = lng + delta_lng
+        if min_lng < -180.0:
+            min_lng += 360.0
+        if max_lng > 180.0:
+            max_lng -= 360.0
+        return (min_lat, max_lat, min_lng, max_lng)
+
+    @staticmethod
+    def distances_km(
+        coordinates: CoordinateArrays,
+        center_lat: float,
+        center_lng: float,
+        positions: Optional[Sequence[int]] = None,
+    ) -> Sequence[float]:
+        """
+        Calculate Haversine distances from a center point to many places in one pass.
+
+        Uses the precomputed radians and cos(lat) columns. With NumPy the whole
+        batch is computed with array operations; otherwise a pure-Python loop is
+        used. Both match `calculate_distance_km` to within 1e-9 km.
+
+        Args:
+            coordinates: Coordinate columns of the places.
+            center_lat: Latitude of the center point in decimal degrees.
+            center_lng: Longitude of the center point in decimal degrees.
+            positions: Optional positions to measure. If None, measures every place.
+
+        Returns:
+            Distances in kilometers, in the order of `positions` (a float64 ndarray
+            when `coordinates.vectorized`, a list otherwise).
+        """
+        lat1 = math.radians(center_lat)
+        lng1 = math.radians(center_lng)
+        cos_lat1 = math.cos(lat1)
+
+        if coordinates.vectorized:
+            # Vectorized columns mean NumPy is installed and already imported
+            import numpy as np
+
+            if positions is None:
+                lat2, lng2, cos_lat2 = coordinates.lat_rad, coordinates.lng_rad, coordinates.cos_lat
+            else:
+                index = np.asarray(positions, dtype=np.intp)
+                lat2 = coordinates.lat_rad[index]
+                lng2 = coordinates.lng_rad[index]
+                cos_lat2 = coordinates.cos_lat[index]
+            a = np.sin((lat2 - lat1) / 2) ** 2 + cos_lat1 * cos_lat2 * np.sin((lng2 - lng1) / 2) ** 2
+            return LocationService.EARTH_RADIUS_KM * (2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a)))
+
+        if positions is None:
+            positions = range(len(coordinates))
+        lat_rad, lng_rad, cos_lat = coordinates.lat_rad, coordinates.lng_rad, coordinates.cos_lat
+        distances = []
+        for position in positions:
+            a = (
+                math.sin((lat_rad[position] - lat1) / 2) ** 2
+                + cos_lat1 * cos_lat[position] * math.sin((lng_rad[position] - lng1) / 2) ** 2
+            )
+            distances.append(
+                LocationService.EARTH_RADIUS_KM * (2 * math.atan2(math.sqrt(a), math.sqrt(1 - a)))
+            )
+        return distances
+
+    @staticmethod
+    def distance_matrix(coordinates: CoordinateArrays) -> List[List[float]]:
+        """
+        Calculate Haversine distances between every pair of places.
+
+        With NumPy the whole matrix is computed in one broadcast pass over the
+        radian columns; otherwise each pair is computed once in a pure-Python
+        loop and mirrored. Both match `calculate_distance_km` to within 1e-9 km.
+
+        Args:
+            coordinates: Coordinate columns of the places.
+
+        Returns:
+            Symmetric matrix of distances in kilometers as a list of rows (row i,
+            column j: place i to place j), with a zero diagonal.
+        """
+        if coordinates.vectorized:
+            import numpy as np
+
+            lat, lng, cos_lat = coordinates.lat_rad, coordinates.lng_rad, coordinates.cos_lat
+            a = (
+                np.sin((lat[None, :] - lat[:, None]) / 2) ** 2
+                + cos_lat[:, None] * cos_lat[None, :] * np.sin((lng[None, :] - lng[:, None]) / 2) ** 2
+            )
+            matrix = LocationService.EARTH_RADIUS_KM * (2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a)))
+            return matrix.tolist()
+
+        lat_rad, lng_rad, cos_lat = coordinates.lat_rad, coordinates.lng_rad, coordinates.cos_lat
+        count = len(coordinates)
+        matrix = [[0.0] * count for _ in range(count)]
+        for i in range(count):
+            for j in range(i + 1, count):
+                a = (
+                    math.sin((lat_rad[j] - lat_rad[i]) / 2) ** 2
+                    + cos_lat[i] * cos_lat[j] * math.sin((lng_rad[j] - lng_rad[i]) / 2) ** 2
+                )
+                distance = LocationService.EARTH_RADIUS_KM * (2 * math.atan2(math.sqrt(a), math.sqrt(1 - a)))
+                matrix[i][j] = matrix[j][i] = distance
+        return matrix
+
     @staticmethod
     def filter_places_by_distance(
-        places: List[Place],
+        places: Sequence[PlaceLike],
         center_lat: float,
         center_lng: float,
         max_distance_km: float,
-    ) -> List[Tuple[Place, float]]:
+        spatial_index: Optional[SpatialIndex] = None,
+        coordinates: Optional[CoordinateArrays] = None,
+    ) -> List[Tuple[PlaceLike, float]]:
         """
         Filter places within a specified distance from a center point.
 
         Args:
-            places: List of Place models to filter.
+            places: Places (models or catalog rows) to filter.
             center_lat: Latitude of the center point in decimal degrees.
             center_lng: Longitude of the center point in decimal degrees.
             max_distance_km: Maximum distance in kilometers from the center point.
+            spatial_index: Optional index built over `places` (same order). When
+                given, only places inside the search radius' bounding box are
+                measured; results are identical to the full scan.
+            coordinates: Optional coordinate columns of `places` (same order).
+                When given, distances are computed in one batch by `distances_km`.
 
         Returns:
             List of tuples containing (Place, distance_km) sorted by distance (closest first).
         """
-        results = []
-        for place in places:
-            distance = LocationService.calculate_distance_km(
-                center_lat, center_lng, place.lat, place.lng
+        positions: Optional[List[int]] = None
+        if spatial_index is not None:
+            bbox = LocationService.bounding_box(center_lat, center_lng, max_distance_km)
+            if bbox is not None:
+                positions = spatial_index.query_bbox(*bbox)
+
+        if coordinates is not None and coordinates.vectorized:
+            import numpy as np
+
+            distances = LocationService.distances_km(
+                coordinates, center_lat, center_lng, positions
             )
-            if distance <= max_distance_km:
-                results.append((place, distance))
+            index = (
+                np.arange(len(places)) if positions is None
+                else np.asarray(positions, dtype=np.intp)
+            )
+            mask = distances <= max_distance_km
+            index, distances = index[mask], distances[mask]
+            # Stable sort keeps catalog order for equal distances
+            order = np.argsort(distances, kind="stable")
+            return [
+                (places[position], distance)
+                for position, distance in zip(index[order].tolist(), distances[order].tolist())
+            ]
+
+        if positions is None:
+            positions = list(range(len(places)))
+        distances = LocationService._measure(
+            places, coordinates, center_lat, center_lng, positions
+        )
+
+        results = [
+            (places[position], distance)
+            for position, distance in zip(positions, distances)
+            if distance <= max_distance_km
+        ]
 
         # Sort by distance (closest first)
         results.sort(key=lambda x: x[1])
         return results
 
+    @staticmethod
+    def filter_places_by_distance_batch(
+        places: Sequence[PlaceLike],
+        origins: Sequence[Tuple[float, float, float]],
+        spatial_index: Optional[SpatialIndex] = None,
+        coordinates: Optional[CoordinateArrays] = None,
+    ) -> List[List[Tuple[PlaceLike, float]]]:
+        """
+        Filter places around many origins in one call.
+
+        With vectorized coordinates, distances are computed as an origins x places
+        matrix, a block of origins at a time so the matrix never exceeds
+        `MAX_MATRIX_CELLS` entries. Otherwise each origin is handled by
+        `filter_places_by_distance`.
+
+        Args:
+            places: Places (models or catalog rows) to filter.
+            origins: (latitude, longitude, max_distance_km) for each origin.
+            spatial_index: Optional index built over `places` (same order).
+            coordinates: Optional coordinate columns of `places` (same order).
+
+        Returns:
+            One list per origin (same order as `origins`) of (Place, distance_km)
+            tuples sorted by distance, identical to `filter_places_by_distance`.
+        """
+        if coordinates is None or not coordinates.vectorized or not places:
+            return [
+                LocationService.filter_places_by_distance(
+                    places,
+                    center_lat,
+                    center_lng,
+                    max_distance_km,
+                    spatial_index=spatial_index,
+                    coordinates=coordinates,
+                )
+                for center_lat, center_lng, max_distance_km in origins
+            ]
+
+        import numpy as np
+
+        block_size = max(1, LocationService.MAX_MATRIX_CELLS // len(places))
+        results: List[List[Tuple[PlaceLike, float]]] = []
+        for start in range(0, len(origins), block_size):
+            block = origins[start:start + block_size]
+            lat1 = np.radians(np.array([origin[0] for origin in block], dtype=np.float64))[:, None]
+            lng1 = np.radians(np.array([origin[1] for origin in block], dtype=np.float64))[:, None]
+            limits = np.array([origin[2] for origin in block], dtype=np.float64)[:, None]
+
+            a = (
+                np.sin((coordinates.lat_rad - lat1) / 2) ** 2
+                + np.cos(lat1) * coordinates.cos_lat * np.sin((coordinates.lng_rad - lng1) / 2) ** 2
+            )
+            matrix = LocationService.EARTH_RADIUS_KM * (2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a)))
+            within = matrix <= limits
+
+            for row, mask in zip(matrix, within):
+                index = np.flatnonzero(mask)
+                distances = row[index]
+                # Stable sort keeps catalog order for equal distances
+                order = np.argsort(distances, kind="stable")
+                results.append([
+                    (places[position], distance)
+                    for position, distance in zip(index[order].tolist(), distances[order].tolist())
+                ])
+        return results
+
+    @staticmethod
+    def find_k_nearest(
+        places: Sequence[PlaceLike],
+        center_lat: float,
+        center_lng: float,
+        k: int,
+        max_distance_km: Optional[float] = None,
+        spatial_index: Optional[SpatialIndex] = None,
+        coordinates: Optional[CoordinateArrays] = None,
+    ) -> List[Tuple[PlaceLike, float]]:
+        """
+        Find the k places closest to a center point.
+
+        Keeps a bounded heap of k entries instead of sorting every match. With a
+        spatial index, the search radius starts at one grid cell and doubles
+        until it holds k places (or reaches `max_distance_km`), so only nearby
+        cells are measured.
+
+        Args:
+            places: Places (models or catalog rows) to search.
+            center_lat: Latitude of the center point in decimal degrees.
+            center_lng: Longitude of the center point in decimal degrees.
+            k: Maximum number of places to return.
+            max_distance_km: Optional maximum distance in kilometers from the center point.
+            spatial_index: Optional index built over `places` (same order).
+            coordinates: Optional coordinate columns of `places` (same order).
+
+        Returns:
+            Up to k tuples of (Place, distance_km) sorted by distance (closest first).
+            Ties keep catalog order, as in `filter_places_by_distance`.
+        """
+        if k <= 0 or not places:
+            return []
+
+        limit = math.inf if max_distance_km is None else max_distance_km
+        positions: Sequence[int] = range(len(places))
+        distances: Optional[List[float]] = None
+
+        if spatial_index is not None:
+            # One grid cell of latitude, in kilometers
+            radius_km = math.radians(spatial_index.cell_size_deg) * LocationService.EARTH_RADIUS_KM
+            while True:
+                radius_km = min(radius_km, limit)
+                bbox = LocationService.bounding_box(center_lat, center_lng, radius_km)
+                if bbox is None:
+                    positions = range(len(places))
+                    distances = None
+                    break
+                positions = spatial_index.query_bbox(*bbox)
+                distances = LocationService._measure(
+                    places, coordinates, center_lat, center_lng, positions
+                )
+                within = sum(1 for distance in distances if distance <= radius_km)
+                if within >= k or radius_km >= limit:
+                    break
+                radius_km *= 2
+
+        if distances is None:
+            distances = LocationService._measure(
+                places, coordinates, center_lat, center_lng, positions
+            )
+
+        nearest = heapq.nsmallest(
+            k,
+            (
+                (distance, position)
+                for position, distance in zip(positions, distances)
+                if distance <= limit
+            ),
+        )
+        return [(places[position], distance) for distance, position in nearest]
+
+    @staticmethod
+    def places_in_bbox(
+        places: Sequence[PlaceLike],
+        min_lat: float,
+        max_lat: float,
+        min_lng: float,
+        max_lng: float,
+        spatial_index: Optional[SpatialIndex] = None,
+    ) -> List[PlaceLike]:
+        """
+        Find the places inside a bounding box (e.g. a map viewport).
+
+        Args:
+            places: Places (models or catalog rows) to search.
+            min_lat: Southern edge in decimal degrees.
+            max_lat: Northern edge in decimal degrees.
+            min_lng: Western edge in decimal degrees.
+            max_lng: Eastern edge in decimal degrees. If smaller than `min_lng`,
+                the box crosses the antimeridian.
+            spatial_index: Optional index built over `places` (same order). When
+                given, only the grid cells overlapping the box are visited.
+
+        Returns:
+            Places inside the box (edges included), in catalog order.
+
+        Raises:
+            ValueError: If the box is invalid (latitudes outside [-90, 90] or
+                `min_lat > max_lat`, longitudes outside [-180, 180]).
+        """
+        box = (min_lat, max_lat, min_lng, max_lng)
+        if not (
+            all(math.isfinite(value) for value in box)
+            and -90.0 <= min_lat <= max_lat <= 90.0
+            and -180.0 <= min_lng <= 180.0
+            and -180.0 <= max_lng <= 180.0
+        ):
+            raise ValueError(
+                "Rectángulo inválido: se espera -90 <= min_lat <= max_lat <= 90 y longitudes entre -180 y 180"
+            )
+
+        if spatial_index is not None:
+            positions = spatial_index.query_bbox(*box)
+        else:
+            positions = [
+                position for position, place in enumerate(places)
+                if LocationService._in_box(place.lat, place.lng, box)
+            ]
+        return [places[position] for position in positions]
+
+    @staticmethod
+    def point_in_polygon(
+        lat: float, lng: float, polygon: Sequence[Tuple[float, float]]
+    ) -> bool:
+        """
+        Check whether a point lies inside a polygon (ray casting, even-odd rule).
+
+        The polygon is treated as planar in latitude/longitude, which is how
+        administrative boundaries are usually drawn on a map. Points exactly on
+        an edge may be reported on either side.
+
+        Args:
+            lat: Latitude of the point in decimal degrees.
+            lng: Longitude of the point in decimal degrees.
+            polygon: (lat, lng) vertices in order; the ring is closed implicitly.
+
+        Returns:
+            True if the point is inside the polygon.
+        """
+        inside = False
+        lat_j, lng_j = polygon[-1]
+        for lat_i, lng_i in polygon:
+            # Edge (j -> i) straddles the point's latitude and crosses the ray east of it
+            if (lat_i > lat) != (lat_j > lat) and (
+                lng < (lng_j - lng_i) * (lat - lat_i) / (lat_j - lat_i) + lng_i
+            ):
+                inside = not inside
+            lat_j, lng_j = lat_i, lng_i
+        return inside
+
+    @staticmethod
+    def places_in_polygon(
+        places: Sequence[PlaceLike],
+        polygon: Sequence[Tuple[float, float]],
+        spatial_index: Optional[SpatialIndex] = None,
+        coordinates: Optional[CoordinateArrays] = None,
+    ) -> List[PlaceLike]:
+        """
+        Find the places inside a polygon (e.g. a department boundary).
+
+        Candidates are first narrowed to the polygon's bounding box (through the
+        spatial index when given), so only places near the polygon are tested.
+        With vectorized coordinates the candidates are tested against every edge
+        with array operations; otherwise `point_in_polygon` is applied to each.
+
+        Each edge runs the shorter way around the globe, so a polygon may cross
+        the antimeridian (e.g. around Fiji): its longitudes are unwrapped into
+        one continuous range and places are tested in that range.
+
+        Args:
+            places: Places (models or catalog rows) to search.
+            polygon: (lat, lng) vertices in decimal degrees, in order; the ring is
+                closed implicitly (a repeated first vertex is accepted).
+            spatial_index: Optional index built over `places` (same order).
+            coordinates: Optional coordinate columns of `places` (same order).
+
+        Returns:
+            Places inside the polygon, in catalog order.
+
+        Raises:
+            ValueError: If the polygon has fewer than 3 vertices, invalid
+                coordinates, or encircles a pole.
+        """
+        vertices = [(float(lat), float(lng)) for lat, lng in polygon]
+        if len(vertices) > 1 and vertices[0] == vertices[-1]:
+            vertices.pop()
+        if len(vertices) < 3:
+            raise ValueError("El polígono debe tener al menos 3 vértices")
+        if not all(
+            math.isfinite(lat) and math.isfinite(lng) and -90.0 <= lat <= 90.0 and -180.0 <= lng <= 180.0
+            for lat, lng in vertices
+        ):
+            raise ValueError("Vértices inválidos: se espera -90 <= lat <= 90 y -180 <= lng <= 180")
+
+        vertices = LocationService._unwrap_ring(vertices)
+        lats = [lat for lat, _ in vertices]
+        lngs = [lng for _, lng in vertices]
+        west, east = min(lngs), max(lngs)
+        # Unwrapped longitudes lie in [west, east] with west in [-180, 180); east > 180
+        # means the polygon crosses the antimeridian and so does its bounding box
+        box = (min(lats), max(lats), west, east - 360.0 if east > 180.0 else east)
+        if spatial_index is not None:
+            positions = spatial_index.query_bbox(*box)
+        else:
+            positions = [
+                position for position, place in enumerate(places)
+                if LocationService._in_box(place.lat, place.lng, box)
+            ]
+        if not positions:
+            return []
+
+        if coordinates is not None and coordinates.vectorized:
+            import numpy as np
+
+            # Ray casting over the candidates' radian columns, one edge at a time
+            index = np.asarray(positions, dtype=np.intp)
+            lat = coordinates.lat_rad[index]
+            lng = coordinates.lng_rad[index]
+            if east > 180.0:
+                lng = np.where(lng < math.radians(west), lng + 2 * math.pi, lng)
+            ring = np.radians(np.asarray(vertices, dtype=np.float64))
+            inside = np.zeros(len(index), dtype=bool)
+            lat_j, lng_j = ring[-1]
+            for lat_i, lng_i in ring:
+                if lat_i != lat_j:
+                    straddles = (lat_i > lat) != (lat_j > lat)
+                    crossing = (lng_j - lng_i) * (lat - lat_i) / (lat_j - lat_i) + lng_i
+                    inside ^= straddles & (lng < crossing)
+                lat_j, lng_j = lat_i, lng_i
+            return [places[position] for position in index[inside].tolist()]
+
+        shift = 360.0 if east > 180.0 else 0.0
+        return [
+            places[position] for position in positions
+            if LocationService.point_in_polygon(
+                places[position].lat,
+                places[position].lng + (shift if places[position].lng < west else 0.0),
+                vertices,
+            )
+        ]
+
+    @staticmethod
+    def _unwrap_ring(vertices: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
+        """
+        Make a ring's longitudes continuous, taking each edge the shorter way around.
+
+        Args:
+            vertices: (lat, lng) vertices with longitudes in [-180, 180].
+
+        Returns:
+            The vertices with longitudes shifted by multiples of 360 so that no edge
+            spans more than 180 degrees and the smallest longitude is in [-180, 180).
+            Rings that do not cross the antimeridian are returned unchanged.
+
+        Raises:
+            ValueError: If the ring encircles a pole (its longitudes wrap all the way around).
+        """
+        unwrapped = [vertices[0]]
+        for lat, lng in vertices[1:]:
+            previous = unwrapped[-1][1]
+            lng += 360.0 * round((previous - lng) / 360.0)
+            unwrapped.append((lat, lng))
+        # The closing edge must also be short: otherwise the ring wraps around a pole
+        if abs(vertices[0][1] - unwrapped[-1][1]) > 180.0:
+            raise ValueError("El polígono no puede rodear un polo")
+
+        west = min(lng for _, lng in unwrapped)
+        shift = -360.0 * math.floor((west + 180.0) / 360.0)
+        if shift:
+            unwrapped = [(lat, lng + shift) for lat, lng in unwrapped]
+        return unwrapped
+
+    @staticmethod
+    def _in_box(lat: float, lng: float, box: Tuple[float, float, float, float]) -> bool:
+        """Whether a point lies inside a (min_lat, max_lat, min_lng, max_lng) box."""
+        min_lat, max_lat, min_lng, max_lng = box
+        if not min_lat <= lat <= max_lat:
+            return False
+        if min_lng <= max_lng:
+            return min_lng <= lng <= max_lng
+        # Crosses the antimeridian
+        return lng >= min_lng or lng <= max_lng
+
+    @staticmethod
+    def _measure(
+        places: Sequence[PlaceLike],
+        coordinates: Optional[CoordinateArrays],
+        center_lat: float,
+        center_lng: float,
+        positions: Sequence[int],
+    ) -> List[float]:
+        """Distances (km) from the center to the places at `positions`, as a list."""
+        if coordinates is not None:
+            distances = LocationService.distances_km(
+                coordinates, center_lat, center_lng, positions
+            )
+            return distances.tolist() if coordinates.vectorized else distances
+        return [
+            LocationService.calculate_distance_km(
+                center_lat, center_lng, places[position].lat, places[position].lng
+            )
+            for position in positions
+        ]
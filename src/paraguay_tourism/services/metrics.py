@@ -0,0 +1,410 @@
+"""In-process metrics: tool calls, stage timers and upstream HTTP requests."""
+
+import bisect
+import contextlib
+import functools
+import inspect
+import math
+import os
+import tempfile
+import threading
+import time
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Per-call stage durations collected while a `MetricsRegistry.trace_stages` block is active
+_stage_trace: ContextVar[Optional[Dict[str, float]]] = ContextVar("stage_trace", default=None)
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram (Prometheus style) with count, sum, min and max.
+
+    Quantiles are estimated by linear interpolation inside the bucket that
+    holds them, as Prometheus' `histogram_quantile` does, narrowed to the
+    observed min and max.
+    """
+
+    __slots__ = ("bounds", "counts", "count", "sum", "min", "max")
+
+    def __init__(self, bounds: Sequence[float]):
+        """
+        Initialize an empty histogram.
+
+        Args:
+            bounds: Ascending bucket upper bounds; a final +Inf bucket is implicit.
+        """
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one value."""
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float:
+        """Estimated q-quantile (0 <= q <= 1); 0.0 when empty."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            if cumulative + bucket_count >= rank and bucket_count:
+                lower = max(self.bounds[index - 1] if index > 0 else 0.0, self.min)
+                upper = min(self.bounds[index] if index < len(self.bounds) else self.max, self.max)
+                return lower + (upper - lower) * (rank - cumulative) / bucket_count
+            cumulative += bucket_count
+        return self.max
+
+    def summary(self, scale: float = 1.0, digits: int = 3) -> Dict:
+        """Count, mean, p50/p90/p99 and max, multiplied by `scale` (e.g. 1000 for ms)."""
+        mean = self.sum / self.count if self.count else 0.0
+        return {
+            "count": self.count,
+            "mean": round(mean * scale, digits),
+            "p50": round(self.quantile(0.50) * scale, digits),
+            "p90": round(self.quantile(0.90) * scale, digits),
+            "p99": round(self.quantile(0.99) * scale, digits),
+            "max": round(self.max * scale, digits),
+        }
+
+
+class MetricsRegistry:
+    """
+    Thread-safe registry of server metrics.
+
+    Records, per MCP tool, call and error counts plus latency and response size
+    histograms; per processing stage (catalog load, distance filtering,
+    formatting, ...) a latency histogram; and, per upstream HTTP provider,
+    request counts, errors by kind (timeout, HTTP status, other) and latency.
+    Metrics can be read as a dictionary (`snapshot`) or in the Prometheus text
+    exposition format (`render_prometheus`), optionally written to a file for
+    a node_exporter textfile collector.
+    """
+
+    # Latency bucket upper bounds in seconds
+    LATENCY_BUCKETS = (
+        0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+    )
+
+    # Response size bucket upper bounds in bytes
+    SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+    # Prefix of every exported Prometheus metric
+    PREFIX = "paraguay_tourism"
+
+    def __init__(
+        self,
+        prometheus_path: str | Path | None = None,
+        write_interval_seconds: float = 15.0,
+    ):
+        """
+        Initialize an empty registry.
+
+        Args:
+            prometheus_path: Optional file the Prometheus exposition is written to,
+                at most every `write_interval_seconds` (checked after each tool call).
+            write_interval_seconds: Minimum seconds between two file writes.
+        """
+        self._lock = threading.Lock()
+        self._started_at = time.time()
+        self._tool_calls: Dict[str, int] = {}
+        self._tool_errors: Dict[str, int] = {}
+        self._tool_latency: Dict[str, Histogram] = {}
+        self._tool_bytes: Dict[str, Histogram] = {}
+        self._stage_latency: Dict[str, Histogram] = {}
+        self._upstream_requests: Dict[str, int] = {}
+        self._upstream_errors: Dict[Tuple[str, str], int] = {}
+        self._upstream_latency: Dict[str, Histogram] = {}
+        self._prometheus_path = Path(prometheus_path) if prometheus_path else None
+        self._write_interval = write_interval_seconds
+        self._next_write = 0.0
+
+    def observe_tool(
+        self,
+        tool: str,
+        seconds: float,
+        error: bool = False,
+        payload_bytes: Optional[int] = None,
+    ) -> None:
+        """
+        Record one tool call.
+
+        Args:
+            tool: Tool name.
+            seconds: Call duration, including serialization of the result.
+            error: Whether the call raised.
+            payload_bytes: Size of the serialized response (None if unknown, e.g. on error).
+        """
+        with self._lock:
+            self._tool_calls[tool] = self._tool_calls.get(tool, 0) + 1
+            if error:
+                self._tool_errors[tool] = self._tool_errors.get(tool, 0) + 1
+            self._histogram(self._tool_latency, tool, self.LATENCY_BUCKETS).observe(seconds)
+            if payload_bytes is not None:
+                self._histogram(self._tool_bytes, tool, self.SIZE_BUCKETS).observe(payload_bytes)
+        self._maybe_write()
+
+    def observe_stage(self, stage: str, seconds: float) -> None:
+        """Record the duration of one processing stage."""
+        with self._lock:
+            self._histogram(self._stage_latency, stage, self.LATENCY_BUCKETS).observe(seconds)
+        trace = _stage_trace.get()
+        if trace is not None:
+            trace[stage] = trace.get(stage, 0.0) + seconds
+
+    def observe_upstream(self, provider: str, seconds: float, error: Optional[str] = None) -> None:
+        """
+        Record one upstream HTTP request.
+
+        Args:
+            provider: Upstream provider name (e.g. "nominatim").
+            seconds: Request duration.
+            error: Error kind ("timeout", "http_status", "error"), or None on success.
+        """
+        with self._lock:
+            self._upstream_requests[provider] = self._upstream_requests.get(provider, 0) + 1
+            if error is not None:
+                key = (provider, error)
+                self._upstream_errors[key] = self._upstream_errors.get(key, 0) + 1
+            self._histogram(self._upstream_latency, provider, self.LATENCY_BUCKETS).observe(seconds)
+        trace = _stage_trace.get()
+        if trace is not None:
+            key = f"upstream:{provider}"
+            trace[key] = trace.get(key, 0.0) + seconds
+
+    @contextlib.contextmanager
+    def trace_stages(self) -> Iterator[Dict[str, float]]:
+        """
+        Collect the stage and upstream durations recorded in the current context.
+
+        Only observations made inside the block (and in tasks or threads that
+        copy its context) are collected, so concurrent calls do not mix.
+
+        Yields:
+            Dictionary filled with total seconds per stage while the block runs;
+            upstream requests appear as "upstream:<provider>".
+        """
+        trace: Dict[str, float] = {}
+        token = _stage_trace.set(trace)
+        try:
+            yield trace
+        finally:
+            _stage_trace.reset(token)
+
+    def timed(self, target, stage: str):
+        """
+        Wrap an object so every call of its public methods is timed as a stage.
+
+        Args:
+            target: Object to wrap (e.g. a service).
+            stage: Stage name the calls are recorded under.
+
+        Returns:
+            Proxy with the same attributes as `target`.
+        """
+        return _TimedProxy(target, stage, self)
+
+    def snapshot(self) -> Dict:
+        """
+        Current metrics as a dictionary.
+
+        Returns:
+            Dictionary with `uptime_seconds`, `tools` (calls, errors, latency in ms,
+            payload in bytes), `stages` (latency in ms) and `upstream` (requests,
+            errors by kind, latency in ms).
+        """
+        with self._lock:
+            tools = {
+                tool: {
+                    "calls": calls,
+                    "errors": self._tool_errors.get(tool, 0),
+                    "latency_ms": self._tool_latency[tool].summary(1000.0),
+                    "payload_bytes": (
+                        self._tool_bytes[tool].summary(digits=0) if tool in self._tool_bytes else {}
+                    ),
+                }
+                for tool, calls in sorted(self._tool_calls.items())
+            }
+            stages = {
+                stage: histogram.summary(1000.0)
+                for stage, histogram in sorted(self._stage_latency.items())
+            }
+            upstream = {
+                provider: {
+                    "requests": requests,
+                    "errors": {
+                        kind: count
+                        for (name, kind), count in sorted(self._upstream_errors.items())
+                        if name == provider
+                    },
+                    "latency_ms": self._upstream_latency[provider].summary(1000.0),
+                }
+                for provider, requests in sorted(self._upstream_requests.items())
+            }
+        return {
+            "uptime_seconds": round(time.time() - self._started_at, 1),
+            "tools": tools,
+            "stages": stages,
+            "upstream": upstream,
+        }
+
+    def render_prometheus(self) -> str:
+        """Metrics in the Prometheus text exposition format (version 0.0.4)."""
+        prefix = self.PREFIX
+        lines: List[str] = []
+        with self._lock:
+            self._counter(lines, f"{prefix}_tool_calls_total", "MCP tool calls.", "tool", self._tool_calls)
+            self._counter(
+                lines, f"{prefix}_tool_errors_total", "MCP tool calls that raised.", "tool", self._tool_errors
+            )
+            self._histograms(
+                lines, f"{prefix}_tool_duration_seconds", "MCP tool call latency.", "tool", self._tool_latency
+            )
+            self._histograms(
+                lines, f"{prefix}_tool_response_bytes", "Serialized MCP tool response size.", "tool",
+                self._tool_bytes,
+            )
+            self._histograms(
+                lines, f"{prefix}_stage_duration_seconds", "Processing stage latency.", "stage",
+                self._stage_latency,
+            )
+            self._counter(
+                lines, f"{prefix}_upstream_requests_total", "Upstream HTTP requests.", "provider",
+                self._upstream_requests,
+            )
+            lines.append(f"# HELP {prefix}_upstream_errors_total Failed upstream HTTP requests by kind.")
+            lines.append(f"# TYPE {prefix}_upstream_errors_total counter")
+            for (provider, kind), count in sorted(self._upstream_errors.items()):
+                lines.append(
+                    f'{prefix}_upstream_errors_total{{provider="{_escape(provider)}",kind="{_escape(kind)}"}} {count}'
+                )
+            self._histograms(
+                lines, f"{prefix}_upstream_duration_seconds", "Upstream HTTP request latency.", "provider",
+                self._upstream_latency,
+            )
+        lines.append(f"# HELP {prefix}_uptime_seconds Seconds since the metrics registry was created.")
+        lines.append(f"# TYPE {prefix}_uptime_seconds gauge")
+        lines.append(f"{prefix}_uptime_seconds {time.time() - self._started_at:.3f}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str | Path | None = None) -> Optional[Path]:
+        """
+        Write the Prometheus exposition to a file atomically.
+
+        Args:
+            path: Output file. If None, uses the configured `prometheus_path`.
+
+        Returns:
+            Path written, or None if no path is configured.
+        """
+        path = Path(path) if path is not None else self._prometheus_path
+        if path is None:
+            return None
+        content = self.render_prometheus()
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return path
+
+    def _maybe_write(self) -> None:
+        """Write the Prometheus file if one is configured and the interval has elapsed."""
+        if self._prometheus_path is None:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if now < self._next_write:
+                return
+            self._next_write = now + self._write_interval
+        try:
+            self.write_prometheus()
+        except OSError:
+            # Metrics must never fail a tool call; retry at the next interval
+            pass
+
+    @staticmethod
+    def _histogram(histograms: Dict[str, Histogram], key: str, bounds: Sequence[float]) -> Histogram:
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = Histogram(bounds)
+        return histogram
+
+    @staticmethod
+    def _counter(lines: List[str], name: str, help_text: str, label: str, values: Dict[str, int]) -> None:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} counter")
+        for key, value in sorted(values.items()):
+            lines.append(f'{name}{{{label}="{_escape(key)}"}} {value}')
+
+    @staticmethod
+    def _histograms(
+        lines: List[str], name: str, help_text: str, label: str, histograms: Dict[str, Histogram]
+    ) -> None:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} histogram")
+        for key, histogram in sorted(histograms.items()):
+            value = _escape(key)
+            cumulative = 0
+            for bound, count in zip((*histogram.bounds, math.inf), histogram.counts):
+                cumulative += count
+                le = "+Inf" if bound == math.inf else repr(float(bound))
+                lines.append(f'{name}_bucket{{{label}="{value}",le="{le}"}} {cumulative}')
+            lines.append(f'{name}_sum{{{label}="{value}"}} {histogram.sum!r}')
+            lines.append(f'{name}_count{{{label}="{value}"}} {histogram.count}')
+
+
+class _TimedProxy:
+    """Proxy timing every public method call of its target as a metrics stage."""
+
+    __slots__ = ("_target", "_stage", "_metrics")
+
+    def __init__(self, target, stage: str, metrics: MetricsRegistry):
+        self._target = target
+        self._stage = stage
+        self._metrics = metrics
+
+    def __getattr__(self, name: str):
+        attribute = getattr(self._target, name)
+        if name.startswith("_") or not callable(attribute):
+            return attribute
+
+        stage, metrics = self._stage, self._metrics
+        if inspect.iscoroutinefunction(attribute):
+            @functools.wraps(attribute)
+            async def timed_async(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return await attribute(*args, **kwargs)
+                finally:
+                    metrics.observe_stage(stage, time.perf_counter() - start)
+            return timed_async
+
+        @functools.wraps(attribute)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return attribute(*args, **kwargs)
+            finally:
+                metrics.observe_stage(stage, time.perf_counter() - start)
+        return timed
+
+
+def _escape(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -1,57 +1,134 @@
 """Service for formatting place data."""
 
-from typing import Dict, List, Optional
-
-from tabulate import tabulate
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
 
 from ..models import Place
+from ..repositories import PlaceLike
+from .route_planner import RoutePlan
 
 
 class PlaceFormatter:
-    """Service for formatting place data into different representations."""
+    """
+    Service for formatting place data into different representations.
 
-    @staticmethod
-    def format_as_table(places: List[Place]) -> str:
+    When called with a catalog `version`, the formatter memoizes per-place
+    table cells and `model_dump()` payloads for the most recently formatted
+    places, and (with a `cache_key`) whole rendered responses. All memoized
+    data is dropped as soon as a different catalog version is seen, i.e. after
+    a reload. Memoized responses are shared, so callers must not mutate their
+    nested payloads.
+    """
+
+    # Maximum number of whole responses memoized per catalog version
+    MAX_RENDERED_ENTRIES = 256
+
+    # Maximum number of places whose cells and payload are memoized
+    MAX_CACHED_PLACES = 4096
+
+    # Place fields that can be requested through a `fields` projection
+    FIELDS = tuple(Place.model_fields)
+
+    def __init__(self):
+        """Initialize empty caches."""
+        self._lock = threading.Lock()
+        self._version: Optional[int] = None
+        # id(place) -> (place, table cells, model_dump()); the place reference
+        # keeps the id from being reused while the entry exists
+        self._place_cache: "OrderedDict[int, Tuple[PlaceLike, List[str], Dict]]" = OrderedDict()
+        self._rendered: "OrderedDict[Hashable, Dict]" = OrderedDict()
+        self._stats = {"rendered_hits": 0, "rendered_misses": 0}
+
+    def stats(self) -> Dict:
+        """
+        Cache counters.
+
+        Returns:
+            Dictionary with memoized response hits and misses, and the number of
+            cached places and responses for the current catalog version.
+        """
+        with self._lock:
+            return {
+                **self._stats,
+                "cached_places": len(self._place_cache),
+                "rendered_entries": len(self._rendered),
+                "version": self._version,
+            }
+
+    def format_as_table(self, places: Sequence[PlaceLike], version: Optional[int] = None) -> str:
         """
         Format places as a table.
 
         Args:
-            places: List of Place models to format.
+            places: Places (models or catalog rows) to format.
+            version: Catalog version the places belong to, enabling the row cache.
 
         Returns:
             Formatted table string.
         """
-        table_data = [
-            [place.name, place.city, place.category, f"{place.lat}, {place.lng}"]
-            for place in places
-        ]
+        table_data = [self._cells(place, version) for place in places]
         headers = ["Lugar", "Ciudad", "Categoría", "Lat, lng"]
-        return tabulate(table_data, headers=headers, tablefmt="grid")
+        return _grid(table_data, headers)
 
-    @staticmethod
-    def format_as_dict(places: List[Place]) -> Dict:
+    def format_as_dict(
+        self,
+        places: Sequence[PlaceLike],
+        version: Optional[int] = None,
+        cache_key: Optional[Hashable] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+        include_table: bool = True,
+    ) -> Dict:
         """
         Format places as a dictionary with table and raw data.
 
+        Only the requested page is rendered, and the table is skipped entirely
+        when `include_table` is False.
+
         Args:
-            places: List of Place models to format.
+            places: Places (models or catalog rows) to format.
+            version: Catalog version the places belong to, enabling the row cache.
+            cache_key: Key identifying this exact selection of places within the
+                catalog version (e.g. "all"). With a version, the whole response
+                is memoized under it.
+            offset: Index of the first place to return.
+            limit: Maximum number of places to return (None for all).
+            fields: Place fields to include in `raw` (None for all; `id` is always included).
+            include_table: Whether to render the text table.
 
         Returns:
-            Dictionary with total count, formatted table, and raw data.
+            Dictionary with total count, page bounds, formatted table (if requested)
+            and raw data.
+
+        Raises:
+            ValueError: If the page bounds or field names are invalid.
         """
-        return {
-            "total": len(places),
-            "table": PlaceFormatter.format_as_table(places),
-            "raw": [place.model_dump() for place in places],
-        }
+        fields = self._select_fields(fields)
+        memoize = version is not None and cache_key is not None
+        memo_key = ("dict", cache_key, offset, limit, fields, include_table)
+        if memoize:
+            cached = self._get_rendered(version, memo_key)
+            if cached is not None:
+                return cached
 
-    @staticmethod
-    def format_single(place: Optional[Place]) -> Dict:
+        result, page = self._page(places, offset, limit)
+        if include_table:
+            result["table"] = self.format_as_table(page, version)
+        result["raw"] = [self._project(place, version, fields) for place in page]
+
+        if memoize:
+            self._put_rendered(version, memo_key, result)
+        return dict(result)
+
+    def format_single(self, place: Optional[PlaceLike], version: Optional[int] = None) -> Dict:
         """
         Format a single place as a dictionary.
 
         Args:
-            place: Place model to format, or None if not found.
+            place: Place (model or catalog row) to format, or None if not found.
+            version: Catalog version the place belongs to, enabling the payload cache.
 
         Returns:
             Dictionary with place data, or error message if not found.
@@ -64,46 +141,407 @@ class PlaceFormatter:
 
         return {
             "found": True,
-            "place": place.model_dump(),
+            "place": self._project(place, version, None),
         }
 
-    @staticmethod
-    def format_with_distances(places_with_distances: List[tuple]) -> Dict:
+    def format_with_distances(
+        self,
+        places_with_distances: List[tuple],
+        version: Optional[int] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+        include_table: bool = True,
+    ) -> Dict:
         """
         Format places with their distances as a dictionary.
 
         Args:
             places_with_distances: List of tuples (Place, distance_km).
+            version: Catalog version the places belong to, enabling the row cache.
+            offset: Index of the first result to return.
+            limit: Maximum number of results to return (None for all).
+            fields: Place fields to include in `raw` (None for all; `id` is always included).
+            include_table: Whether to render the text table.
 
         Returns:
-            Dictionary with total count, formatted table with distances, and raw data.
+            Dictionary with total count, page bounds, formatted table with distances
+            (if requested) and raw data.
+
+        Raises:
+            ValueError: If the page bounds or field names are invalid.
         """
-        if not places_with_distances:
-            return {
-                "total": 0,
-                "table": "No se encontraron lugares en el rango especificado.",
-                "raw": [],
-            }
+        fields = self._select_fields(fields)
+        result, page = self._page(places_with_distances, offset, limit)
+
+        if include_table:
+            if not places_with_distances:
+                result["table"] = "No se encontraron lugares en el rango especificado."
+            else:
+                table_data = [
+                    [*self._cells(place, version), f"{distance:.2f} km"]
+                    for place, distance in page
+                ]
+                headers = ["Lugar", "Ciudad", "Categoría", "Coordenadas", "Distancia"]
+                result["table"] = _grid(table_data, headers)
+
+        result["raw"] = [
+            {**self._project(place, version, fields), "distance_km": round(distance, 2)}
+            for place, distance in page
+        ]
+        return result
+
+    def format_with_scores(
+        self,
+        query: str,
+        places_with_scores: List[tuple],
+        total: int,
+        version: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+        include_table: bool = True,
+    ) -> Dict:
+        """
+        Format ranked full-text search results as a dictionary.
+
+        Args:
+            query: The search text.
+            places_with_scores: List of tuples (Place, relevance score), best first.
+            total: Number of places matching the query (may exceed the results).
+            version: Catalog version the places belong to, enabling the row cache.
+            fields: Place fields to include in `raw` (None for all; `id` is always included).
+            include_table: Whether to render the text table.
+
+        Returns:
+            Dictionary with the query, total matches, result count, formatted table
+            with scores (if requested) and raw data.
+
+        Raises:
+            ValueError: If a field name is invalid.
+        """
+        fields = self._select_fields(fields)
+        result = {"query": query, "total": total, "count": len(places_with_scores)}
+
+        if include_table:
+            if not places_with_scores:
+                result["table"] = "No se encontraron lugares para la búsqueda."
+            else:
+                table_data = [
+                    [*self._cells(place, version), f"{score:.3f}"]
+                    for place, score in places_with_scores
+                ]
+                headers = ["Lugar", "Ciudad", "Categoría", "Coordenadas", "Relevancia"]
+                result["table"] = _grid(table_data, headers)
 
-        table_data = [
-            [
-                place.name,
-                place.city,
-                place.category,
-                f"{place.lat}, {place.lng}",
-                f"{distance:.2f} km",
-            ]
-            for place, distance in places_with_distances
+        result["raw"] = [
+            {**self._project(place, version, fields), "score": round(score, 3)}
+            for place, score in places_with_scores
         ]
-        headers = ["Lugar", "Ciudad", "Categoría", "Coordenadas", "Distancia"]
-        table = tabulate(table_data, headers=headers, tablefmt="grid")
+        return result
+
+    def format_query_results(
+        self,
+        matches: List[tuple],
+        plan: List[Dict],
+        version: Optional[int] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+        include_table: bool = True,
+    ) -> Dict:
+        """
+        Format the results of a combined query as a dictionary.
+
+        Args:
+            matches: List of tuples (Place, distance_km or None, score or None).
+            plan: Query plan steps, returned as-is.
+            version: Catalog version the places belong to, enabling the row cache.
+            offset: Index of the first result to return.
+            limit: Maximum number of results to return (None for all).
+            fields: Place fields to include in `raw` (None for all; `id` is always included).
+            include_table: Whether to render the text table.
+
+        Returns:
+            Dictionary with total count, page bounds, query plan, formatted table
+            (if requested) and raw data, with `distance_km` and `score` when present.
+
+        Raises:
+            ValueError: If the page bounds or field names are invalid.
+        """
+        fields = self._select_fields(fields)
+        result, page = self._page(matches, offset, limit)
+        result["plan"] = plan
+        with_distance = any(distance is not None for _, distance, _ in page)
+        with_score = any(score is not None for _, _, score in page)
+
+        if include_table:
+            if not matches:
+                result["table"] = "No se encontraron lugares que cumplan los filtros."
+            else:
+                headers = ["Lugar", "Ciudad", "Categoría", "Coordenadas"]
+                if with_distance:
+                    headers.append("Distancia")
+                if with_score:
+                    headers.append("Relevancia")
+                table_data = []
+                for place, distance, score in page:
+                    row = list(self._cells(place, version))
+                    if with_distance:
+                        row.append(f"{distance:.2f} km")
+                    if with_score:
+                        row.append(f"{score:.3f}")
+                    table_data.append(row)
+                result["table"] = _grid(table_data, headers)
+
+        raw = []
+        for place, distance, score in page:
+            entry = self._project(place, version, fields)
+            if distance is not None:
+                entry["distance_km"] = round(distance, 2)
+            if score is not None:
+                entry["score"] = round(score, 3)
+            raw.append(entry)
+        result["raw"] = raw
+        return result
+
+    def format_batch_with_distances(
+        self,
+        origins: Sequence[Tuple[float, float, float]],
+        results: Sequence[List[tuple]],
+        version: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Dict:
+        """
+        Format the results of a batch distance query.
+
+        Each place payload is included once in `places`, keyed by ID; per-origin
+        results only reference place IDs and distances.
+
+        Args:
+            origins: (latitude, longitude, max_distance_km) for each origin.
+            results: One list of (Place, distance_km) tuples per origin.
+            version: Catalog version the places belong to, enabling the payload cache.
+            fields: Place fields to include in `places` (None for all; `id` is always included).
+
+        Returns:
+            Dictionary with per-origin results and shared place payloads.
+
+        Raises:
+            ValueError: If a field name is invalid.
+        """
+        fields = self._select_fields(fields)
+        places: Dict[str, Dict] = {}
+        formatted_results = []
+        for (latitude, longitude, max_distance_km), places_with_distances in zip(origins, results):
+            matches = []
+            for place, distance in places_with_distances:
+                if place.id not in places:
+                    places[place.id] = self._project(place, version, fields)
+                matches.append({"id": place.id, "distance_km": round(distance, 2)})
+            formatted_results.append({
+                "origin": {
+                    "latitude": latitude,
+                    "longitude": longitude,
+                    "max_distance_km": max_distance_km,
+                },
+                "total": len(matches),
+                "places": matches,
+            })
 
         return {
-            "total": len(places_with_distances),
-            "table": table,
-            "raw": [
-                {**place.model_dump(), "distance_km": round(distance, 2)}
-                for place, distance in places_with_distances
-            ],
+            "total_origins": len(formatted_results),
+            "results": formatted_results,
+            "places": places,
         }
 
+    def format_route(
+        self,
+        route: RoutePlan,
+        version: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+        include_table: bool = True,
+    ) -> Dict:
+        """
+        Format a planned route.
+
+        Args:
+            route: Route returned by `RoutePlanner.plan`.
+            version: Catalog version the places belong to, enabling the row cache.
+            fields: Place fields to include in each stop (None for all; `id` is always included).
+            include_table: Whether to render the text table.
+
+        Returns:
+            Dictionary with the total distance, start point, ordered stops (with
+            the length of the leg reaching each one and the cumulative distance),
+            the legs (the start point appears as "start") and optimization stats.
+
+        Raises:
+            ValueError: If a field name is invalid.
+        """
+        fields = self._select_fields(fields)
+        stops = []
+        table_data = []
+        cumulative = 0.0
+        # Leg i reaches stop i, except without a start point, where the route begins at stop 0
+        shift = 0 if route.start is not None else 1
+        for position, place in enumerate(route.stops):
+            leg_km = route.legs[position - shift][2] if position >= shift else 0.0
+            cumulative += leg_km
+            stops.append({
+                "order": position + 1,
+                **self._project(place, version, fields),
+                "leg_km": round(leg_km, 2),
+                "cumulative_km": round(cumulative, 2),
+            })
+            table_data.append(
+                [str(position + 1), *self._cells(place, version), f"{leg_km:.2f} km", f"{cumulative:.2f} km"]
+            )
+        for _, _, leg_km in route.legs[len(route.stops) - shift:]:
+            # Closing leg back to the start point (or the first stop)
+            cumulative += leg_km
+            table_data.append(
+                ["", "Regreso al inicio", "", "", "", f"{leg_km:.2f} km", f"{cumulative:.2f} km"]
+            )
+
+        result = {
+            "total_stops": len(stops),
+            "total_distance_km": round(route.total_km, 2),
+            "start": (
+                {"latitude": route.start[0], "longitude": route.start[1]} if route.start is not None else None
+            ),
+            "return_to_start": route.return_to_start,
+        }
+        if include_table:
+            headers = ["#", "Lugar", "Ciudad", "Categoría", "Coordenadas", "Tramo", "Acumulado"]
+            result["table"] = _grid(table_data, headers)
+        result["stops"] = stops
+        result["legs"] = [
+            {
+                "from": origin.id if origin is not None else "start",
+                "to": destination.id if destination is not None else "start",
+                "distance_km": round(distance, 2),
+            }
+            for origin, destination, distance in route.legs
+        ]
+        result["optimization"] = {
+            "nearest_neighbour_km": round(route.initial_km, 2),
+            "improvement_moves": route.improvements,
+            "converged": route.complete,
+        }
+        return result
+
+    @classmethod
+    def _select_fields(cls, fields: Optional[Sequence[str]]) -> Optional[Tuple[str, ...]]:
+        """Validated field projection (None for all fields), always starting with `id`."""
+        if fields is None:
+            return None
+        unknown = [field for field in fields if field not in cls.FIELDS]
+        if unknown:
+            raise ValueError(
+                f"Campos desconocidos: {', '.join(unknown)}. "
+                f"Campos disponibles: {', '.join(cls.FIELDS)}"
+            )
+        return ("id", *dict.fromkeys(field for field in fields if field != "id"))
+
+    @staticmethod
+    def _page(items: Sequence, offset: int, limit: Optional[int]) -> Tuple[Dict, Sequence]:
+        """Slice one page of `items` and describe it (total, count, offset, next_offset)."""
+        if offset < 0:
+            raise ValueError("offset debe ser mayor o igual a 0")
+        if limit is not None and limit < 1:
+            raise ValueError("limit debe ser mayor o igual a 1")
+
+        end = len(items) if limit is None else min(len(items), offset + limit)
+        page = items[offset:end]
+        return {
+            "total": len(items),
+            "count": len(page),
+            "offset": offset,
+            "next_offset": end if end < len(items) else None,
+        }, page
+
+    def _project(self, place: PlaceLike, version: Optional[int], fields: Optional[Tuple[str, ...]]) -> Dict:
+        """Place payload restricted to `fields` (all fields when None), as a new dict."""
+        dump = self._dump(place, version)
+        if fields is None:
+            return dict(dump)
+        return {field: dump[field] for field in fields}
+
+    def _cells(self, place: PlaceLike, version: Optional[int]) -> List[str]:
+        """Table cells (name, city, category, coordinates) for a place."""
+        entry = self._place_entry(place, version)
+        if entry is not None:
+            return entry[1]
+        return [place.name, place.city, place.category, f"{place.lat}, {place.lng}"]
+
+    def _dump(self, place: PlaceLike, version: Optional[int]) -> Dict:
+        """`model_dump()` of a place (shared cached dict: never mutate it)."""
+        entry = self._place_entry(place, version)
+        if entry is not None:
+            return entry[2]
+        return place.model_dump()
+
+    def _place_entry(
+        self, place: PlaceLike, version: Optional[int]
+    ) -> Optional[Tuple[PlaceLike, List[str], Dict]]:
+        """Cached (place, cells, dump) for a catalog place, computed on first use (LRU)."""
+        if version is None:
+            return None
+        self._check_version(version)
+
+        key = id(place)
+        with self._lock:
+            entry = self._place_cache.get(key)
+            if entry is not None and entry[0] is place:
+                self._place_cache.move_to_end(key)
+                return entry
+
+        entry = (
+            place,
+            [place.name, place.city, place.category, f"{place.lat}, {place.lng}"],
+            place.model_dump(),
+        )
+        with self._lock:
+            if self._version == version:
+                self._place_cache[key] = entry
+                self._place_cache.move_to_end(key)
+                while len(self._place_cache) > self.MAX_CACHED_PLACES:
+                    self._place_cache.popitem(last=False)
+        return entry
+
+    def _get_rendered(self, version: int, key: Hashable) -> Optional[Dict]:
+        """Memoized response for the current catalog version."""
+        self._check_version(version)
+        with self._lock:
+            result = self._rendered.get(key)
+            if result is None:
+                self._stats["rendered_misses"] += 1
+                return None
+            self._stats["rendered_hits"] += 1
+            self._rendered.move_to_end(key)
+        return dict(result)
+
+    def _put_rendered(self, version: int, key: Hashable, result: Dict) -> None:
+        """Memoize a response, evicting the least recently used ones."""
+        with self._lock:
+            if self._version != version:
+                return
+            self._rendered[key] = result
+            while len(self._rendered) > self.MAX_RENDERED_ENTRIES:
+                self._rendered.popitem(last=False)
+
+    def _check_version(self, version: int) -> None:
+        """Drop every cache when a new catalog version shows up."""
+        if self._version == version:
+            return
+        with self._lock:
+            if self._version != version:
+                self._place_cache = OrderedDict()
+                self._rendered = OrderedDict()
+                self._version = version
+
+
+def _grid(rows: Sequence[Sequence[str]], headers: Sequence[str]) -> str:
+    """Render rows as a grid table (tabulate is imported on first use, not at start-up)."""
+    from tabulate import tabulate
+
+    return tabulate(rows, headers=headers, tablefmt="grid")
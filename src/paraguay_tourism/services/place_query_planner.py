@@ -0,0 +1,266 @@
+"""Combined place queries planned over the catalog indexes."""
+
+import math
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ..repositories import PlaceCatalog, PlaceLike
+from .location_service import LocationService
+
+# (place, distance_km or None, relevance score or None)
+QueryMatch = Tuple[PlaceLike, Optional[float], Optional[float]]
+
+
+class PlaceQueryPlanner:
+    """
+    Answers queries combining category, region, city, text and geographic filters.
+
+    Every filter can produce candidates from an index (category / region / city
+    groups, the full-text index, the spatial grid) and estimate how many it
+    would produce without doing so. The planner materializes only the most
+    selective filter's candidates, narrows them with the remaining filters in
+    increasing order of their estimates, and computes exact distances last, for
+    the survivors only. Each dataset of a `CatalogSet` is planned separately
+    over its own indexes.
+    """
+
+    def query(
+        self,
+        catalog,
+        category: Optional[str] = None,
+        region: Optional[str] = None,
+        city: Optional[str] = None,
+        text: Optional[str] = None,
+        latitude: Optional[float] = None,
+        longitude: Optional[float] = None,
+        max_distance_km: Optional[float] = None,
+        bbox: Optional[Tuple[float, float, float, float]] = None,
+    ) -> Tuple[List[QueryMatch], List[Dict]]:
+        """
+        Find the places matching every given filter.
+
+        Args:
+            catalog: PlaceCatalog or CatalogSet to query.
+            category: Category name (accent- and case-insensitive).
+            region: Region name (accent- and case-insensitive).
+            city: City name (accent- and case-insensitive).
+            text: Free text; places must match at least one of its words (see `TextIndex`).
+            latitude: Latitude of the search center (with `longitude` and `max_distance_km`).
+            longitude: Longitude of the search center.
+            max_distance_km: Search radius in kilometers.
+            bbox: (min_lat, max_lat, min_lng, max_lng) box in decimal degrees;
+                min_lng > max_lng crosses the antimeridian.
+
+        Returns:
+            (matches, plan). Matches are sorted by distance when a radius is given,
+            else by relevance when `text` is given, else in catalog order. The plan
+            lists, per dataset, each filter applied with its estimate and the
+            number of candidates left after it.
+
+        Raises:
+            ValueError: If the geographic filters are incomplete or invalid.
+        """
+        center = self._center(latitude, longitude, max_distance_km)
+        if bbox is not None:
+            min_lat, max_lat, _, _ = bbox
+            if not all(math.isfinite(value) for value in bbox) or min_lat > max_lat:
+                raise ValueError("bbox inválido: se espera min_lat <= max_lat y valores finitos")
+
+        matches: List[QueryMatch] = []
+        plan: List[Dict] = []
+        for partition in catalog.partitions():
+            filters = self._filters(partition, category, region, city, text, center, bbox)
+            partition_matches, steps = self._run(partition, filters, center, text is not None)
+            matches.extend(partition_matches)
+            plan.extend({"dataset": partition.dataset, **step} for step in steps)
+
+        if center is not None:
+            # Stable: equal distances keep catalog order
+            matches.sort(key=lambda match: match[1])
+        elif text is not None:
+            matches.sort(key=lambda match: -match[2])
+        return matches, plan
+
+    @staticmethod
+    def _center(
+        latitude: Optional[float],
+        longitude: Optional[float],
+        max_distance_km: Optional[float],
+    ) -> Optional[Tuple[float, float, float]]:
+        """Validated (latitude, longitude, max_distance_km), or None without a radius filter."""
+        values = (latitude, longitude, max_distance_km)
+        if all(value is None for value in values):
+            return None
+        if any(value is None for value in values):
+            raise ValueError("latitude, longitude y max_distance_km deben indicarse juntos")
+        if not all(math.isfinite(value) for value in values) or max_distance_km < 0:
+            raise ValueError("Coordenadas o distancia inválidas")
+        return (latitude, longitude, max_distance_km)
+
+    @staticmethod
+    def _filters(
+        catalog: PlaceCatalog,
+        category: Optional[str],
+        region: Optional[str],
+        city: Optional[str],
+        text: Optional[str],
+        center: Optional[Tuple[float, float, float]],
+        bbox: Optional[Tuple[float, float, float, float]],
+    ) -> List["_Filter"]:
+        """Filters for one dataset catalog."""
+        filters: List[_Filter] = []
+        for column, value in (("category", category), ("region", region), ("city", city)):
+            if value is not None:
+                filters.append(_GroupFilter(catalog, column, value))
+        if text is not None:
+            filters.append(_TextFilter(catalog, text))
+        if bbox is not None:
+            filters.append(_BoxFilter(catalog, "bbox", bbox))
+        if center is not None:
+            box = LocationService.bounding_box(*center)
+            if box is not None:
+                # Exact distances are computed after every filter has been applied
+                filters.append(_BoxFilter(catalog, "radius", box))
+        return filters
+
+    @staticmethod
+    def _run(
+        catalog: PlaceCatalog,
+        filters: List["_Filter"],
+        center: Optional[Tuple[float, float, float]],
+        ranked: bool,
+    ) -> Tuple[List[QueryMatch], List[Dict]]:
+        """Execute the filters over one dataset catalog, most selective first."""
+        steps: List[Dict] = []
+        estimates = sorted(
+            ((current.estimate(), order, current) for order, current in enumerate(filters)),
+            key=lambda item: (item[0], item[1]),
+        )
+
+        candidates: Sequence[int] = range(len(catalog))
+        for step, (estimate, _, current) in enumerate(estimates):
+            if step == 0:
+                candidates = current.positions()
+            elif candidates:
+                candidates = current.keep(candidates)
+            steps.append({"index": current.name, "estimated": estimate, "candidates": len(candidates)})
+
+        distances: Sequence[Optional[float]] = [None] * len(candidates)
+        if center is not None and candidates:
+            latitude, longitude, max_distance_km = center
+            measured = LocationService.distances_km(catalog.coordinates, latitude, longitude, candidates)
+            kept = [
+                (position, distance)
+                for position, distance in zip(candidates, measured)
+                if distance <= max_distance_km
+            ]
+            candidates = [position for position, _ in kept]
+            distances = [float(distance) for _, distance in kept]
+            steps.append({"index": "distance", "estimated": len(measured), "candidates": len(candidates)})
+
+        scores: Sequence[Optional[float]] = [None] * len(candidates)
+        if ranked:
+            text_filter = next(current for current in filters if isinstance(current, _TextFilter))
+            scores = [text_filter.score(position) for position in candidates]
+
+        places = catalog.places
+        return [
+            (places[position], distance, score)
+            for position, distance, score in zip(candidates, distances, scores)
+        ], steps
+
+
+class _Filter(ABC):
+    """One query condition evaluated over a single dataset catalog."""
+
+    name = ""
+
+    @abstractmethod
+    def estimate(self) -> int:
+        """Upper bound of the number of matching places, computed cheaply."""
+
+    @abstractmethod
+    def positions(self) -> List[int]:
+        """Positions of the matching places, in ascending order."""
+
+    @abstractmethod
+    def keep(self, candidates: Sequence[int]) -> List[int]:
+        """The candidates that also match this condition, in the same order."""
+
+
+class _GroupFilter(_Filter):
+    """Category, region or city equality, answered from the catalog's group index."""
+
+    def __init__(self, catalog: PlaceCatalog, column: str, value: str):
+        self.name = column
+        self._members = catalog.positions(column, value)
+
+    def estimate(self) -> int:
+        return len(self._members)
+
+    def positions(self) -> List[int]:
+        return list(self._members)
+
+    def keep(self, candidates: Sequence[int]) -> List[int]:
+        members = set(self._members)
+        return [position for position in candidates if position in members]
+
+
+class _TextFilter(_Filter):
+    """Full-text condition answered from the catalog's text index."""
+
+    name = "text"
+
+    def __init__(self, catalog: PlaceCatalog, text: str):
+        self._index = catalog.text_index
+        self._text = text
+        self._scores: Optional[Dict[int, float]] = None
+
+    def estimate(self) -> int:
+        return self._index.estimate(self._text)
+
+    def positions(self) -> List[int]:
+        return sorted(self._matches())
+
+    def keep(self, candidates: Sequence[int]) -> List[int]:
+        scores = self._matches()
+        return [position for position in candidates if position in scores]
+
+    def score(self, position: int) -> float:
+        """BM25 score of a matching place."""
+        return self._matches()[position]
+
+    def _matches(self) -> Dict[int, float]:
+        if self._scores is None:
+            self._scores = self._index.scores(self._text)
+        return self._scores
+
+
+class _BoxFilter(_Filter):
+    """Bounding-box condition answered from the catalog's spatial grid."""
+
+    def __init__(self, catalog: PlaceCatalog, name: str, box: Tuple[float, float, float, float]):
+        self.name = name
+        self._catalog = catalog
+        self._box = box
+
+    def estimate(self) -> int:
+        return self._catalog.spatial_index.estimate_bbox(*self._box)
+
+    def positions(self) -> List[int]:
+        return self._catalog.spatial_index.query_bbox(*self._box)
+
+    def keep(self, candidates: Sequence[int]) -> List[int]:
+        min_lat, max_lat, min_lng, max_lng = self._box
+        lats, lngs = self._catalog.store.lat, self._catalog.store.lng
+        if min_lng <= max_lng:
+            return [
+                position for position in candidates
+                if min_lat <= lats[position] <= max_lat and min_lng <= lngs[position] <= max_lng
+            ]
+        # Crosses the antimeridian
+        return [
+            position for position in candidates
+            if min_lat <= lats[position] <= max_lat
+            and (lngs[position] >= min_lng or lngs[position] <= max_lng)
+        ]
@@ -0,0 +1,256 @@
+"""Opt-in cProfile profiling of individual tool calls."""
+
+import cProfile
+import json
+import logging
+import pstats
+import re
+import sysconfig
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Characters allowed in report file names (tool names are already safe; be defensive)
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+class ProfileSession:
+    """
+    One profiled tool call, returned by `ToolProfiler.start`.
+
+    Call `stop` exactly once, when the call has finished (or failed).
+    """
+
+    def __init__(self, profiler: "ToolProfiler", tool: str):
+        """
+        Start profiling.
+
+        Args:
+            profiler: Owning profiler (released when the session stops).
+            tool: Name of the profiled tool.
+        """
+        self._owner = profiler
+        self.tool = tool
+        self.started_at = datetime.now(timezone.utc)
+        self._profile = cProfile.Profile()
+        self._start = time.perf_counter()
+        self._profile.enable()
+
+    def stop(self, stages: Optional[Dict[str, float]] = None, error: Optional[str] = None) -> Dict:
+        """
+        Stop profiling and build the report.
+
+        Args:
+            stages: Seconds per processing stage recorded during the call
+                (see `MetricsRegistry.trace_stages`).
+            error: Exception type name if the call raised.
+
+        Returns:
+            Report dictionary (see `ToolProfiler.report`); also written to the
+            profiler's output directory when one is configured.
+        """
+        self._profile.disable()
+        wall = time.perf_counter() - self._start
+        try:
+            return self._owner._finish(self, self._profile, wall, stages or {}, error)
+        finally:
+            self._owner._release()
+
+
+class ToolProfiler:
+    """
+    Profiles individual tool calls with cProfile.
+
+    cProfile is a deterministic profiler: it adds overhead to every Python call
+    while enabled, so timings in a report are inflated (mostly uniformly) and
+    are meant for comparing functions within one call, not for absolute
+    latency. Only one call is profiled at a time (Python allows a single
+    active profiler); calls arriving meanwhile run unprofiled. The profiler
+    sees the whole thread, so with an async transport other requests served
+    during the call also show up in the report.
+
+    Reports hold the top functions by self time, self time grouped by
+    top-level package, and the stage breakdown recorded by the metrics
+    registry. When an output directory is configured each report is written
+    there as JSON, next to the raw pstats dump (loadable with `pstats` or
+    snakeviz), keeping only the newest `keep` reports.
+    """
+
+    def __init__(
+        self,
+        top_n: int = 25,
+        output_dir: str | Path | None = None,
+        keep: int = 50,
+    ):
+        """
+        Initialize the profiler.
+
+        Args:
+            top_n: Number of functions listed in each report.
+            output_dir: Optional directory reports are written to (created if missing).
+            keep: Maximum number of reports kept in `output_dir`.
+        """
+        self.top_n = top_n
+        self.output_dir = Path(output_dir) if output_dir else None
+        self.keep = keep
+        self._lock = threading.Lock()
+        self._active = False
+        paths = sysconfig.get_paths()
+        self._stdlib_dirs = tuple(
+            str(Path(paths[key]).resolve()) for key in ("stdlib", "platstdlib") if paths.get(key)
+        )
+
+    def start(self, tool: str) -> Optional[ProfileSession]:
+        """
+        Start profiling a tool call.
+
+        Args:
+            tool: Name of the tool being called.
+
+        Returns:
+            Running session, or None if another call is already being profiled.
+        """
+        with self._lock:
+            if self._active:
+                return None
+            self._active = True
+        try:
+            return ProfileSession(self, tool)
+        except Exception:
+            self._release()
+            raise
+
+    def report(
+        self,
+        tool: str,
+        started_at: datetime,
+        stats: pstats.Stats,
+        wall_seconds: float,
+        stages: Dict[str, float],
+        error: Optional[str] = None,
+    ) -> Dict:
+        """
+        Build a profile report.
+
+        Args:
+            tool: Profiled tool name.
+            started_at: When the call started.
+            stats: Collected profile statistics.
+            wall_seconds: Wall-clock duration of the call.
+            stages: Seconds per processing stage.
+            error: Exception type name if the call raised.
+
+        Returns:
+            Dictionary with `tool`, `started_at`, `wall_ms`, `profiled_ms`
+            (total self time seen by the profiler; lower than `wall_ms` when the
+            call waited on I/O), `error`, `stages_ms`, `packages_ms` (self time
+            per top-level package) and `top` (function, calls, self_ms,
+            cumulative_ms).
+        """
+        entries = stats.stats  # {(file, line, name): (primitive calls, calls, tottime, cumtime, callers)}
+        packages: Dict[str, float] = {}
+        for (filename, _, _), (_, _, tottime, _, _) in entries.items():
+            package = self._package_of(filename)
+            packages[package] = packages.get(package, 0.0) + tottime
+
+        top: List[Dict] = []
+        ranked = sorted(entries.items(), key=lambda item: item[1][2], reverse=True)
+        for (filename, line, name), (_, calls, tottime, cumtime, _) in ranked[: self.top_n]:
+            top.append({
+                "function": pstats.func_std_string((self._short_path(filename), line, name)),
+                "calls": calls,
+                "self_ms": round(tottime * 1000.0, 3),
+                "cumulative_ms": round(cumtime * 1000.0, 3),
+            })
+
+        return {
+            "tool": tool,
+            "started_at": started_at.isoformat(),
+            "wall_ms": round(wall_seconds * 1000.0, 3),
+            "profiled_ms": round(stats.total_tt * 1000.0, 3),
+            "error": error,
+            "stages_ms": {
+                stage: round(seconds * 1000.0, 3) for stage, seconds in sorted(stages.items())
+            },
+            "packages_ms": {
+                package: round(seconds * 1000.0, 3)
+                for package, seconds in sorted(packages.items(), key=lambda item: item[1], reverse=True)
+            },
+            "top": top,
+        }
+
+    def _finish(
+        self,
+        session: ProfileSession,
+        profile: cProfile.Profile,
+        wall_seconds: float,
+        stages: Dict[str, float],
+        error: Optional[str],
+    ) -> Dict:
+        """Build a session's report and write it out if an output directory is configured."""
+        stats = pstats.Stats(profile)
+        report = self.report(session.tool, session.started_at, stats, wall_seconds, stages, error)
+        if self.output_dir is not None:
+            try:
+                report["file"] = str(self._write(session, report, stats))
+            except OSError as e:
+                # Profiling must never fail a tool call
+                logger.warning("Could not write profile of %s to %s: %s", session.tool, self.output_dir, e)
+        return report
+
+    def _write(self, session: ProfileSession, report: Dict, stats: pstats.Stats) -> Path:
+        """Write a report (JSON plus pstats dump) and prune old reports."""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        tool = _UNSAFE_FILENAME_CHARS.sub("_", session.tool)
+        stem = f"{session.started_at:%Y%m%dT%H%M%S.%fZ}-{tool}"
+        json_path = self.output_dir / f"{stem}.json"
+        stats.dump_stats(str(self.output_dir / f"{stem}.prof"))
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+        # Timestamped names sort chronologically; drop the oldest beyond `keep`
+        reports = sorted(self.output_dir.glob("*.json"))
+        for old in reports[: max(len(reports) - self.keep, 0)]:
+            old.unlink(missing_ok=True)
+            old.with_suffix(".prof").unlink(missing_ok=True)
+        return json_path
+
+    def _release(self) -> None:
+        with self._lock:
+            self._active = False
+
+    def _package_of(self, filename: str) -> str:
+        """Top-level package a profiled function belongs to, from its file name."""
+        if filename == "~" or filename.startswith("<"):
+            # C functions and frozen / generated code
+            return "builtins"
+        parts = Path(filename).parts
+        for marker in ("site-packages", "dist-packages"):
+            if marker in parts:
+                index = parts.index(marker)
+                if index + 1 < len(parts):
+                    return Path(parts[index + 1]).stem
+        if "paraguay_tourism" in parts:
+            return "paraguay_tourism"
+        resolved = str(Path(filename).resolve())
+        for stdlib_dir in self._stdlib_dirs:
+            if resolved.startswith(stdlib_dir):
+                relative = Path(resolved[len(stdlib_dir):].lstrip("/\\")).parts
+                if relative:
+                    return Path(relative[0]).stem
+        return "other"
+
+    def _short_path(self, filename: str) -> str:
+        """Shorten a file name to its package-relative path for display."""
+        parts = Path(filename).parts
+        for marker in ("site-packages", "dist-packages", "src"):
+            if marker in parts:
+                return "/".join(parts[parts.index(marker) + 1:])
+        for stdlib_dir in self._stdlib_dirs:
+            if filename.startswith(stdlib_dir):
+                return filename[len(stdlib_dir):].lstrip("/\\")
+        return filename
@@ -0,0 +1,252 @@
+"""Client-side rate limiting and circuit breaking for upstream providers."""
+
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+
+
+class UpstreamUnavailableError(Exception):
+    """Raised when a request is rejected locally (rate limit or open circuit)."""
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter.
+
+    Tokens refill continuously at `rate_per_second` up to `capacity`. A caller
+    reserves a token and is told how long to wait for it; reservations that
+    would wait longer than the caller accepts are rejected without consuming
+    a token.
+    """
+
+    def __init__(self, rate_per_second: float, capacity: float = 1.0):
+        """
+        Initialize the bucket (full).
+
+        Args:
+            rate_per_second: Sustained request rate.
+            capacity: Maximum burst size.
+        """
+        self._rate = rate_per_second
+        self._capacity = max(1.0, capacity)
+        self._tokens = self._capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, max_wait: float) -> Optional[float]:
+        """
+        Reserve one token.
+
+        Args:
+            max_wait: Longest acceptable wait in seconds.
+
+        Returns:
+            Seconds to wait before sending the request, or None if the token
+            would not be available within `max_wait` (nothing is reserved).
+        """
+        if self._rate <= 0:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+            self._updated_at = now
+
+            wait = 0.0 if self._tokens >= 1.0 else (1.0 - self._tokens) / self._rate
+            if wait > max_wait:
+                return None
+            # May go negative: later callers queue behind this reservation
+            self._tokens -= 1.0
+            return wait
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker that fails fast after repeated upstream errors.
+
+    After `failure_threshold` consecutive failures the circuit opens and
+    requests are rejected for `cooldown_seconds`. Then a single trial request
+    is let through (half-open): success closes the circuit, failure reopens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, cooldown_seconds: float = 30.0):
+        """
+        Initialize the breaker (closed).
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit.
+            cooldown_seconds: How long the circuit stays open before a trial request.
+        """
+        self._failure_threshold = max(1, failure_threshold)
+        self._cooldown = cooldown_seconds
+        self._failures = 0
+        self._opened_at = 0.0
+        self._state = self.CLOSED
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Current state: closed, open or half_open."""
+        with self._lock:
+            return self._current_state()
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now (claims the trial slot when half-open)."""
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Record a successful request, closing the circuit."""
+        with self._lock:
+            self._failures = 0
+            self._state = self.CLOSED
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the circuit when the threshold is reached."""
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight or self._failures >= self._failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+    def release_trial(self) -> None:
+        """Give back a claimed half-open trial slot that was not used."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def retry_after(self) -> float:
+        """Seconds until the circuit allows a trial request (0 if not open)."""
+        with self._lock:
+            if self._current_state() != self.OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self._cooldown - time.monotonic())
+
+    def _current_state(self) -> str:
+        """State, moving from open to half-open once the cooldown has elapsed."""
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self._cooldown:
+            self._state = self.HALF_OPEN
+            self._trial_in_flight = False
+        return self._state
+
+
+class ProviderGuard:
+    """Rate limiter and circuit breaker protecting one upstream provider."""
+
+    def __init__(
+        self,
+        name: str,
+        limiter: TokenBucket,
+        breaker: CircuitBreaker,
+        max_wait_seconds: float = 1.0,
+    ):
+        """
+        Initialize the guard.
+
+        Args:
+            name: Provider name used in error messages and stats (e.g. "nominatim").
+            limiter: Token bucket enforcing the provider's rate limit.
+            breaker: Circuit breaker tracking the provider's failures.
+            max_wait_seconds: Longest a request waits for a rate-limit token before
+                being rejected.
+        """
+        self.name = name
+        self._limiter = limiter
+        self._breaker = breaker
+        self._max_wait = max_wait_seconds
+        self._lock = threading.Lock()
+        self._stats = {"allowed": 0, "rate_limited": 0, "circuit_rejected": 0, "failures": 0}
+
+    def acquire(self) -> None:
+        """
+        Wait (blocking) until a request may be sent.
+
+        Raises:
+            UpstreamUnavailableError: If the circuit is open or the rate limit
+                would require waiting longer than `max_wait_seconds`.
+        """
+        wait = self._admit()
+        if wait > 0:
+            try:
+                time.sleep(wait)
+            except BaseException:
+                # Interrupted while waiting for a token: the request will never be sent
+                self.release()
+                raise
+
+    async def aacquire(self) -> None:
+        """
+        Wait (without blocking the event loop) until a request may be sent.
+
+        Raises:
+            UpstreamUnavailableError: If the circuit is open or the rate limit
+                would require waiting longer than `max_wait_seconds`.
+        """
+        wait = self._admit()
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except BaseException:
+                # Cancelled while waiting for a token: the request will never be sent
+                self.release()
+                raise
+
+    def release(self) -> None:
+        """
+        Give back an admitted request that ends without an outcome (e.g. cancelled).
+
+        Frees the half-open trial slot if this request held it; otherwise the
+        circuit would stay half-open and reject every later request.
+        """
+        self._breaker.release_trial()
+
+    def record_success(self) -> None:
+        """Record a successful upstream request."""
+        self._breaker.record_success()
+
+    def record_failure(self) -> None:
+        """Record a failed upstream request."""
+        with self._lock:
+            self._stats["failures"] += 1
+        self._breaker.record_failure()
+
+    def stats(self) -> Dict:
+        """Counters and current circuit state."""
+        with self._lock:
+            return {**self._stats, "circuit": self._breaker.state}
+
+    def _admit(self) -> float:
+        """Check the breaker and reserve a token; return the wait in seconds."""
+        if not self._breaker.allow():
+            self._count("circuit_rejected")
+            raise UpstreamUnavailableError(
+                f"{self.name} no disponible temporalmente (reintentar en "
+                f"{self._breaker.retry_after():.0f} s)"
+            )
+
+        wait = self._limiter.reserve(self._max_wait)
+        if wait is None:
+            # The trial slot (if any) was not used; do not hold the circuit half-open
+            self._breaker.release_trial()
+            self._count("rate_limited")
+            raise UpstreamUnavailableError(f"Límite de solicitudes a {self.name} alcanzado")
+
+        self._count("allowed")
+        return wait
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._stats[counter] += 1
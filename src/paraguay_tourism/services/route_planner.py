@@ -0,0 +1,375 @@
+"""Route planning over selected places: nearest-neighbour tour improved with 2-opt."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ..repositories import CoordinateArrays, PlaceLike
+from .location_service import LocationService
+
+
+class RoutePlan:
+    """
+    A planned route: ordered stops and the legs between them.
+
+    In `legs`, a None endpoint stands for the start point.
+    """
+
+    __slots__ = (
+        "stops", "legs", "total_km", "initial_km", "improvements", "complete", "start", "return_to_start",
+    )
+
+    def __init__(
+        self,
+        stops: List[PlaceLike],
+        legs: List[Tuple[Optional[PlaceLike], Optional[PlaceLike], float]],
+        initial_km: float,
+        improvements: int,
+        complete: bool,
+        start: Optional[Tuple[float, float]],
+        return_to_start: bool,
+    ):
+        self.stops = stops
+        self.legs = legs
+        self.total_km = sum(distance for _, _, distance in legs)
+        self.initial_km = initial_km
+        self.improvements = improvements
+        self.complete = complete
+        self.start = start
+        self.return_to_start = return_to_start
+
+    def __repr__(self) -> str:
+        return f"RoutePlan(stops={len(self.stops)}, total_km={self.total_km:.2f})"
+
+
+class RoutePlanner:
+    """
+    Orders a set of places into a short route (a small travelling-salesman tour).
+
+    A nearest-neighbour tour is built first and then improved with 2-opt moves
+    (reversing a stretch of the route) and Or-opt moves (moving a run of up to
+    three stops elsewhere, possibly reversed) whenever they shorten it, until
+    no move helps or the time budget runs out. The route can start at a given point,
+    return to it, or be an open path whose ends are chosen freely. Distances
+    are great-circle (Haversine) kilometers; the pairwise distance matrix is
+    computed with `LocationService` and memoized per set of place IDs for the
+    current catalog version.
+    """
+
+    # Largest number of stops in one route
+    MAX_STOPS = 100
+
+    # Maximum number of distance matrices memoized per catalog version
+    MAX_CACHED_MATRICES = 128
+
+    # Longest run of consecutive stops an Or-opt move relocates
+    MAX_SEGMENT = 3
+
+    # Improvements smaller than this (km) are ignored, so the search cannot cycle on rounding noise
+    _EPSILON_KM = 1e-9
+
+    def __init__(
+        self,
+        location_service: Optional[LocationService] = None,
+        time_budget_seconds: float = 0.2,
+    ):
+        """
+        Initialize the planner.
+
+        Args:
+            location_service: Service computing the distance matrix.
+            time_budget_seconds: Maximum time spent improving each route.
+        """
+        self._location_service = location_service or LocationService()
+        self._time_budget = time_budget_seconds
+        self._lock = threading.Lock()
+        self._version: Optional[int] = None
+        self._matrices: "OrderedDict[Tuple[str, ...], List[List[float]]]" = OrderedDict()
+        self._stats = {"matrix_hits": 0, "matrix_misses": 0}
+
+    def stats(self) -> Dict:
+        """
+        Cache counters.
+
+        Returns:
+            Dictionary with distance matrix cache hits and misses, and the number
+            of matrices cached for the current catalog version.
+        """
+        with self._lock:
+            return {**self._stats, "cached_matrices": len(self._matrices), "version": self._version}
+
+    def distance_matrix(self, places: Sequence[PlaceLike], version: Optional[int] = None) -> List[List[float]]:
+        """
+        Pairwise distances between places, memoized per place-ID sequence.
+
+        Args:
+            places: Places, in the row / column order of the matrix.
+            version: Catalog version the places belong to, enabling the cache.
+
+        Returns:
+            Symmetric matrix of distances in kilometers (shared when cached: never mutate it).
+        """
+        key = tuple(place.id for place in places)
+        if version is not None:
+            with self._lock:
+                if self._version != version:
+                    self._version = version
+                    self._matrices = OrderedDict()
+                matrix = self._matrices.get(key)
+                if matrix is not None:
+                    self._matrices.move_to_end(key)
+                    self._stats["matrix_hits"] += 1
+                    return matrix
+                self._stats["matrix_misses"] += 1
+
+        coordinates = CoordinateArrays([(place.lat, place.lng) for place in places])
+        matrix = self._location_service.distance_matrix(coordinates)
+
+        if version is not None:
+            with self._lock:
+                if self._version == version:
+                    self._matrices[key] = matrix
+                    while len(self._matrices) > self.MAX_CACHED_MATRICES:
+                        self._matrices.popitem(last=False)
+        return matrix
+
+    def plan(
+        self,
+        places: Sequence[PlaceLike],
+        start: Optional[Tuple[float, float]] = None,
+        return_to_start: bool = False,
+        version: Optional[int] = None,
+    ) -> RoutePlan:
+        """
+        Order places into a short route.
+
+        Args:
+            places: Places to visit (duplicates by ID are visited once).
+            start: Optional (latitude, longitude) the route starts from.
+            return_to_start: Whether the route ends where it started (at `start`,
+                or at the first stop when no start is given).
+            version: Catalog version the places belong to, enabling the matrix cache.
+
+        Returns:
+            The planned route.
+
+        Raises:
+            ValueError: If there are no places or more than `MAX_STOPS`.
+        """
+        # Sorting by ID makes the matrix cache key (and the result) independent of input order
+        stops = sorted({place.id: place for place in places}.values(), key=lambda place: place.id)
+        if not stops:
+            raise ValueError("Se requiere al menos un lugar para planificar la ruta")
+        if len(stops) > self.MAX_STOPS:
+            raise ValueError(f"Se admiten como máximo {self.MAX_STOPS} lugares por ruta")
+        matrix = self.distance_matrix(stops, version)
+
+        # The route is a tour through an anchor node: the start point, the first
+        # stop (closed route without start) or a free endpoint (open route)
+        count = len(stops)
+        if start is not None:
+            free = list(range(count))
+            first = [
+                LocationService.calculate_distance_km(start[0], start[1], stop.lat, stop.lng)
+                for stop in stops
+            ]
+            last = first if return_to_start else [0.0] * count
+        elif return_to_start:
+            free = list(range(1, count))
+            first = last = matrix[0]
+        else:
+            free = list(range(count))
+            first = last = [0.0] * count
+
+        tour = self._nearest_neighbour(free, matrix, first)
+        initial_km = self._length(tour, matrix, first, last)
+        improvements, complete = self._improve(tour, matrix, first, last)
+
+        route = [0, *tour] if start is None and return_to_start else tour
+        ordered = [stops[index] for index in route]
+        legs: List[Tuple[Optional[PlaceLike], Optional[PlaceLike], float]] = []
+        if start is not None:
+            legs.append((None, ordered[0], first[route[0]]))
+        legs.extend((stops[a], stops[b], matrix[a][b]) for a, b in zip(route, route[1:]))
+        if return_to_start:
+            if start is not None:
+                legs.append((ordered[-1], None, last[route[-1]]))
+            elif len(route) > 1:
+                legs.append((ordered[-1], ordered[0], matrix[route[-1]][route[0]]))
+        return RoutePlan(ordered, legs, initial_km, improvements, complete, start, return_to_start)
+
+    @staticmethod
+    def _nearest_neighbour(free: List[int], matrix: List[List[float]], first: Sequence[float]) -> List[int]:
+        """Greedy tour: from the anchor, always visit the closest unvisited stop."""
+        if not free:
+            return []
+        remaining = set(free)
+        current = min(free, key=lambda index: first[index])
+        tour = [current]
+        remaining.discard(current)
+        while remaining:
+            row = matrix[current]
+            current = min(remaining, key=row.__getitem__)
+            tour.append(current)
+            remaining.discard(current)
+        return tour
+
+    @staticmethod
+    def _length(
+        tour: List[int], matrix: List[List[float]], first: Sequence[float], last: Sequence[float]
+    ) -> float:
+        """Route length through the anchor."""
+        if not tour:
+            return 0.0
+        inner = sum(matrix[a][b] for a, b in zip(tour, tour[1:]))
+        return first[tour[0]] + inner + last[tour[-1]]
+
+    def _improve(
+        self,
+        tour: List[int],
+        matrix: List[List[float]],
+        first: Sequence[float],
+        last: Sequence[float],
+    ) -> Tuple[int, bool]:
+        """
+        Improve a tour in place with 2-opt and Or-opt moves until neither helps or time runs out.
+
+        Returns:
+            Number of moves applied, and False if the time budget ran out first.
+        """
+        deadline = time.perf_counter() + self._time_budget
+        improvements = 0
+        while True:
+            for search in (self._two_opt, self._or_opt):
+                moves, complete = search(tour, matrix, first, last, deadline)
+                improvements += moves
+                if not complete:
+                    return improvements, False
+            # Or-opt made no move, so the tour is still a 2-opt local optimum
+            if not moves:
+                return improvements, True
+
+    def _two_opt(
+        self,
+        tour: List[int],
+        matrix: List[List[float]],
+        first: Sequence[float],
+        last: Sequence[float],
+        deadline: float,
+    ) -> Tuple[int, bool]:
+        """
+        Apply 2-opt moves until none helps.
+
+        Reversing tour[i..j] replaces the edges (prev, tour[i]) and (tour[j], next)
+        with (prev, tour[j]) and (tour[i], next); edges inside the stretch keep
+        their length because stop-to-stop distances are symmetric. A missing
+        prev / next is the anchor, reached through `first` / `last`.
+
+        Returns:
+            Number of moves applied, and False if the deadline passed first.
+        """
+        size = len(tour)
+        improvements = 0
+        improved = True
+        while improved:
+            improved = False
+            for i in range(size - 1):
+                if time.perf_counter() > deadline:
+                    return improvements, False
+                prev = tour[i - 1] if i > 0 else None
+                prev_row = matrix[prev] if prev is not None else first
+                for j in range(i + 1, size):
+                    head, tail = tour[i], tour[j]
+                    nxt = tour[j + 1] if j + 1 < size else None
+                    before = prev_row[head] + (matrix[tail][nxt] if nxt is not None else last[tail])
+                    after = prev_row[tail] + (matrix[head][nxt] if nxt is not None else last[head])
+                    if after < before - self._EPSILON_KM:
+                        tour[i:j + 1] = tour[i:j + 1][::-1]
+                        improvements += 1
+                        improved = True
+        return improvements, True
+
+    def _or_opt(
+        self,
+        tour: List[int],
+        matrix: List[List[float]],
+        first: Sequence[float],
+        last: Sequence[float],
+        deadline: float,
+    ) -> Tuple[int, bool]:
+        """
+        Apply Or-opt moves until none helps.
+
+        A run of up to `MAX_SEGMENT` consecutive stops is cut out (joining its
+        neighbours) and reinserted, in either direction, into the first edge
+        (u, v) of the rest of the tour where that shortens the tour. A missing
+        u / v is the anchor, reached through `first` / `last`.
+
+        Returns:
+            Number of moves applied, and False if the deadline passed first.
+        """
+        size = len(tour)
+        improvements = 0
+        improved = True
+        while improved:
+            improved = False
+            for length in range(1, min(self.MAX_SEGMENT, size - 1) + 1):
+                for i in range(size - length + 1):
+                    if time.perf_counter() > deadline:
+                        return improvements, False
+                    head, tail = tour[i], tour[i + length - 1]
+                    # Symmetric distances: a row also gives the distances *to* a stop
+                    head_row, tail_row = matrix[head], matrix[tail]
+                    prev = tour[i - 1] if i > 0 else None
+                    nxt = tour[i + length] if i + length < size else None
+                    removed = (
+                        (head_row[prev] if prev is not None else first[head])
+                        + (tail_row[nxt] if nxt is not None else last[tail])
+                        - self._edge(matrix, first, last, prev, nxt)
+                    )
+                    limit = removed - self._EPSILON_KM
+                    if limit <= 0:
+                        continue
+
+                    # Edge (tour[k], tour[k + 1]); k == -1 and k == size - 1 reach the anchor
+                    for k in range(-1, size):
+                        if i - 1 <= k < i + length:
+                            continue
+                        u = tour[k] if k >= 0 else None
+                        v = tour[k + 1] if k + 1 < size else None
+                        joined = self._edge(matrix, first, last, u, v)
+                        to_head = head_row[u] if u is not None else first[head]
+                        to_tail = tail_row[u] if u is not None else first[tail]
+                        from_tail = tail_row[v] if v is not None else last[tail]
+                        from_head = head_row[v] if v is not None else last[head]
+                        forward = to_head + from_tail - joined
+                        backward = to_tail + from_head - joined
+                        if min(forward, backward) < limit:
+                            segment = tour[i:i + length]
+                            if backward < forward:
+                                segment.reverse()
+                            # Insert the segment after tour[k]
+                            if k < i:
+                                tour[k + 1:i + length] = segment + tour[k + 1:i]
+                            else:
+                                tour[i:k + 1] = tour[i + length:k + 1] + segment
+                            improvements += 1
+                            improved = True
+                            break
+        return improvements, True
+
+    @staticmethod
+    def _edge(
+        matrix: List[List[float]],
+        first: Sequence[float],
+        last: Sequence[float],
+        a: Optional[int],
+        b: Optional[int],
+    ) -> float:
+        """Length of the edge a -> b, where a None is the anchor start and b None the anchor end."""
+        if a is None:
+            return first[b]
+        if b is None:
+            return last[a]
+        return matrix[a][b]
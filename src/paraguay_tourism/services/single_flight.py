@@ -0,0 +1,154 @@
+"""Request coalescing: concurrent calls with the same key share one execution."""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    """In-flight synchronous call shared by its leader and followers."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class _Flight:
+    """In-flight asynchronous call: the task running it and how many callers await it."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "asyncio.Task"):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Deduplicate concurrent identical work.
+
+    The first caller for a key (the leader) runs the function; callers that
+    arrive with the same key while it is still running (followers) wait for
+    and share its result or exception. Once the call finishes the key is
+    released, so later callers start a new execution. In asyncio, the work
+    runs in its own task, so any one caller being cancelled (e.g. its client
+    disconnecting) does not affect the others; it is cancelled only when
+    every caller has gone.
+    """
+
+    def __init__(self):
+        """Initialize the in-flight registries and counters."""
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self._flights: Dict[Tuple[asyncio.AbstractEventLoop, str], _Flight] = {}
+        self._stats = {"calls": 0, "executions": 0, "coalesced": 0}
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        """
+        Run `fn` for `key`, or wait for an identical call already in flight (threads).
+
+        Args:
+            key: Deduplication key.
+            fn: Function performing the work.
+
+        Returns:
+            The result of the (possibly shared) execution.
+
+        Raises:
+            Exception: Whatever the shared execution raised.
+        """
+        with self._lock:
+            self._stats["calls"] += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self._stats["executions"] += 1
+            else:
+                self._stats["coalesced"] += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def ado(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Await `fn()` for `key`, or an identical call already in flight (asyncio).
+
+        Args:
+            key: Deduplication key.
+            fn: Coroutine function performing the work.
+
+        Returns:
+            The result of the (possibly shared) execution.
+
+        Raises:
+            Exception: Whatever the shared execution raised.
+        """
+        loop = asyncio.get_running_loop()
+        # Tasks belong to one event loop, so in-flight calls are tracked per loop
+        slot = (loop, key)
+        with self._lock:
+            self._stats["calls"] += 1
+            flight = self._flights.get(slot)
+            if flight is None:
+                flight = self._flights[slot] = _Flight(loop.create_task(fn()))
+                flight.task.add_done_callback(lambda task: self._finish(slot, flight))
+                self._stats["executions"] += 1
+            else:
+                self._stats["coalesced"] += 1
+            flight.waiters += 1
+
+        cancelled = False
+        try:
+            # Shield so a cancelled caller does not cancel the shared call
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        finally:
+            self._leave(slot, flight, cancelled)
+
+    def _leave(self, slot: Tuple[asyncio.AbstractEventLoop, str], flight: _Flight, cancelled: bool) -> None:
+        """Drop a caller from a call, cancelling the call once its last caller was cancelled."""
+        with self._lock:
+            flight.waiters -= 1
+            abandoned = cancelled and flight.waiters == 0 and not flight.task.done()
+            if abandoned and self._flights.get(slot) is flight:
+                # Later callers start afresh instead of joining a cancelled call
+                del self._flights[slot]
+        if abandoned:
+            flight.task.cancel()
+
+    def _finish(self, slot: Tuple[asyncio.AbstractEventLoop, str], flight: _Flight) -> None:
+        """Release a finished call's key."""
+        with self._lock:
+            if self._flights.get(slot) is flight:
+                del self._flights[slot]
+        if not flight.task.cancelled():
+            # Mark as retrieved so a call whose callers all left does not log a warning
+            flight.task.exception()
+
+    def stats(self) -> Dict[str, int]:
+        """Counters: total calls, actual executions and coalesced (deduplicated) calls."""
+        with self._lock:
+            return dict(self._stats)
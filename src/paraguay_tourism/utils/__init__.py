@@ -0,0 +1,11 @@
+"""Utilities package - shared helpers without dependencies on other layers."""
+
+from .text import STOPWORDS, normalize_key, stem, tokenize, transliterate_umlauts
+
+__all__ = [
+    "STOPWORDS",
+    "normalize_key",
+    "stem",
+    "tokenize",
+    "transliterate_umlauts",
+]
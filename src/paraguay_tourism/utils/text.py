@@ -0,0 +1,106 @@
+"""Text normalization helpers shared by indexes and lookups."""
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import List, Tuple
+
+
+def normalize_key(value: str) -> str:
+    """
+    Normalize a string for accent- and case-insensitive lookups.
+
+    Args:
+        value: Text to normalize (e.g., "Asunción", "  ALTO  Paraná ").
+
+    Returns:
+        Lowercased text without diacritics and with collapsed whitespace
+        (e.g., "asuncion", "alto parana").
+    """
+    if value.isascii():
+        # Nothing to decompose; skips the per-character scan
+        return " ".join(value.casefold().split())
+    decomposed = unicodedata.normalize("NFKD", value)
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return " ".join(stripped.casefold().split())
+
+
+# German umlauts and eszett spelled out the way ASCII text writes them
+_UMLAUTS = str.maketrans({
+    "ä": "ae", "ö": "oe", "ü": "ue", "Ä": "Ae", "Ö": "Oe", "Ü": "Ue", "ß": "ss", "ẞ": "SS",
+})
+
+
+def transliterate_umlauts(value: str) -> str:
+    """
+    Spell out German umlauts and eszett in ASCII.
+
+    `normalize_key` folds "ö" to "o"; this gives the other common spelling, so
+    both "Römer" / "Romer" and "Roemer" can be matched.
+
+    Args:
+        value: Text to transliterate (e.g., "Römer", "Straße").
+
+    Returns:
+        Text with ä/ö/ü as ae/oe/ue and ß as ss (e.g., "Roemer", "Strasse").
+    """
+    return unicodedata.normalize("NFC", value).translate(_UMLAUTS)
+
+
+# Frequent Spanish, German and English words that carry no meaning on their own
+STOPWORDS = frozenset("""
+    a al con de del el en la las lo los para por su sus un una y o
+    am an auf aus das dem den der des die ein eine im in mit und von zu zum zur
+    and at of on the to
+""".split())
+
+# Inflectional endings stripped by `stem`, longest first
+_SUFFIXES = ("icas", "icos", "ica", "ico", "es", "en", "er", "os", "as", "s", "a", "o", "e", "n")
+
+# Shortest stem `stem` leaves behind
+_MIN_STEM = 3
+
+_WORD = re.compile(r"[^\W_]+")
+
+
+def tokenize(value: str) -> List[str]:
+    """
+    Split text into normalized words (see `normalize_key`).
+
+    Args:
+        value: Text to split (e.g., "Ruinas Jesuíticas de Trinidad").
+
+    Returns:
+        Lowercased words without diacritics or punctuation
+        (e.g., ["ruinas", "jesuiticas", "de", "trinidad"]).
+    """
+    # Words repeat far more than texts do, so each distinct word is folded once
+    words: List[str] = []
+    for word in _WORD.findall(unicodedata.normalize("NFC", value)):
+        words.extend(_fold_word(word))
+    return words
+
+
+@lru_cache(maxsize=65536)
+def _fold_word(word: str) -> Tuple[str, ...]:
+    """Normalized word(s) for a raw word (folding may split it, e.g. "½" -> "1", "2")."""
+    return tuple(_WORD.findall(normalize_key(word)))
+
+
+def stem(word: str) -> str:
+    """
+    Reduce a normalized word to a crude stem by stripping one inflectional ending.
+
+    Covers Spanish and German plurals, gender and adjective endings, so that
+    e.g. "cascada" / "cascadas" and "kirche" / "kirchen" share a stem.
+
+    Args:
+        word: Normalized word (see `tokenize`).
+
+    Returns:
+        The word without its ending, or unchanged if it is too short.
+    """
+    for suffix in _SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= _MIN_STEM:
+            return word[:-len(suffix)]
+    return word
@@ -0,0 +1,30 @@
+"""Shared pytest configuration: import the package from the source tree."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from paraguay_tourism.models import Place  # noqa: E402
+
+
+@pytest.fixture
+def make_place():
+    """Factory for `Place` models with plausible defaults."""
+
+    def make(place_id: str, lat: float = -25.28, lng: float = -57.63, **fields) -> Place:
+        values = {
+            "name": place_id.replace("-", " ").title(),
+            "description": "",
+            "category": "Historia",
+            "city": "Asunción",
+            "region": "Capital",
+            **fields,
+        }
+        return Place(id=place_id, lat=lat, lng=lng, **values)
+
+    return make
@@ -0,0 +1,85 @@
+"""Tests for multi-dataset catalogs."""
+
+import json
+import os
+
+import pytest
+
+from paraguay_tourism.repositories import CatalogRegistry
+
+
+def _write(path, places):
+    path.write_text(json.dumps([place.model_dump(exclude={"dataset"}) for place in places]), encoding="utf-8")
+
+
+@pytest.fixture
+def registry(tmp_path, make_place):
+    _write(tmp_path / "py.json", [
+        make_place("cabildo", lat=-25.28, lng=-57.64, city="Asunción", category="Historia"),
+        make_place("shared", lat=-25.30, lng=-57.60, city="Asunción", category="Naturaleza"),
+    ])
+    _write(tmp_path / "de.json", [
+        make_place("reichstag", lat=52.52, lng=13.38, city="Berlin", region="Berlin", category="Historia"),
+        make_place("shared", lat=52.50, lng=13.40, city="Berlin", region="Berlin", category="Historia"),
+    ])
+    return CatalogRegistry({"PY": tmp_path / "py.json", "de": tmp_path / "de.json"})
+
+
+def test_places_are_partitioned_by_dataset(registry):
+    catalog = registry.get_catalog()
+
+    assert registry.datasets == catalog.datasets == ("py", "de")
+    assert len(catalog) == 4
+    assert [(place.id, place.dataset) for place in catalog.places] == [
+        ("cabildo", "py"), ("shared", "py"), ("reichstag", "de"), ("shared", "de"),
+    ]
+    for partition in catalog.partitions():
+        assert {place.dataset for place in partition.places} == {partition.dataset}
+    assert catalog.scope(None) is catalog
+    assert catalog.scope(" DE ") is catalog.partition("de")
+
+
+def test_scoped_lookups_only_see_their_dataset(registry):
+    catalog = registry.get_catalog()
+    germany = catalog.scope("de")
+
+    assert [place.id for place in germany.by_category("historia")] == ["reichstag", "shared"]
+    assert [place.dataset for place in catalog.by_category("historia")] == ["py", "de", "de"]
+    assert germany.get("cabildo") is None
+    # Unscoped, an ID in several datasets resolves to the first (highest priority) one
+    assert catalog.get("shared").dataset == "py"
+    assert germany.get("shared").dataset == "de"
+    assert germany.spatial_index.query_bbox(-30.0, -20.0, -60.0, -50.0) == []
+    assert catalog.spatial_index.query_bbox(-30.0, -20.0, -60.0, -50.0) == [0, 1]
+
+
+def test_unknown_dataset_is_rejected(registry):
+    catalog = registry.get_catalog()
+
+    with pytest.raises(ValueError, match="Dataset desconocido: ar. Disponibles: py, de"):
+        catalog.scope("ar")
+    with pytest.raises(KeyError):
+        registry.repository("ar")
+
+
+@pytest.mark.parametrize(
+    "datasets, message",
+    [({}, "At least one dataset"), ({" ": "py.json"}, "must not be empty"), ({"py": "a.json", "PY": "b.json"}, "Duplicate")],
+)
+def test_invalid_dataset_configuration(datasets, message):
+    with pytest.raises(ValueError, match=message):
+        CatalogRegistry(datasets)
+
+
+def test_reloading_one_dataset_keeps_the_other_partition(registry, tmp_path, make_place):
+    catalog = registry.get_catalog()
+    assert registry.get_catalog() is catalog
+
+    _write(tmp_path / "de.json", [make_place("brandenburger-tor", lat=52.52, lng=13.38, city="Berlin")])
+    stat = (tmp_path / "de.json").stat()
+    os.utime(tmp_path / "de.json", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    reloaded = registry.get_catalog()
+    assert reloaded.version > catalog.version
+    assert reloaded.partition("py") is catalog.partition("py")
+    assert [place.id for place in reloaded.partition("de").places] == ["brandenburger-tor"]
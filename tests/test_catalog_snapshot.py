@@ -0,0 +1,95 @@
+"""Tests for compiled catalog snapshots and the repository's fallback to the data file."""
+
+import json
+import logging
+import os
+
+import pytest
+
+from paraguay_tourism.repositories import PlaceRepository
+from paraguay_tourism.repositories import place_repository as place_repository_module
+
+
+@pytest.fixture
+def data_path(tmp_path, make_place):
+    places = [
+        make_place(
+            f"place-{i}", lat=-25.0 - i / 10, lng=-57.0 + i / 10,
+            category=("Historia", "Naturaleza")[i % 2], city=("Asunción", "Luque", "Areguá")[i % 3],
+            description=f"Descripción Nº {i} con ñandutí",
+        ).model_dump(exclude={"dataset"})
+        for i in range(30)
+    ]
+    places.insert(5, {"id": "broken", "lat": "north"})
+    path = tmp_path / "places.json"
+    path.write_text(json.dumps(places, indent=2, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    """Number of times a data file was parsed (instead of read from a snapshot)."""
+    count = [0]
+    reader = place_repository_module.PlaceStreamReader
+
+    def counting_reader(path):
+        count[0] += 1
+        return reader(path)
+
+    monkeypatch.setattr(place_repository_module, "PlaceStreamReader", counting_reader)
+    return count
+
+
+def _models(catalog):
+    return [place.to_model().model_dump() for place in catalog.places]
+
+
+def test_snapshot_round_trip_matches_the_data_file(data_path, parses):
+    from_json = PlaceRepository(data_path, dataset="py").get_catalog()
+    _, snapshot_path, size = PlaceRepository(data_path, dataset="py").build_snapshot()
+    assert snapshot_path == data_path.with_suffix(".catalog")
+    assert snapshot_path.stat().st_size == size
+    assert parses[0] == 2
+
+    from_snapshot = PlaceRepository(data_path, dataset="py").get_catalog()
+
+    assert parses[0] == 2
+    assert _models(from_snapshot) == _models(from_json)
+    assert from_snapshot.error_count == from_json.error_count == 1
+    assert [error.to_dict() for error in from_snapshot.errors] == [error.to_dict() for error in from_json.errors]
+    for column, value in (("category", "naturaleza"), ("city", "AREGUA"), ("region", "capital")):
+        assert list(from_snapshot.positions(column, value)) == list(from_json.positions(column, value))
+    assert from_snapshot.get("place-7").to_model() == from_json.get("place-7").to_model()
+
+
+def test_touched_data_file_falls_back_to_a_reload(data_path, parses):
+    repository = PlaceRepository(data_path)
+    repository.build_snapshot()
+    catalog = repository.get_catalog()
+    parses[0] = 0
+
+    stat = data_path.stat()
+    os.utime(data_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    reloaded = repository.get_catalog()
+
+    assert parses[0] == 1
+    assert reloaded.version > catalog.version
+    assert _models(reloaded) == _models(catalog)
+    # The stale snapshot is not used by a fresh repository either
+    PlaceRepository(data_path).get_catalog()
+    assert parses[0] == 2
+
+
+def test_corrupt_snapshot_falls_back_to_the_data_file(data_path, parses, caplog):
+    repository = PlaceRepository(data_path)
+    expected = _models(repository.get_catalog())
+    _, snapshot_path, _ = repository.build_snapshot()
+    snapshot_path.write_bytes(b"not a catalog snapshot at all, just some bytes here")
+    parses[0] = 0
+
+    with caplog.at_level(logging.WARNING):
+        catalog = PlaceRepository(data_path).get_catalog()
+
+    assert parses[0] == 1
+    assert _models(catalog) == expected
+    assert "Ignoring unreadable catalog snapshot" in caplog.text
@@ -0,0 +1,33 @@
+"""Tests for the offline gazetteer."""
+
+import pytest
+
+from paraguay_tourism.repositories import CatalogRegistry
+from paraguay_tourism.services import Gazetteer
+
+
+@pytest.fixture(scope="module")
+def gazetteer():
+    return Gazetteer(CatalogRegistry(), Gazetteer.DEFAULT_LOCALITIES_PATH)
+
+
+@pytest.mark.parametrize("query", ["Trinidad, Cuba", "Concepción, Chile", "San Lorenzo, Santa Fe, Argentina"])
+@pytest.mark.parametrize("country_code", [None, ""])
+def test_foreign_city_country_query_is_left_to_nominatim(gazetteer, query, country_code):
+    assert gazetteer.lookup(query, country_code) is None
+
+
+@pytest.mark.parametrize(
+    "query, display_name",
+    [
+        ("Trinidad, Itapúa", "Trinidad, Itapúa"),
+        ("Asunción, Paraguay", "Asunción, Capital"),
+        ("Concepcion, PY", "Concepción, Concepción"),
+        ("Encarnación", "Encarnación, Itapúa"),
+    ],
+)
+def test_local_queries_resolve_locally(gazetteer, query, display_name):
+    result = gazetteer.lookup(query, None)
+    assert result is not None
+    assert result["source"] == "gazetteer"
+    assert result["display_name"] == display_name
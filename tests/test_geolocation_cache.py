@@ -0,0 +1,108 @@
+"""Tests for the geolocation result cache."""
+
+import pytest
+
+from paraguay_tourism.services import GeolocationCache
+from paraguay_tourism.services import geolocation_cache as geolocation_cache_module
+
+FOUND = {"success": True, "latitude": -25.28, "longitude": -57.63}
+NOT_FOUND = {"success": False, "error": "Ubicación no encontrada"}
+
+
+class _Clock:
+    """Stand-in for the `time` module with a settable wall clock."""
+
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(geolocation_cache_module, "time", clock)
+    return clock
+
+
+def test_entries_expire_after_their_ttl(clock):
+    cache = GeolocationCache(ttl_seconds=60.0, negative_ttl_seconds=10.0)
+    cache.set("geocode|asuncion|py", FOUND)
+    cache.set("geocode|atlantida|py", NOT_FOUND, negative=True)
+
+    clock.now += 9.0
+    assert cache.get("geocode|asuncion|py") == FOUND
+    assert cache.get("geocode|atlantida|py") == NOT_FOUND
+
+    clock.now += 2.0
+    assert cache.get("geocode|atlantida|py") is None
+    assert cache.get("geocode|asuncion|py") == FOUND
+
+    clock.now += 50.0
+    assert cache.get("geocode|asuncion|py") is None
+    stats = cache.stats()
+    assert (stats["hits"], stats["negative_hits"], stats["misses"], stats["size"]) == (2, 1, 2, 0)
+
+
+def test_zero_ttl_disables_caching():
+    cache = GeolocationCache(ttl_seconds=0.0, negative_ttl_seconds=0.0)
+    cache.set("ip|1.2.3.4", FOUND)
+    cache.set("ip|5.6.7.8", NOT_FOUND, negative=True)
+
+    assert cache.get("ip|1.2.3.4") is None
+    assert cache.get("ip|5.6.7.8") is None
+    assert cache.stats()["stores"] == 0
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = GeolocationCache(max_entries=2)
+    cache.set("a", {"success": True, "name": "a"})
+    cache.set("b", {"success": True, "name": "b"})
+    # Reading "a" makes "b" the least recently used
+    assert cache.get("a") is not None
+    cache.set("c", {"success": True, "name": "c"})
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_results_are_copies():
+    cache = GeolocationCache()
+    value = {"success": True, "address": {"city": "Asunción"}}
+    cache.set("k", value)
+    value["address"]["city"] = "Luque"
+
+    cached = cache.get("k")
+    cached["address"]["city"] = "Encarnación"
+    assert cache.get("k") == {"success": True, "address": {"city": "Asunción"}}
+
+
+def test_sqlite_backend_persists_across_instances(tmp_path, clock):
+    path = tmp_path / "cache" / "geo.sqlite"
+    first = GeolocationCache(ttl_seconds=60.0, negative_ttl_seconds=10.0, sqlite_path=path)
+    first.set("geocode|asuncion|py", FOUND)
+    first.set("geocode|atlantida|py", NOT_FOUND, negative=True)
+    first.close()
+
+    second = GeolocationCache(ttl_seconds=60.0, negative_ttl_seconds=10.0, sqlite_path=path)
+    assert second.get("geocode|asuncion|py") == FOUND
+    assert second.get("geocode|atlantida|py") == NOT_FOUND
+    second.close()
+
+    # Expired rows are not served (and are dropped when the database is opened)
+    clock.now += 30.0
+    third = GeolocationCache(sqlite_path=path)
+    assert third.get("geocode|atlantida|py") is None
+    assert third.get("geocode|asuncion|py") == FOUND
+
+    third.clear()
+    third.close()
+    fourth = GeolocationCache(sqlite_path=path)
+    assert fourth.get("geocode|asuncion|py") is None
+    fourth.close()
+
+
+def test_make_key_joins_normalized_parts():
+    assert GeolocationCache.make_key("geocode", "asuncion", None) == "geocode|asuncion|"
@@ -0,0 +1,309 @@
+"""Tests for the location service."""
+
+import random
+
+import pytest
+
+from paraguay_tourism.models import Place
+from paraguay_tourism.repositories import CoordinateArrays, SpatialIndex
+from paraguay_tourism.repositories.coordinate_arrays import NUMPY_AVAILABLE
+from paraguay_tourism.services import LocationService
+
+VECTORIZED = [
+    pytest.param(True, id="numpy", marks=pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not installed")),
+    pytest.param(False, id="pure-python"),
+]
+
+# (use spatial index, use coordinate columns, NumPy columns)
+SEARCH_MODES = [
+    pytest.param(False, False, False, id="scan"),
+    pytest.param(True, False, False, id="index"),
+    pytest.param(True, True, False, id="index-pure-python"),
+    pytest.param(
+        True, True, True, id="index-numpy",
+        marks=pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not installed"),
+    ),
+]
+
+
+@pytest.fixture(scope="module")
+def points():
+    rng = random.Random(20240517)
+    return [(rng.uniform(-90, 90), rng.uniform(-180, 180)) for _ in range(2000)]
+
+
+@pytest.mark.parametrize("use_numpy", VECTORIZED)
+def test_distances_km_matches_scalar_haversine(points, use_numpy):
+    coordinates = CoordinateArrays(points, use_numpy=use_numpy)
+    assert coordinates.vectorized == use_numpy
+
+    for center_lat, center_lng in points[:20]:
+        distances = LocationService.distances_km(coordinates, center_lat, center_lng)
+        expected = [LocationService.calculate_distance_km(center_lat, center_lng, lat, lng) for lat, lng in points]
+        assert list(distances) == pytest.approx(expected, rel=0, abs=1e-9)
+
+
+@pytest.mark.parametrize("use_numpy", VECTORIZED)
+def test_distances_km_measures_selected_positions_in_order(points, use_numpy):
+    coordinates = CoordinateArrays(points, use_numpy=use_numpy)
+    positions = [1999, 0, 42, 42, 7]
+    center_lat, center_lng = -25.2822, -57.6352
+
+    distances = LocationService.distances_km(coordinates, center_lat, center_lng, positions)
+    expected = [LocationService.calculate_distance_km(center_lat, center_lng, *points[i]) for i in positions]
+    assert list(distances) == pytest.approx(expected, rel=0, abs=1e-9)
+
+
+@pytest.fixture(scope="module")
+def catalog():
+    """Places around Asunción plus a few far away, with groups sharing exact coordinates (ties)."""
+    rng = random.Random(7)
+    points = [(-25.3 + rng.uniform(-0.5, 0.5), -57.6 + rng.uniform(-0.5, 0.5)) for _ in range(300)]
+    points += [(rng.uniform(-60, 60), rng.uniform(-180, 180)) for _ in range(30)]
+    for i in range(0, 60, 6):
+        points[i + 1] = points[i + 2] = points[i]
+    return [
+        Place(
+            id=f"place-{i}", name=f"Lugar {i}", description="", category="Historia",
+            lat=lat, lng=lng, city="Asunción", region="Capital",
+        )
+        for i, (lat, lng) in enumerate(points)
+    ]
+
+
+def _search_arguments(catalog, use_index, use_coordinates, use_numpy):
+    points = [(place.lat, place.lng) for place in catalog]
+    return {
+        "spatial_index": SpatialIndex(points, cell_size_deg=0.05) if use_index else None,
+        "coordinates": CoordinateArrays(points, use_numpy=use_numpy) if use_coordinates else None,
+    }
+
+
+def _brute_force(catalog, lat, lng, max_distance_km=float("inf")):
+    """(distance, position) of every place within range, closest first, ties in catalog order."""
+    measured = [
+        (LocationService.calculate_distance_km(lat, lng, place.lat, place.lng), position)
+        for position, place in enumerate(catalog)
+    ]
+    return sorted(entry for entry in measured if entry[0] <= max_distance_km)
+
+
+def _assert_same(results, expected, catalog):
+    assert [place.id for place, _ in results] == [catalog[position].id for _, position in expected]
+    assert [distance for _, distance in results] == pytest.approx([distance for distance, _ in expected], abs=1e-9)
+
+
+@pytest.mark.parametrize("use_index, use_coordinates, use_numpy", SEARCH_MODES)
+@pytest.mark.parametrize("k", [1, 5, 20, 100])
+@pytest.mark.parametrize("max_distance_km", [None, 15.0, 5000.0])
+def test_find_k_nearest_matches_brute_force(catalog, use_index, use_coordinates, use_numpy, k, max_distance_km):
+    arguments = _search_arguments(catalog, use_index, use_coordinates, use_numpy)
+    for lat, lng in [(catalog[0].lat, catalog[0].lng), (-25.3, -57.6), (40.0, 170.0), (-24.9, -57.1)]:
+        results = LocationService.find_k_nearest(
+            catalog, lat, lng, k, max_distance_km=max_distance_km, **arguments
+        )
+        limit = float("inf") if max_distance_km is None else max_distance_km
+        _assert_same(results, _brute_force(catalog, lat, lng, limit)[:k], catalog)
+
+
+@pytest.mark.parametrize("use_index, use_coordinates, use_numpy", SEARCH_MODES)
+def test_find_k_nearest_ties_keep_catalog_order(catalog, use_index, use_coordinates, use_numpy):
+    arguments = _search_arguments(catalog, use_index, use_coordinates, use_numpy)
+    center = catalog[12]
+    results = LocationService.find_k_nearest(catalog, center.lat, center.lng, 3, **arguments)
+    assert [place.id for place, _ in results] == ["place-12", "place-13", "place-14"]
+    assert [distance for _, distance in results] == [0.0, 0.0, 0.0]
+
+    # The tie straddling the k boundary is cut in catalog order too
+    results = LocationService.find_k_nearest(catalog, center.lat, center.lng, 2, **arguments)
+    assert [place.id for place, _ in results] == ["place-12", "place-13"]
+
+
+@pytest.mark.parametrize("use_index, use_coordinates, use_numpy", SEARCH_MODES)
+def test_find_k_nearest_with_k_larger_than_the_catalog(catalog, use_index, use_coordinates, use_numpy):
+    arguments = _search_arguments(catalog, use_index, use_coordinates, use_numpy)
+    results = LocationService.find_k_nearest(catalog, -25.3, -57.6, len(catalog) + 50, **arguments)
+    _assert_same(results, _brute_force(catalog, -25.3, -57.6), catalog)
+    assert len(results) == len(catalog)
+
+    assert LocationService.find_k_nearest(catalog, -25.3, -57.6, 0, **arguments) == []
+    assert LocationService.find_k_nearest([], -25.3, -57.6, 5) == []
+
+
+@pytest.mark.parametrize("use_index, use_coordinates, use_numpy", SEARCH_MODES)
+@pytest.mark.parametrize("max_matrix_cells", [None, 1000, 1])
+def test_batch_matches_single_origin_calls(
+    catalog, monkeypatch, use_index, use_coordinates, use_numpy, max_matrix_cells
+):
+    if max_matrix_cells is not None:
+        # 330 places: 1000 cells means blocks of 3 origins, 1 cell still one origin per block
+        monkeypatch.setattr(LocationService, "MAX_MATRIX_CELLS", max_matrix_cells)
+    arguments = _search_arguments(catalog, use_index, use_coordinates, use_numpy)
+    rng = random.Random(11)
+    origins = [
+        (-25.3 + rng.uniform(-0.6, 0.6), -57.6 + rng.uniform(-0.6, 0.6), rng.choice([0.0, 5.0, 30.0]))
+        for _ in range(10)
+    ]
+    origins.append((catalog[0].lat, catalog[0].lng, 0.0))
+    origins.append((0.0, 0.0, 20000.0))
+
+    batch = LocationService.filter_places_by_distance_batch(catalog, origins, **arguments)
+
+    assert len(batch) == len(origins)
+    for (lat, lng, max_distance_km), results in zip(origins, batch):
+        single = LocationService.filter_places_by_distance(catalog, lat, lng, max_distance_km, **arguments)
+        assert [place.id for place, _ in results] == [place.id for place, _ in single]
+        assert [distance for _, distance in results] == pytest.approx([distance for _, distance in single], abs=1e-9)
+        _assert_same(results, _brute_force(catalog, lat, lng, max_distance_km), catalog)
+
+
+def test_batch_with_no_origins_or_places(catalog):
+    assert LocationService.filter_places_by_distance_batch(catalog, []) == []
+    assert LocationService.filter_places_by_distance_batch([], [(-25.3, -57.6, 10.0)]) == [[]]
+
+
+def _place_at(index, lat, lng):
+    return Place(
+        id=f"p{index}", name=f"Lugar {index}", description="", category="Naturaleza",
+        lat=lat, lng=lng, city="Ciudad", region="Región",
+    )
+
+
+def _region_search(points, use_index, use_coordinates, use_numpy):
+    """Places at `points` and the search arguments for one mode (coarse grid to exercise cell edges)."""
+    places = [_place_at(i, lat, lng) for i, (lat, lng) in enumerate(points)]
+    return places, {
+        "spatial_index": SpatialIndex(points, cell_size_deg=1.0) if use_index else None,
+        "coordinates": CoordinateArrays(points, use_numpy=use_numpy) if use_coordinates else None,
+    }
+
+
+@pytest.mark.parametrize(
+    "box",
+    [
+        (-91.0, 0.0, 0.0, 10.0),
+        (0.0, 91.0, 0.0, 10.0),
+        (10.0, 0.0, 0.0, 10.0),
+        (0.0, 10.0, -181.0, 10.0),
+        (0.0, 10.0, 0.0, 200.0),
+        (0.0, 10.0, 190.0, -170.0),
+        (0.0, 10.0, float("nan"), 10.0),
+    ],
+)
+def test_places_in_bbox_rejects_invalid_boxes(box):
+    places = [_place_at(0, 5.0, 5.0)]
+    with pytest.raises(ValueError):
+        LocationService.places_in_bbox(places, *box)
+    with pytest.raises(ValueError):
+        LocationService.places_in_bbox(places, *box, spatial_index=SpatialIndex([(5.0, 5.0)], cell_size_deg=1.0))
+
+
+@pytest.mark.parametrize("use_index", [False, True])
+def test_places_in_bbox_across_the_antimeridian(use_index):
+    points = [(-17.0, 179.5), (-17.0, -179.5), (-17.0, 180.0), (-17.0, -180.0), (-17.0, 0.0), (-17.0, 170.0)]
+    places, arguments = _region_search(points, use_index, False, False)
+
+    found = LocationService.places_in_bbox(places, -20.0, -15.0, 175.0, -175.0, arguments["spatial_index"])
+    assert [place.id for place in found] == ["p0", "p1", "p2", "p3"]
+
+
+@pytest.mark.parametrize("use_index, use_coordinates, use_numpy", SEARCH_MODES)
+def test_places_in_polygon_across_the_antimeridian(use_index, use_coordinates, use_numpy):
+    # Square around Fiji, from 177 E to 178 W
+    polygon = [(-20.0, 177.0), (-20.0, -178.0), (-15.0, -178.0), (-15.0, 177.0)]
+    points = [
+        (-17.0, 179.0), (-17.0, -179.0), (-17.0, 180.0), (-17.0, -180.0),  # inside
+        (-17.0, 0.0), (-17.0, 176.0), (-17.0, -177.0), (-21.0, 179.0),  # outside
+    ]
+    places, arguments = _region_search(points, use_index, use_coordinates, use_numpy)
+
+    found = LocationService.places_in_polygon(places, polygon, **arguments)
+    assert [place.id for place in found] == ["p0", "p1", "p2", "p3"]
+
+    # The same ring listed from the other side of the antimeridian
+    rotated = polygon[1:] + polygon[:1]
+    assert LocationService.places_in_polygon(places, rotated, **arguments) == found
+
+
+@pytest.mark.parametrize("use_index, use_coordinates, use_numpy", SEARCH_MODES)
+def test_places_in_polygon_concave(use_index, use_coordinates, use_numpy):
+    # U shape: two arms joined at the south, open to the north between lng 2 and 8
+    polygon = [(0.0, 0.0), (0.0, 10.0), (10.0, 10.0), (10.0, 8.0), (2.0, 8.0), (2.0, 2.0), (10.0, 2.0), (10.0, 0.0)]
+    points = [
+        (5.0, 1.0), (5.0, 9.0), (1.0, 5.0),  # arms and base
+        (5.0, 5.0), (9.0, 5.0), (11.0, 5.0), (5.0, -1.0),  # notch and outside
+    ]
+    places, arguments = _region_search(points, use_index, use_coordinates, use_numpy)
+
+    found = LocationService.places_in_polygon(places, polygon, **arguments)
+    assert [place.id for place in found] == ["p0", "p1", "p2"]
+    assert [place.id for place in found] == [
+        place.id for place in places if LocationService.point_in_polygon(place.lat, place.lng, polygon)
+    ]
+
+
+@pytest.mark.parametrize("use_index, use_coordinates, use_numpy", SEARCH_MODES)
+def test_places_in_polygon_on_vertices_and_edges(use_index, use_coordinates, use_numpy):
+    polygon = [(0.0, 0.0), (0.0, 10.0), (10.0, 10.0), (10.0, 0.0)]
+    # Vertices, then points on the south, west, north and east edges
+    points = [(0.0, 0.0), (0.0, 10.0), (10.0, 10.0), (10.0, 0.0), (0.0, 5.0), (5.0, 0.0), (10.0, 5.0), (5.0, 10.0)]
+    places, arguments = _region_search(points, use_index, use_coordinates, use_numpy)
+
+    found = LocationService.places_in_polygon(places, polygon, **arguments)
+    # Every mode resolves boundary points the same way as point_in_polygon
+    assert [place.id for place in found] == [
+        place.id for place in places if LocationService.point_in_polygon(place.lat, place.lng, polygon)
+    ]
+    # Half-open rule: the southern and western edges count as inside
+    assert {"p4", "p5"} <= {place.id for place in found}
+    assert not {"p6", "p7"} & {place.id for place in found}
+
+
+@pytest.mark.parametrize(
+    "polygon",
+    [
+        [(0.0, 0.0), (1.0, 1.0)],
+        [(0.0, 0.0), (1.0, 1.0), (0.0, 0.0)],
+        [(0.0, 0.0), (1.0, 1.0), (91.0, 0.0)],
+        [(0.0, 0.0), (1.0, 1.0), (0.0, 181.0)],
+        # Around the south pole: the longitudes wrap all the way around
+        [(-80.0, -180.0), (-80.0, -60.0), (-80.0, 60.0)],
+    ],
+)
+def test_places_in_polygon_rejects_invalid_polygons(polygon):
+    with pytest.raises(ValueError):
+        LocationService.places_in_polygon([_place_at(0, 0.5, 0.5)], polygon)
+
+
+@pytest.fixture(scope="module")
+def antimeridian_catalog():
+    """Places scattered around Fiji, on both sides of the antimeridian, and near the north pole."""
+    rng = random.Random(5)
+    points = [(rng.uniform(-21, -13), rng.uniform(175, 180)) for _ in range(150)]
+    points += [(rng.uniform(-21, -13), rng.uniform(-180, -175)) for _ in range(150)]
+    points += [(rng.uniform(85, 90), rng.uniform(-180, 180)) for _ in range(100)]
+    return [_place_at(i, lat, lng) for i, (lat, lng) in enumerate(points)]
+
+
+@pytest.mark.parametrize("use_index, use_coordinates, use_numpy", SEARCH_MODES)
+@pytest.mark.parametrize(
+    "center_lat, center_lng, max_distance_km",
+    [(-17.0, 180.0, 150.0), (-17.0, -179.9, 300.0), (-17.0, 179.9, 120.0), (88.0, 0.0, 400.0), (89.9, 120.0, 100.0)],
+)
+def test_distance_filter_with_index_matches_a_full_scan(
+    antimeridian_catalog, use_index, use_coordinates, use_numpy, center_lat, center_lng, max_distance_km
+):
+    points = [(place.lat, place.lng) for place in antimeridian_catalog]
+    arguments = {
+        "spatial_index": SpatialIndex(points, cell_size_deg=0.5) if use_index else None,
+        "coordinates": CoordinateArrays(points, use_numpy=use_numpy) if use_coordinates else None,
+    }
+
+    results = LocationService.filter_places_by_distance(
+        antimeridian_catalog, center_lat, center_lng, max_distance_km, **arguments
+    )
+
+    expected = _brute_force(antimeridian_catalog, center_lat, center_lng, max_distance_km)
+    assert expected
+    assert [place.id for place, _ in results] == [antimeridian_catalog[position].id for _, position in expected]
+    assert [distance for _, distance in results] == pytest.approx([distance for distance, _ in expected], abs=1e-9)
@@ -0,0 +1,132 @@
+"""Tests for the metrics registry: histogram quantiles and the Prometheus exposition."""
+
+import math
+import re
+
+import pytest
+
+from paraguay_tourism.services import MetricsRegistry
+from paraguay_tourism.services.metrics import Histogram
+
+BOUNDS = tuple(round(0.1 * i, 1) for i in range(1, 11))
+
+
+def _exact_quantile(values, q):
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+@pytest.mark.parametrize("q", [0.0, 0.1, 0.5, 0.9, 0.99, 1.0])
+def test_quantiles_are_within_one_bucket_of_the_exact_value(q):
+    values = [i / 1000 for i in range(1, 1001)]
+    histogram = Histogram(BOUNDS)
+    for value in values:
+        histogram.observe(value)
+
+    assert histogram.quantile(q) == pytest.approx(_exact_quantile(values, q), abs=0.1)
+    # Uniform data: interpolation inside the bucket is nearly exact
+    assert histogram.quantile(q) == pytest.approx(q, abs=0.002)
+
+
+def test_quantiles_are_narrowed_to_the_observed_range():
+    histogram = Histogram(BOUNDS)
+    histogram.observe(0.33)
+    assert [histogram.quantile(q) for q in (0.0, 0.5, 0.99, 1.0)] == [0.33, 0.33, 0.33, 0.33]
+
+    # Values above the last bound land in the +Inf bucket, capped at the maximum
+    histogram.observe(7.5)
+    assert histogram.quantile(1.0) == 7.5
+    assert 1.0 <= histogram.quantile(0.75) <= 7.5
+
+
+def test_empty_histogram_summary():
+    summary = Histogram(BOUNDS).summary(1000.0)
+
+    assert summary == {"count": 0, "mean": 0.0, "p50": 0.0, "p90": 0.0, "p99": 0.0, "max": 0.0}
+
+
+def test_summary_scales_and_rounds():
+    histogram = Histogram(BOUNDS)
+    for value in (0.05, 0.15, 0.25, 0.35):
+        histogram.observe(value)
+
+    summary = histogram.summary(1000.0)
+    assert summary["count"] == 4
+    assert summary["mean"] == 200.0
+    assert summary["max"] == 350.0
+    assert summary["p50"] <= summary["p90"] <= summary["p99"] <= summary["max"]
+
+
+@pytest.fixture
+def registry():
+    registry = MetricsRegistry()
+    registry.observe_tool("list_all_tourist_places", 0.002, payload_bytes=2000)
+    registry.observe_tool("list_all_tourist_places", 0.3, payload_bytes=100)
+    registry.observe_tool('weird"tool\\name', 12.0, error=True)
+    registry.observe_stage("formatting", 0.0004)
+    registry.observe_upstream("nominatim", 0.2)
+    registry.observe_upstream("nominatim", 5.0, error="timeout")
+    return registry
+
+
+def _samples(text):
+    """Sample lines as {(name, labels): value}."""
+    samples = {}
+    for line in text.splitlines():
+        if line.startswith("#"):
+            continue
+        match = re.fullmatch(r"([a-z_]+)(?:\{(.*)\})? (\S+)", line)
+        assert match, line
+        samples[(match.group(1), match.group(2) or "")] = float(match.group(3))
+    return samples
+
+
+def test_prometheus_exposition(registry):
+    text = registry.render_prometheus()
+    samples = _samples(text)
+    prefix = MetricsRegistry.PREFIX
+
+    assert text.endswith("\n")
+    for metric, kind in (
+        ("tool_calls_total", "counter"),
+        ("tool_duration_seconds", "histogram"),
+        ("tool_response_bytes", "histogram"),
+        ("stage_duration_seconds", "histogram"),
+        ("upstream_errors_total", "counter"),
+        ("uptime_seconds", "gauge"),
+    ):
+        assert text.count(f"# TYPE {prefix}_{metric} {kind}\n") == 1
+
+    assert samples[(f"{prefix}_tool_calls_total", 'tool="list_all_tourist_places"')] == 2
+    assert samples[(f"{prefix}_tool_errors_total", 'tool="weird\\"tool\\\\name"')] == 1
+    assert samples[(f"{prefix}_upstream_requests_total", 'provider="nominatim"')] == 2
+    assert samples[(f"{prefix}_upstream_errors_total", 'provider="nominatim",kind="timeout"')] == 1
+
+    # Buckets are cumulative and end with +Inf == _count
+    name = f"{prefix}_tool_duration_seconds"
+    label = 'tool="list_all_tourist_places"'
+    le_prefix = f'{label},le="'
+    buckets = [
+        (labels[len(le_prefix):-1], value) for (metric, labels), value in samples.items()
+        if metric == f"{name}_bucket" and labels.startswith(le_prefix)
+    ]
+    assert [le for le, _ in buckets] == [repr(float(bound)) for bound in MetricsRegistry.LATENCY_BUCKETS] + ["+Inf"]
+    counts = [value for _, value in buckets]
+    assert counts == sorted(counts)
+    assert samples[(f"{name}_bucket", f'{label},le="0.0025"')] == 1
+    assert samples[(f"{name}_bucket", f'{label},le="0.25"')] == 1
+    assert samples[(f"{name}_bucket", f'{label},le="0.5"')] == 2
+    assert counts[-1] == samples[(f"{name}_count", label)] == 2
+    assert samples[(f"{name}_sum", label)] == pytest.approx(0.302)
+
+
+def test_write_prometheus_replaces_the_file(registry, tmp_path):
+    path = tmp_path / "metrics.prom"
+    path.write_text("stale", encoding="utf-8")
+
+    assert registry.write_prometheus(path) == path
+    content = path.read_text(encoding="utf-8")
+    assert content.startswith("# HELP")
+    assert _samples(content).keys() == _samples(registry.render_prometheus()).keys()
+    assert list(tmp_path.iterdir()) == [path]
+    assert MetricsRegistry().write_prometheus() is None
@@ -0,0 +1,126 @@
+"""Tests for the place formatter: pagination, projection and caches."""
+
+import re
+
+import pytest
+
+from paraguay_tourism.services import PlaceFormatter
+
+
+def test_place_cache_is_bounded_and_least_recently_used(make_place, monkeypatch):
+    monkeypatch.setattr(PlaceFormatter, "MAX_CACHED_PLACES", 3)
+    formatter = PlaceFormatter()
+    places = [make_place(f"place-{i}") for i in range(5)]
+
+    for place in places[:3]:
+        formatter.format_single(place, version=1)
+    # Touch the oldest entry so the second one is evicted next
+    formatter.format_single(places[0], version=1)
+    formatter.format_single(places[3], version=1)
+
+    assert formatter.stats()["cached_places"] == 3
+    cached = {id(place) for place in places} & set(formatter._place_cache)
+    assert cached == {id(places[0]), id(places[2]), id(places[3])}
+
+    for place in places:
+        formatter.format_as_table([place], version=1)
+    assert formatter.stats()["cached_places"] == 3
+
+
+def test_payloads_are_copies_of_the_cached_dump(make_place):
+    formatter = PlaceFormatter()
+    place = make_place("cabildo")
+
+    first = formatter.format_single(place, version=1)["place"]
+    first["name"] = "Modificado"
+    listing = formatter.format_as_dict([place], version=1, include_table=False)["raw"][0]
+    listing["city"] = "Modificada"
+    batch = formatter.format_batch_with_distances([(0.0, 0.0, 10.0)], [[(place, 1.0)]], version=1)
+    next(iter(batch["places"].values()))["region"] = "Modificada"
+
+    assert formatter.format_single(place, version=1)["place"] == place.model_dump()
+    assert formatter.format_as_table([place], version=1).count("Cabildo") == 1
+
+
+def test_new_catalog_version_clears_the_place_cache(make_place):
+    formatter = PlaceFormatter()
+    formatter.format_single(make_place("cabildo"), version=1)
+    assert formatter.stats()["cached_places"] == 1
+
+    formatter.format_single(make_place("panteon"), version=2)
+    stats = formatter.stats()
+    assert (stats["cached_places"], stats["version"]) == (1, 2)
+
+
+@pytest.fixture
+def places(make_place):
+    return [make_place(f"place-{i}", name=f"Lugar {i}") for i in range(7)]
+
+
+@pytest.mark.parametrize(
+    "offset, limit, ids, next_offset",
+    [
+        (0, None, [0, 1, 2, 3, 4, 5, 6], None),
+        (0, 3, [0, 1, 2], 3),
+        (3, 3, [3, 4, 5], 6),
+        (6, 3, [6], None),
+        (4, 3, [4, 5, 6], None),
+        (7, 3, [], None),
+        (20, None, [], None),
+    ],
+)
+def test_pages_report_bounds_and_next_offset(places, offset, limit, ids, next_offset):
+    formatter = PlaceFormatter()
+    distances = [(place, float(i)) for i, place in enumerate(places)]
+
+    for result in (
+        formatter.format_as_dict(places, version=1, cache_key="all", offset=offset, limit=limit),
+        formatter.format_with_distances(distances, version=1, offset=offset, limit=limit),
+    ):
+        assert [place["id"] for place in result["raw"]] == [f"place-{i}" for i in ids]
+        assert (result["total"], result["count"], result["offset"], result["next_offset"]) == (
+            7, len(ids), offset, next_offset,
+        )
+        assert len(re.findall(r"Lugar \d", result["table"])) == len(ids)
+
+
+def test_following_next_offset_visits_every_place_once(places):
+    formatter = PlaceFormatter()
+    seen, offset = [], 0
+    while offset is not None:
+        page = formatter.format_as_dict(places, version=1, cache_key="all", offset=offset, limit=2, include_table=False)
+        assert "table" not in page
+        seen += [place["id"] for place in page["raw"]]
+        offset = page["next_offset"]
+
+    assert seen == [place.id for place in places]
+
+
+@pytest.mark.parametrize("offset, limit", [(-1, None), (0, 0), (0, -5)])
+def test_invalid_page_bounds_are_rejected(places, offset, limit):
+    with pytest.raises(ValueError):
+        PlaceFormatter().format_as_dict(places, offset=offset, limit=limit)
+
+
+def test_fields_project_the_payload_and_always_include_the_id(places):
+    formatter = PlaceFormatter()
+
+    result = formatter.format_as_dict(places, version=1, fields=["city", "name", "city"], limit=2)
+    assert result["raw"] == [
+        {"id": place.id, "city": place.city, "name": place.name} for place in places[:2]
+    ]
+    assert list(result["raw"][0]) == ["id", "city", "name"]
+
+    distances = formatter.format_with_distances([(places[0], 1.234)], fields=["lat"])
+    assert distances["raw"] == [{"id": "place-0", "lat": places[0].lat, "distance_km": 1.23}]
+
+
+def test_unknown_fields_are_rejected(places):
+    formatter = PlaceFormatter()
+
+    with pytest.raises(ValueError, match="Campos desconocidos: rating"):
+        formatter.format_as_dict(places, fields=["name", "rating"])
+    with pytest.raises(ValueError, match="Campos desconocidos"):
+        formatter.format_with_distances([(places[0], 1.0)], fields=["distance"])
+    with pytest.raises(ValueError, match="Campos desconocidos"):
+        formatter.format_batch_with_distances([(0.0, 0.0, 10.0)], [[(places[0], 1.0)]], fields=["Name"])
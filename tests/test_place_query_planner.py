@@ -0,0 +1,114 @@
+"""Tests for combined place queries."""
+
+import pytest
+
+from paraguay_tourism.repositories import PlaceCatalog
+from paraguay_tourism.services import LocationService
+from paraguay_tourism.services.place_query_planner import PlaceQueryPlanner
+
+CENTER = (-25.28, -57.63)
+CATEGORIES = ("Historia", "Naturaleza", "Arquitectura", "Museo")
+WORDS = ("ruinas", "cascada", "iglesia", "museo", "lago")
+
+
+@pytest.fixture
+def catalog(make_place):
+    places = []
+    for i in range(400):
+        places.append(make_place(
+            f"place-{i}",
+            lat=CENTER[0] + (i % 20 - 10) * 0.05,
+            lng=CENTER[1] + (i // 20 - 10) * 0.05,
+            # A single "Museo" place makes the category the most selective filter
+            category="Museo" if i == 137 else CATEGORIES[i % 3],
+            city="Luque" if i % 7 == 0 else "Asunción",
+            description=f"Visita a {WORDS[i % 5]} y {WORDS[(i * 3) % 5]}",
+        ))
+    return PlaceCatalog(places, version=1, signature=(0, 0))
+
+
+def _brute_force(catalog, category=None, city=None, text=None, center=None):
+    words = set(catalog.text_index.scores(text)) if text is not None else None
+    matches = []
+    for position, place in enumerate(catalog.places):
+        if category is not None and place.category != category:
+            continue
+        if city is not None and place.city != city:
+            continue
+        if words is not None and position not in words:
+            continue
+        distance = None
+        if center is not None:
+            distance = LocationService.calculate_distance_km(center[0], center[1], place.lat, place.lng)
+            if distance > center[2]:
+                continue
+        matches.append((place.id, distance))
+    return matches
+
+
+def test_category_radius_and_text_match_brute_force(catalog):
+    planner = PlaceQueryPlanner()
+    center = (*CENTER, 25.0)
+    matches, plan = planner.query(
+        catalog, category="naturaleza", text="cascada", latitude=center[0], longitude=center[1],
+        max_distance_km=center[2],
+    )
+
+    expected = sorted(_brute_force(catalog, "Naturaleza", text="cascada", center=center), key=lambda m: m[1])
+    assert expected
+    assert [place.id for place, _, _ in matches] == [place_id for place_id, _ in expected]
+    assert [distance for _, distance, _ in matches] == pytest.approx([distance for _, distance in expected])
+    assert all(score > 0 for _, _, score in matches)
+    assert plan[-1]["index"] == "distance"
+
+
+def test_filters_run_most_selective_first(catalog):
+    matches, plan = PlaceQueryPlanner().query(catalog, category="museo", city="Asunción", text="lago")
+    steps = [step["index"] for step in plan]
+    assert steps[0] == "category"
+    estimates = [step["estimated"] for step in plan]
+    assert estimates == sorted(estimates)
+    assert plan[0]["candidates"] == 1
+    assert [place.id for place, _, _ in matches] == [
+        place_id for place_id, _ in _brute_force(catalog, "Museo", city="Asunción", text="lago")
+    ]
+
+
+def test_small_radius_runs_first(catalog):
+    center = (*CENTER, 8.0)
+    matches, plan = PlaceQueryPlanner().query(
+        catalog, city="Asunción", text="ruinas", latitude=center[0], longitude=center[1], max_distance_km=center[2],
+    )
+    filters = [step for step in plan if step["index"] != "distance"]
+    assert [step["index"] for step in filters][0] == "radius"
+    assert [step["estimated"] for step in filters] == sorted(step["estimated"] for step in filters)
+    assert {step["index"] for step in filters} == {"radius", "city", "text"}
+    expected = _brute_force(catalog, city="Asunción", text="ruinas", center=center)
+    assert expected
+    assert sorted(place.id for place, _, _ in matches) == sorted(place_id for place_id, _ in expected)
+
+
+def test_text_only_is_sorted_by_relevance(catalog):
+    matches, _ = PlaceQueryPlanner().query(catalog, text="iglesia lago")
+    scores = [score for _, _, score in matches]
+    assert scores == sorted(scores, reverse=True)
+    assert len(matches) == len(_brute_force(catalog, text="iglesia lago"))
+
+
+def test_no_filter_returns_every_place_in_catalog_order(catalog):
+    matches, plan = PlaceQueryPlanner().query(catalog)
+    assert [place.id for place, _, _ in matches] == [place.id for place in catalog.places]
+    assert plan == []
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"latitude": -25.0, "longitude": -57.0},
+        {"latitude": -25.0, "longitude": -57.0, "max_distance_km": -1.0},
+        {"bbox": (-24.0, -26.0, -58.0, -57.0)},
+    ],
+)
+def test_invalid_geographic_filters_are_rejected(catalog, kwargs):
+    with pytest.raises(ValueError):
+        PlaceQueryPlanner().query(catalog, **kwargs)
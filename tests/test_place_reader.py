@@ -0,0 +1,129 @@
+"""Tests for the streaming place reader."""
+
+import json
+
+import pytest
+
+from paraguay_tourism.repositories.place_reader import PlaceStreamReader
+
+
+def _record(i: int, **fields) -> dict:
+    return {
+        "id": f"place-{i}",
+        "name": f"Lugar Nº {i} — Ñandutí",
+        "description": "Descripción con acentos: áéíóú \"comillas\" y \\barras\\",
+        "category": "Historia",
+        "lat": -25.123456789 - i / 1000,
+        "lng": -57.987654321 + i / 1000,
+        "city": "Asunción",
+        "region": "Capital",
+        **fields,
+    }
+
+
+def _read(path, **attributes):
+    reader = PlaceStreamReader(path)
+    for name, value in attributes.items():
+        setattr(reader, name, value)
+    return [place.model_dump() for place in reader], reader
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 4096])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_records_split_across_chunks(tmp_path, chunk_size, indent):
+    records = [_record(i) for i in range(25)]
+    path = tmp_path / "places.json"
+    path.write_text(json.dumps(records, indent=indent, ensure_ascii=False), encoding="utf-8")
+
+    places, reader = _read(path, CHUNK_SIZE=chunk_size)
+
+    assert reader.errors == []
+    assert [{key: place[key] for key in record} for place, record in zip(places, records)] == records
+    assert len(places) == len(records)
+
+
+@pytest.mark.parametrize("chunk_size", [5, 4096])
+def test_malformed_record_is_reported_and_skipped(tmp_path, chunk_size):
+    text = json.dumps([_record(0), _record(1), _record(2)], indent=2, ensure_ascii=False)
+    # Drop the second record's category value: `"category": ,` is a syntax error
+    broken_at = text.index('"id": "place-1"')
+    value = text.index('"Historia"', broken_at)
+    text = text[:value] + text[value + len('"Historia"'):]
+    start = text.rindex("{", 0, broken_at)
+    path = tmp_path / "places.json"
+    path.write_text(text, encoding="utf-8")
+
+    places, reader = _read(path, CHUNK_SIZE=chunk_size)
+
+    assert [place["id"] for place in places] == ["place-0", "place-2"]
+    assert reader.error_count == 1
+    error = reader.errors[0]
+    assert error.offset == start
+    assert error.line == text.count("\n", 0, start) + 1
+    assert error.message.startswith("invalid JSON")
+
+
+def test_invalid_place_is_reported_with_its_field(tmp_path):
+    path = tmp_path / "places.json"
+    path.write_text(json.dumps([_record(0, lat="north"), _record(1)], indent=2), encoding="utf-8")
+
+    places, reader = _read(path)
+
+    assert [place["id"] for place in places] == ["place-1"]
+    assert reader.errors[0].line == 2
+    assert "lat" in reader.errors[0].message
+
+
+def test_json_lines(tmp_path):
+    lines = [
+        json.dumps(_record(0), ensure_ascii=False),
+        "",
+        "{not json",
+        "[1, 2]",
+        json.dumps(_record(1), ensure_ascii=False),
+    ]
+    path = tmp_path / "places.jsonl"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    places, reader = _read(path)
+
+    assert [place["id"] for place in places] == ["place-0", "place-1"]
+    assert [(error.line, error.offset) for error in reader.errors] == [
+        (3, len(lines[0]) + 2),
+        (4, len(lines[0]) + len(lines[2]) + 3),
+    ]
+    assert reader.errors[0].message.startswith("invalid JSON")
+    assert reader.errors[1].message == "expected an object, got list"
+
+
+def test_json_lines_detected_without_suffix(tmp_path):
+    path = tmp_path / "places.json"
+    path.write_text("\n".join(json.dumps(_record(i)) for i in range(3)), encoding="utf-8")
+
+    places, reader = _read(path)
+
+    assert [place["id"] for place in places] == ["place-0", "place-1", "place-2"]
+    assert reader.errors == []
+
+
+@pytest.mark.parametrize("suffix, indent", [(".json", 2), (".jsonl", None)])
+def test_record_over_size_cap_is_skipped(tmp_path, suffix, indent):
+    records = [_record(0), _record(1, description="x" * 5000), _record(2)]
+    if suffix == ".json":
+        text = json.dumps(records, indent=indent)
+    else:
+        text = "\n".join(json.dumps(record) for record in records)
+    path = tmp_path / f"places{suffix}"
+    path.write_text(text, encoding="utf-8")
+
+    places, reader = _read(path, CHUNK_SIZE=256, MAX_RECORD_CHARS=1000)
+
+    assert [place["id"] for place in places] == ["place-0", "place-2"]
+    assert [error.message for error in reader.errors] == ["record too large"]
+
+
+def test_not_a_list_is_rejected(tmp_path):
+    path = tmp_path / "places.json"
+    path.write_text('"places"', encoding="utf-8")
+    with pytest.raises(ValueError):
+        list(PlaceStreamReader(path))
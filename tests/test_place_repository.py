@@ -0,0 +1,125 @@
+"""Tests for the place repository: hot reload and indexed lookups."""
+
+import json
+import os
+import unicodedata
+
+import pytest
+
+from paraguay_tourism.repositories import PlaceRepository
+
+
+def _write(path, places, mtime_ns=None):
+    path.write_text(json.dumps([place.model_dump(exclude={"dataset"}) for place in places]), encoding="utf-8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def data_path(tmp_path, make_place):
+    path = tmp_path / "places.json"
+    _write(path, [make_place("cabildo"), make_place("panteon")], mtime_ns=1_000_000_000_000)
+    return path
+
+
+def test_catalog_is_reused_while_the_file_is_unchanged(data_path):
+    repository = PlaceRepository(data_path)
+    catalog = repository.get_catalog()
+
+    assert repository.get_catalog() is catalog
+    assert [place.id for place in repository.get_all()] == ["cabildo", "panteon"]
+    assert repository.get_catalog() is catalog
+
+
+def test_catalog_reloads_when_the_mtime_changes(data_path, make_place):
+    repository = PlaceRepository(data_path)
+    catalog = repository.get_catalog()
+
+    # Same size, different content: only the mtime tells them apart
+    _write(data_path, [make_place("cabildx"), make_place("panteon")], mtime_ns=2_000_000_000_000)
+
+    reloaded = repository.get_catalog()
+    assert reloaded is not catalog
+    assert reloaded.version > catalog.version
+    assert reloaded.signature == (2_000_000_000_000, data_path.stat().st_size)
+    assert repository.get_by_id("cabildx") is not None
+    assert repository.get_by_id("cabildo") is None
+
+
+def test_catalog_reloads_when_only_the_size_changes(data_path, make_place):
+    repository = PlaceRepository(data_path)
+    catalog = repository.get_catalog()
+
+    # Coarse filesystem timestamps can leave the mtime unchanged after a quick edit
+    _write(data_path, [make_place("cabildo"), make_place("panteon"), make_place("ycua")], mtime_ns=1_000_000_000_000)
+
+    reloaded = repository.get_catalog()
+    assert reloaded is not catalog
+    assert [place.id for place in repository.get_all()] == ["cabildo", "panteon", "ycua"]
+
+
+def test_explicit_reload_builds_a_new_version(data_path):
+    repository = PlaceRepository(data_path)
+    catalog = repository.get_catalog()
+
+    reloaded = repository.reload()
+
+    assert reloaded is not catalog and reloaded.version > catalog.version
+    assert repository.get_catalog() is reloaded
+
+
+def test_missing_data_file_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        PlaceRepository(tmp_path / "missing.json").get_catalog()
+
+
+@pytest.fixture
+def indexed_repository(tmp_path, make_place):
+    path = tmp_path / "indexed.json"
+    _write(path, [
+        make_place("cabildo", name="Cabildo", city="Asunción", region="Capital", category="Historia"),
+        make_place("lago", name="Lago Ypacaraí", city="San Bernardino", region="Cordillera", category="Naturaleza"),
+        make_place("cabildo", name="Cabildo (copia)", city="Luque", region="Central", category="Historia"),
+        make_place("panteon", name="Panteón", city="ASUNCION", region="capital", category="historia"),
+    ])
+    return PlaceRepository(path)
+
+
+def test_get_by_id_with_duplicate_ids_returns_the_first_occurrence(indexed_repository):
+    place = indexed_repository.get_by_id("cabildo")
+
+    assert place.name == "Cabildo"
+    assert place == next(p for p in indexed_repository.get_all() if p.id == "cabildo")
+    assert indexed_repository.get_by_id("missing") is None
+    # IDs are matched exactly
+    assert indexed_repository.get_by_id("CABILDO") is None
+
+
+@pytest.mark.parametrize(
+    "method, value, expected",
+    [
+        ("get_by_city", "asuncion", ["cabildo", "panteon"]),
+        ("get_by_city", "Asunción", ["cabildo", "panteon"]),
+        ("get_by_city", "  luque ", ["cabildo"]),
+        ("get_by_region", "CAPITAL", ["cabildo", "panteon"]),
+        ("get_by_category", "Historia", ["cabildo", "cabildo", "panteon"]),
+        ("get_by_category", "naturaleza", ["lago"]),
+        ("get_by_city", "Encarnación", []),
+    ],
+)
+def test_group_lookups_match_a_normalized_scan(indexed_repository, method, value, expected):
+    places = getattr(indexed_repository, method)(value)
+
+    assert [place.id for place in places] == expected
+    column = method.removeprefix("get_by_")
+    scanned = [
+        place for place in indexed_repository.get_all()
+        if _fold(getattr(place, column)) == _fold(value)
+    ]
+    assert places == scanned
+
+
+def _fold(text):
+    """Accent- and case-insensitive key, written independently of the catalog's normalizer."""
+    decomposed = unicodedata.normalize("NFKD", text.strip().casefold())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
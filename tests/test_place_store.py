@@ -0,0 +1,40 @@
+"""Tests for the columnar place store and its row views."""
+
+from pathlib import Path
+
+import pytest
+
+from paraguay_tourism.models import Place
+from paraguay_tourism.repositories import PlaceStore
+from paraguay_tourism.repositories.place_reader import PlaceStreamReader
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+
+@pytest.mark.parametrize("data_file, dataset", [("places.json", None), ("places_germany.json", "de")])
+def test_rows_rebuild_the_models_loaded_from_the_data_file(data_file, dataset):
+    source = list(PlaceStreamReader(DATA_DIR / data_file))
+    assert source
+
+    store = PlaceStore(source, dataset=dataset)
+    rows = store.rows()
+
+    assert len(store) == len(rows) == len(source)
+    for row, place in zip(rows, source):
+        expected = place.model_copy(update={"dataset": dataset})
+        model = row.to_model()
+        assert isinstance(model, Place)
+        assert model == expected
+        assert model.model_dump() == row.model_dump() == expected.model_dump()
+        # The row's values pass validation unchanged
+        assert Place(**row.model_dump()) == model
+
+
+def test_interned_columns_share_one_string_per_value(make_place):
+    places = [make_place(f"place-{i}", city=("Asunción", "Luque")[i % 2]) for i in range(10)]
+
+    store = PlaceStore(places)
+
+    assert [row.city for row in store.rows()] == [place.city for place in places]
+    assert sorted(set(store.strings)) == sorted({"Asunción", "Luque", "Historia", "Capital"})
+    assert list(store.coordinates()) == [(place.lat, place.lng) for place in places]
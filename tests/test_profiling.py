@@ -0,0 +1,89 @@
+"""Tests for opt-in tool call profiling."""
+
+import asyncio
+
+import pytest
+from fastmcp import Client
+
+from paraguay_tourism import server as server_module
+from paraguay_tourism.core import DependencyContainer
+from paraguay_tourism.handlers.profiling_handlers import ProfilingMiddleware
+
+TOOL = "get_tourist_place_by_id"
+ARGUMENTS = {"place_id": "palacio-lopez"}
+
+
+@pytest.fixture
+def create_app(monkeypatch):
+    """Build the app with a fresh container reading the given profiling settings."""
+
+    def create(**environment):
+        for name, value in environment.items():
+            monkeypatch.setenv(f"PARAGUAY_TOURISM_{name.upper()}", value)
+        container = DependencyContainer()
+        monkeypatch.setattr(server_module, "get_container", lambda: container)
+        return server_module.create_app()
+
+    return create
+
+
+def _call(app, *calls):
+    """Structured results of (tool, arguments) calls made in one client session."""
+
+    async def run():
+        async with Client(app) as client:
+            return [(await client.call_tool(tool, arguments)).structured_content for tool, arguments in calls]
+
+    return asyncio.run(run())
+
+
+def _profiling_middleware(app):
+    return [middleware for middleware in app.middleware if isinstance(middleware, ProfilingMiddleware)]
+
+
+def test_profiling_off_installs_no_middleware(create_app, monkeypatch):
+    monkeypatch.delenv("PARAGUAY_TOURISM_PROFILE", raising=False)
+    app = create_app()
+
+    assert _profiling_middleware(app) == []
+    (result,) = _call(app, (TOOL, ARGUMENTS))
+    assert result["found"] is True and "_profile" not in result
+
+
+def test_requested_profile_strips_the_argument_and_attaches_the_report(create_app):
+    app = create_app(profile="request")
+    assert len(_profiling_middleware(app)) == 1
+
+    plain, profiled = _call(app, (TOOL, ARGUMENTS), (TOOL, {**ARGUMENTS, "_profile": True}))
+
+    report = profiled.pop("_profile")
+    # The tool never saw `_profile`, so it answered exactly as for the plain call
+    assert profiled == plain
+    assert "_profile" not in plain
+    assert report["tool"] == TOOL
+    assert report["error"] is None
+    assert report["wall_ms"] >= 0.0
+    assert report["top"] and {"function", "calls", "self_ms", "cumulative_ms"} <= set(report["top"][0])
+    assert "file" not in report
+
+
+def test_profile_false_is_not_profiled(create_app):
+    app = create_app(profile="request")
+
+    (result,) = _call(app, (TOOL, {**ARGUMENTS, "_profile": False}))
+
+    assert result["found"] is True and "_profile" not in result
+
+
+def test_selected_tools_write_reports_to_the_directory(create_app, tmp_path):
+    app = create_app(profile=f"{TOOL}, list_all_tourist_places", profile_dir=str(tmp_path))
+
+    selected, other = _call(app, (TOOL, ARGUMENTS), ("get_server_metrics", {}))
+
+    # With an output directory, unrequested reports are only written there
+    assert "_profile" not in selected and "_profile" not in other
+    # One JSON report and its pstats dump, for the selected tool only
+    reports = sorted(path.name for path in tmp_path.iterdir())
+    assert len(reports) == 2
+    assert all(TOOL in name for name in reports)
+    assert any(name.endswith(".json") for name in reports)
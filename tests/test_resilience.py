@@ -0,0 +1,109 @@
+"""Tests for upstream rate limiting and circuit breaking."""
+
+import asyncio
+import time
+
+import pytest
+
+from paraguay_tourism.services import GeolocationService
+from paraguay_tourism.services.resilience import (
+    CircuitBreaker,
+    ProviderGuard,
+    TokenBucket,
+    UpstreamUnavailableError,
+)
+
+COOLDOWN = 0.05
+
+
+def _open_breaker() -> CircuitBreaker:
+    breaker = CircuitBreaker(failure_threshold=1, cooldown_seconds=COOLDOWN)
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+    time.sleep(COOLDOWN * 1.5)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    return breaker
+
+
+class _Response:
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {"status": "success"}
+
+
+class _Client:
+    """Async client whose requests hang until `hang` is cleared."""
+
+    def __init__(self):
+        self.hang = True
+
+    async def get(self, url, **kwargs):
+        while self.hang:
+            await asyncio.sleep(3600)
+        return _Response()
+
+
+def test_token_bucket_waits_for_refill_and_rejects_long_waits():
+    bucket = TokenBucket(rate_per_second=10.0, capacity=2)
+    assert bucket.reserve(max_wait=0) == 0.0
+    assert bucket.reserve(max_wait=0) == 0.0
+
+    # Rejected reservations consume nothing
+    assert bucket.reserve(max_wait=0.01) is None
+    wait = bucket.reserve(max_wait=1.0)
+    assert wait == pytest.approx(0.1, abs=0.02)
+
+    # The next caller queues behind the previous reservation
+    assert bucket.reserve(max_wait=1.0) == pytest.approx(0.2, abs=0.02)
+
+
+def test_guard_rejects_when_rate_limited():
+    guard = ProviderGuard("test", TokenBucket(1.0, capacity=1), CircuitBreaker(), max_wait_seconds=0.1)
+    guard.acquire()
+    with pytest.raises(UpstreamUnavailableError):
+        guard.acquire()
+    assert guard.stats()["rate_limited"] == 1
+    assert guard.stats()["allowed"] == 1
+
+
+def test_trial_cancelled_while_waiting_for_token_frees_the_circuit():
+    bucket = TokenBucket(1.0, capacity=1)
+    bucket.reserve(max_wait=0)  # empties the bucket: the trial below has to wait
+    breaker = _open_breaker()
+    guard = ProviderGuard("test", bucket, breaker, max_wait_seconds=2.0)
+
+    async def scenario():
+        trial = asyncio.create_task(guard.aacquire())
+        await asyncio.sleep(0)
+        trial.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await trial
+
+    asyncio.run(scenario())
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow()
+
+
+def test_trial_cancelled_mid_request_frees_the_circuit_and_recovers():
+    breaker = _open_breaker()
+    guard = ProviderGuard("ip-api", TokenBucket(0), breaker)
+    client = _Client()
+    service = GeolocationService(async_http_client=client, ip_guard=guard)
+
+    async def scenario():
+        trial = asyncio.create_task(service._afetch_json(GeolocationService.IP_API_URL, guard))
+        await asyncio.sleep(0.01)
+        trial.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await trial
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+
+        # A new trial goes through and closes the circuit
+        client.hang = False
+        return await service._afetch_json(GeolocationService.IP_API_URL, guard)
+
+    assert asyncio.run(scenario()) == {"status": "success"}
+    assert breaker.state == CircuitBreaker.CLOSED
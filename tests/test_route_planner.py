@@ -0,0 +1,138 @@
+"""Tests for route planning."""
+
+import itertools
+import random
+
+import pytest
+
+from paraguay_tourism.services import LocationService, RoutePlanner
+
+START = (-25.28, -57.63)
+
+
+@pytest.fixture
+def places(make_place):
+    def make(count, seed):
+        rng = random.Random(seed)
+        return [
+            make_place(f"stop-{i}", lat=-27.0 + rng.random() * 4, lng=-58.5 + rng.random() * 4)
+            for i in range(count)
+        ]
+
+    return make
+
+
+def _distance(a, b):
+    return LocationService.calculate_distance_km(a[0], a[1], b[0], b[1])
+
+
+def _length(order, start, return_to_start):
+    points = [(place.lat, place.lng) for place in order]
+    legs = list(zip(points, points[1:]))
+    if start is not None:
+        legs.insert(0, (start, points[0]))
+        if return_to_start:
+            legs.append((points[-1], start))
+    elif return_to_start and len(points) > 1:
+        legs.append((points[-1], points[0]))
+    return sum(_distance(a, b) for a, b in legs)
+
+
+def _optimum(stops, start, return_to_start):
+    return min(_length(order, start, return_to_start) for order in itertools.permutations(stops))
+
+
+@pytest.mark.parametrize("start", [None, START])
+@pytest.mark.parametrize("return_to_start", [False, True])
+def test_route_is_close_to_brute_force_optimum(places, start, return_to_start):
+    planner = RoutePlanner(time_budget_seconds=1.0)
+    gaps = []
+    for seed in range(10):
+        stops = places(7, seed)
+        route = planner.plan(stops, start=start, return_to_start=return_to_start)
+
+        assert route.complete
+        assert sorted(place.id for place in route.stops) == sorted(place.id for place in stops)
+        assert route.total_km == pytest.approx(_length(route.stops, start, return_to_start))
+        assert route.total_km <= route.initial_km + 1e-9
+        optimum = _optimum(stops, start, return_to_start)
+        assert route.total_km >= optimum - 1e-9
+        gaps.append(route.total_km / optimum - 1)
+
+    # 2-opt is a heuristic: usually optimal on so few stops, never far off
+    assert sum(gaps) / len(gaps) < 0.02
+    assert max(gaps) < 0.10
+    assert sum(gap < 1e-9 for gap in gaps) >= 5
+
+
+@pytest.mark.parametrize(
+    "start, return_to_start, closing",
+    [(START, False, None), (START, True, "start"), (None, True, "first"), (None, False, None)],
+)
+def test_legs_connect_the_stops(places, start, return_to_start, closing):
+    route = RoutePlanner().plan(places(6, 42), start=start, return_to_start=return_to_start)
+    stops = route.stops
+    expected = []
+    if start is not None:
+        expected.append((None, stops[0]))
+    expected.extend(zip(stops, stops[1:]))
+    if closing == "start":
+        expected.append((stops[-1], None))
+    elif closing == "first":
+        expected.append((stops[-1], stops[0]))
+
+    assert [(a, b) for a, b, _ in route.legs] == expected
+    for a, b, distance in route.legs:
+        a_point = start if a is None else (a.lat, a.lng)
+        b_point = start if b is None else (b.lat, b.lng)
+        assert distance == pytest.approx(_distance(a_point, b_point))
+    assert route.total_km == pytest.approx(sum(distance for _, _, distance in route.legs))
+
+
+def test_single_stop(make_place):
+    stop = make_place("only", lat=-25.5, lng=-57.0)
+    planner = RoutePlanner()
+
+    route = planner.plan([stop, stop])
+    assert route.stops == [stop]
+    assert route.legs == []
+    assert route.total_km == 0.0
+
+    round_trip = planner.plan([stop], start=START, return_to_start=True)
+    assert [(a, b) for a, b, _ in round_trip.legs] == [(None, stop), (stop, None)]
+    assert round_trip.total_km == pytest.approx(2 * _distance(START, (stop.lat, stop.lng)))
+
+    assert planner.plan([stop], return_to_start=True).total_km == 0.0
+
+
+def test_result_does_not_depend_on_input_order(places):
+    stops = places(12, 7)
+    planner = RoutePlanner()
+    first = planner.plan(stops, start=START)
+    second = planner.plan(list(reversed(stops)), start=START)
+    assert [place.id for place in first.stops] == [place.id for place in second.stops]
+
+
+def test_distance_matrix_is_cached_per_version(places):
+    stops = places(10, 3)
+    planner = RoutePlanner()
+    planner.plan(stops, version=1)
+    planner.plan(list(reversed(stops)), start=START, version=1)
+    assert planner.stats()["matrix_hits"] == 1
+    planner.plan(stops, version=2)
+    assert planner.stats() == {"matrix_hits": 1, "matrix_misses": 2, "cached_matrices": 1, "version": 2}
+
+
+def test_exhausted_time_budget_is_reported(places):
+    route = RoutePlanner(time_budget_seconds=0).plan(places(30, 5))
+    assert not route.complete
+    assert len(route.stops) == 30
+
+
+def test_rejects_empty_and_oversized_routes(places):
+    planner = RoutePlanner()
+    with pytest.raises(ValueError, match="al menos un lugar"):
+        planner.plan([])
+    with pytest.raises(ValueError, match="como máximo"):
+        planner.plan(places(RoutePlanner.MAX_STOPS + 1, 1))
+    assert len(planner.plan(places(RoutePlanner.MAX_STOPS, 1)).stops) == RoutePlanner.MAX_STOPS
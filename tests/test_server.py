@@ -0,0 +1,55 @@
+"""Tests for the server application lifecycle."""
+
+import asyncio
+
+import pytest
+from fastmcp import Client
+
+from paraguay_tourism import server as server_module
+from paraguay_tourism.core import DependencyContainer
+from paraguay_tourism.core.http_clients import HTTPX_AVAILABLE
+
+
+@pytest.fixture
+def container(tmp_path, monkeypatch):
+    """A fresh container (with a SQLite geolocation cache) used by `create_app`."""
+    monkeypatch.setenv("PARAGUAY_TOURISM_GEO_CACHE_PATH", str(tmp_path / "geo.sqlite"))
+    container = DependencyContainer()
+    monkeypatch.setattr(server_module, "get_container", lambda: container)
+    return container
+
+
+async def _session(app):
+    async with Client(app) as client:
+        return [tool.name for tool in await client.list_tools()]
+
+
+@pytest.mark.skipif(not HTTPX_AVAILABLE, reason="httpx not installed")
+def test_shutdown_closes_pooled_http_clients(container):
+    app = server_module.create_app()
+    http_client = container.http_client
+    async_http_client = container.async_http_client
+
+    assert "get_tourist_place_by_id" in asyncio.run(_session(app))
+
+    assert http_client.is_closed and async_http_client.is_closed
+    # The next session gets new clients
+    assert container.http_client is not http_client
+    assert not container.http_client.is_closed
+    assert container.geolocation_service._client() is container.http_client
+    container.close()
+
+
+def test_shutdown_closes_the_cache_database_and_it_reopens_on_use(container):
+    app = server_module.create_app()
+    cache = container.geolocation_cache
+    cache.set("ip:1.2.3.4", {"success": True, "city": "Asunción"})
+
+    asyncio.run(_session(app))
+
+    assert cache._db is None
+    assert cache.get("ip:1.2.3.4") == {"success": True, "city": "Asunción"}
+    cache._entries.clear()
+    assert cache.get("ip:1.2.3.4") == {"success": True, "city": "Asunción"}
+    assert cache._db is not None
+    container.close()
@@ -0,0 +1,149 @@
+"""Tests for request coalescing."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from paraguay_tourism.services.single_flight import SingleFlight
+
+
+class _Work:
+    """Coroutine function that blocks until released and counts its executions."""
+
+    def __init__(self, error: Exception | None = None):
+        self.release = asyncio.Event()
+        self.executions = 0
+        self.error = error
+
+    async def __call__(self):
+        self.executions += 1
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return {"executions": self.executions}
+
+
+async def _start(flight, key, work, count):
+    tasks = [asyncio.create_task(flight.ado(key, work)) for _ in range(count)]
+    await asyncio.sleep(0)
+    return tasks
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+
+    async def scenario():
+        work, other = _Work(), _Work()
+        tasks = await _start(flight, "k", work, 5)
+        tasks += await _start(flight, "other", other, 1)
+        work.release.set()
+        other.release.set()
+        results = await asyncio.gather(*tasks)
+        return work, results[:5]
+
+    work, results = asyncio.run(scenario())
+    assert work.executions == 1
+    assert all(result is results[0] for result in results)
+    assert flight.stats() == {"calls": 6, "executions": 2, "coalesced": 4}
+
+
+def test_later_calls_start_a_new_execution():
+    flight = SingleFlight()
+
+    async def scenario():
+        work = _Work()
+        work.release.set()
+        await flight.ado("k", work)
+        await flight.ado("k", work)
+        return work
+
+    assert asyncio.run(scenario()).executions == 2
+    assert flight.stats()["coalesced"] == 0
+
+
+def test_errors_fan_out_to_every_caller():
+    flight = SingleFlight()
+
+    async def scenario():
+        work = _Work(error=RuntimeError("upstream down"))
+        tasks = await _start(flight, "k", work, 3)
+        work.release.set()
+        return work, await asyncio.gather(*tasks, return_exceptions=True)
+
+    work, results = asyncio.run(scenario())
+    assert work.executions == 1
+    assert [type(result) for result in results] == [RuntimeError] * 3
+    assert results[0] is results[1] is results[2]
+
+
+def test_cancelled_leader_does_not_abort_followers():
+    flight = SingleFlight()
+
+    async def scenario():
+        work = _Work()
+        leader, *followers = await _start(flight, "k", work, 3)
+        leader.cancel()
+        await asyncio.sleep(0)
+        work.release.set()
+        results = await asyncio.gather(*followers)
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return work, results
+
+    work, results = asyncio.run(scenario())
+    assert work.executions == 1
+    assert results == [{"executions": 1}] * 2
+
+
+def test_call_is_cancelled_once_every_caller_is_gone():
+    flight = SingleFlight()
+
+    async def scenario():
+        work = _Work()
+        tasks = await _start(flight, "k", work, 2)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        # The abandoned execution was cancelled and the key released
+        fresh = _Work()
+        fresh.release.set()
+        return work, await flight.ado("k", fresh)
+
+    work, result = asyncio.run(scenario())
+    assert work.executions == 1
+    assert not work.release.is_set()
+    assert result == {"executions": 1}
+    assert flight.stats()["executions"] == 2
+
+
+def test_threads_share_one_execution():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    executions = []
+
+    def work():
+        executions.append(1)
+        started.set()
+        release.wait()
+        return len(executions)
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(flight.do("k", work)))
+    leader.start()
+    started.wait()
+    followers = [threading.Thread(target=lambda: results.append(flight.do("k", work))) for _ in range(3)]
+    for thread in followers:
+        thread.start()
+    while flight.stats()["coalesced"] < 3:
+        time.sleep(0.001)
+    release.set()
+    for thread in (leader, *followers):
+        thread.join()
+
+    assert results == [1, 1, 1, 1]
+    assert flight.stats() == {"calls": 4, "executions": 1, "coalesced": 3}
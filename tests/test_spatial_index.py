@@ -0,0 +1,76 @@
+"""Tests for the grid spatial index."""
+
+import random
+
+import pytest
+
+from paraguay_tourism.repositories import SpatialIndex
+
+
+@pytest.fixture(scope="module")
+def points():
+    rng = random.Random(3)
+    points = [(rng.uniform(-90, 90), rng.uniform(-180, 180)) for _ in range(1500)]
+    # Clusters on both sides of the antimeridian, plus points exactly on it and on cell edges
+    points += [(rng.uniform(-20, -15), rng.uniform(178, 180)) for _ in range(100)]
+    points += [(rng.uniform(-20, -15), rng.uniform(-180, -178)) for _ in range(100)]
+    points += [(-17.0, 180.0), (-17.0, -180.0), (0.0, 0.0), (0.5, 0.5), (-0.5, -0.5), (90.0, 10.0), (-90.0, -10.0)]
+    return points
+
+
+def _scan(points, min_lat, max_lat, min_lng, max_lng):
+    def inside_lng(lng):
+        if min_lng <= max_lng:
+            return min_lng <= lng <= max_lng
+        return lng >= min_lng or lng <= max_lng
+
+    return [
+        position for position, (lat, lng) in enumerate(points)
+        if min_lat <= lat <= max_lat and inside_lng(lng)
+    ]
+
+
+def _random_boxes(seed, count):
+    rng = random.Random(seed)
+    boxes = []
+    for _ in range(count):
+        lat_a, lat_b = sorted(rng.uniform(-90, 90) for _ in range(2))
+        boxes.append((lat_a, lat_b, rng.uniform(-180, 180), rng.uniform(-180, 180)))
+    return boxes
+
+
+BOXES = [
+    (-20.0, -15.0, 179.0, -179.0),  # across the antimeridian
+    (-20.0, -15.0, 180.0, -180.0),  # only the antimeridian itself
+    (-20.0, -15.0, -180.0, 180.0),  # whole longitude range
+    (-90.0, 90.0, -180.0, 180.0),  # the whole globe
+    (0.0, 0.5, 0.0, 0.5),  # edges on cell boundaries
+    (-1.0, 1.0, 0.5, 0.5),  # zero-width box
+    (10.0, 5.0, 0.0, 10.0),  # empty: min_lat > max_lat
+    (80.0, 90.0, 170.0, -170.0),  # touching the pole and crossing the antimeridian
+]
+
+
+@pytest.mark.parametrize("cell_size_deg", [0.1, 0.5, 7.0, 45.0])
+@pytest.mark.parametrize("box", BOXES + _random_boxes(11, 40))
+def test_query_bbox_matches_a_full_scan(points, cell_size_deg, box):
+    index = SpatialIndex(points, cell_size_deg=cell_size_deg)
+
+    found = index.query_bbox(*box)
+
+    assert found == _scan(points, *box)
+    assert index.estimate_bbox(*box) >= len(found)
+
+
+def test_points_exactly_on_the_antimeridian_are_reported_once():
+    index = SpatialIndex([(-17.0, 180.0), (-17.0, -180.0), (-17.0, 179.5)], cell_size_deg=1.0)
+
+    assert index.query_bbox(-18.0, -16.0, 179.0, -179.0) == [0, 1, 2]
+    assert index.query_bbox(-18.0, -16.0, 180.0, -180.0) == [0, 1]
+
+
+def test_non_finite_coordinates_are_never_returned():
+    index = SpatialIndex([(float("nan"), 0.0), (0.0, float("inf")), (0.0, 0.0)], cell_size_deg=1.0)
+
+    assert len(index) == 3
+    assert index.query_bbox(-90.0, 90.0, -180.0, 180.0) == [2]
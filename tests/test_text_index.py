@@ -0,0 +1,45 @@
+"""Tests for the full-text index."""
+
+import pytest
+
+from paraguay_tourism.models import Place
+from paraguay_tourism.repositories import TextIndex
+from paraguay_tourism.utils import normalize_key
+
+
+def _place(place_id, name, city, description=""):
+    return Place(
+        id=place_id, name=name, description=description, category="Historia",
+        lat=50.11, lng=8.68, city=city, region="Hesse",
+    )
+
+
+@pytest.fixture(scope="module")
+def index():
+    return TextIndex([
+        _place("romer", "Römer", "Frankfurt am Main"),
+        _place("marienplatz", "Marienplatz", "München"),
+        _place("strasse", "Schloßstraße", "Kassel"),
+        _place("dom", "Kaiserdom", "Speyer"),
+    ])
+
+
+@pytest.mark.parametrize(
+    "query, place",
+    [("Roemer", 0), ("Römer", 0), ("romer", 0), ("Muenchen", 1), ("Munchen", 1), ("schlossstrasse", 2)],
+)
+def test_umlauts_match_both_ascii_spellings(index, query, place):
+    matches, total = index.search(query, 5)
+    assert total == 1
+    assert matches[0][0] == place
+
+
+def test_transliterated_variants_do_not_change_scores_of_plain_words():
+    places = [_place("dom", "Kaiserdom", "Speyer"), _place("romer", "Römer Dom", "Frankfurt am Main")]
+    with_umlaut = TextIndex(places).scores("dom")
+    without_umlaut = TextIndex([places[0], _place("romer", "Romer Dom", "Frankfurt am Main")]).scores("dom")
+    assert with_umlaut == pytest.approx(without_umlaut)
+
+
+def test_normalize_key_still_strips_umlauts():
+    assert normalize_key("Römer") == "romer"